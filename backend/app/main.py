@@ -1,21 +1,30 @@
 from __future__ import annotations
 
 import csv
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 import hashlib
 import io
 import itertools
 import json
+import multiprocessing
+import os
+import pickle
 import re
+import tempfile
+import threading
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Optional
 
-from fastapi import Depends, FastAPI, File, HTTPException, Query, UploadFile
+from fastapi import BackgroundTasks, Depends, FastAPI, File, HTTPException, Query, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from itsdangerous import BadSignature, URLSafeSerializer
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, create_engine, select, text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, bindparam, create_engine, delete, event, func, or_, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
@@ -29,6 +38,9 @@ ALL_PLAN_PERIODS = tuple(range(0, 21))
 ACADEMIC_PERIODS = (1, 2, 6, 7, 11, 12, 16, 17)
 SUMMER_PERIODS = tuple(p for p in ALL_PLAN_PERIODS if p not in ACADEMIC_PERIODS)
 MAX_PLAN_PERIOD = max(ALL_PLAN_PERIODS)
+FEASIBILITY_WORKERS = int(os.environ.get("CMT_FEASIBILITY_WORKERS", "0") or 0)
+REPORT_CACHE_MAX_ENTRIES = int(os.environ.get("CMT_REPORT_CACHE_ENTRIES", "64") or 0)
+REPORT_CACHE_MAX_BYTES = int(os.environ.get("CMT_REPORT_CACHE_BYTES", str(64 * 1024 * 1024)) or 0)
 
 
 class Base(DeclarativeBase):
@@ -95,7 +107,7 @@ class Requirement(Base):
     __tablename__ = "requirements"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
-    parent_requirement_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("requirements.id"), nullable=True)
+    parent_requirement_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("requirements.id"), nullable=True, active_history=True)
     program_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("academic_programs.id"), nullable=True)
     name: Mapped[str] = mapped_column(String)
     logic_type: Mapped[str] = mapped_column(String, default="ALL_REQUIRED")
@@ -202,7 +214,7 @@ class CadetRecord(Base):
 class RequirementFulfillment(Base):
     __tablename__ = "requirement_fulfillment"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    requirement_id: Mapped[str] = mapped_column(String, ForeignKey("requirements.id"), index=True)
+    requirement_id: Mapped[str] = mapped_column(String, ForeignKey("requirements.id"), index=True, active_history=True)
     course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     is_primary: Mapped[bool] = mapped_column(Boolean, default=False)
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
@@ -230,6 +242,7 @@ class CourseEquivalency(Base):
 class CoursePrerequisite(Base):
     __tablename__ = "course_prerequisites"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    version_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True, nullable=True)
     course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     required_course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     relationship_type: Mapped[str] = mapped_column(String, default="PREREQUISITE")
@@ -242,6 +255,7 @@ class CoursePrerequisite(Base):
 class CourseSubstitution(Base):
     __tablename__ = "course_substitutions"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    version_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True, nullable=True)
     original_course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     substitute_course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     is_bidirectional: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -261,6 +275,7 @@ class RequirementSubstitution(Base):
 class CourseBucketTag(Base):
     __tablename__ = "course_bucket_tags"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    version_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True, nullable=True)
     course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     bucket_code: Mapped[str] = mapped_column(String, index=True)
     credit_hours_override: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -279,7 +294,7 @@ class CourseBasket(Base):
 class CourseBasketItem(Base):
     __tablename__ = "course_basket_items"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    basket_id: Mapped[str] = mapped_column(String, ForeignKey("course_baskets.id"), index=True)
+    basket_id: Mapped[str] = mapped_column(String, ForeignKey("course_baskets.id"), index=True, active_history=True)
     course_id: Mapped[str] = mapped_column(String, ForeignKey("courses.id"), index=True)
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
 
@@ -296,7 +311,7 @@ class CourseBasketSubstitution(Base):
 class RequirementBasketLink(Base):
     __tablename__ = "requirement_basket_links"
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    requirement_id: Mapped[str] = mapped_column(String, ForeignKey("requirements.id"), index=True)
+    requirement_id: Mapped[str] = mapped_column(String, ForeignKey("requirements.id"), index=True, active_history=True)
     basket_id: Mapped[str] = mapped_column(String, ForeignKey("course_baskets.id"), index=True)
     min_count: Mapped[int] = mapped_column(Integer, default=1)
     max_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -312,6 +327,7 @@ class ValidationRule(Base):
     severity: Mapped[str] = mapped_column(String, default="FAIL")
     active: Mapped[bool] = mapped_column(Boolean, default=True)
     config_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class DesignComment(Base):
@@ -363,6 +379,95 @@ class CoiImportItem(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
+class FeasibilityComboResult(Base):
+    __tablename__ = "feasibility_combo_results"
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    combo_key: Mapped[str] = mapped_column(String, index=True)
+    kind: Mapped[str] = mapped_column(String)
+    engine_revision: Mapped[int] = mapped_column(Integer, default=0)
+    dirty: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    result_json: Mapped[str] = mapped_column(Text)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class FeasibilityComboDependency(Base):
+    __tablename__ = "feasibility_combo_dependencies"
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    result_id: Mapped[str] = mapped_column(String, ForeignKey("feasibility_combo_results.id"), index=True)
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    dependency_type: Mapped[str] = mapped_column(String)
+    dependency_id: Mapped[str] = mapped_column(String, index=True)
+
+
+class FeasibilityVersionState(Base):
+    __tablename__ = "feasibility_version_state"
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), primary_key=True)
+    epoch: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class VersionGeneration(Base):
+    __tablename__ = "version_generations"
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class VersionChange(Base):
+    __tablename__ = "version_changes"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    generation: Mapped[int] = mapped_column(Integer, index=True)
+    entity_type: Mapped[str] = mapped_column(String)
+    entity_id: Mapped[str] = mapped_column(String)
+    op: Mapped[str] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ValidationRun(Base):
+    __tablename__ = "validation_runs"
+    __table_args__ = (UniqueConstraint("version_id", "generation", name="uq_validation_runs_version_generation"),)
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    generation: Mapped[int] = mapped_column(Integer, index=True)
+    status: Mapped[str] = mapped_column(String)
+    finding_count: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ValidationFinding(Base):
+    __tablename__ = "validation_findings"
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    run_id: Mapped[str] = mapped_column(String, ForeignKey("validation_runs.id"), index=True)
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    fingerprint: Mapped[str] = mapped_column(String, index=True)
+    severity: Mapped[str] = mapped_column(String)
+    tier: Mapped[int] = mapped_column(Integer, default=1)
+    rule_code: Mapped[str] = mapped_column(String, default="")
+    rule: Mapped[str] = mapped_column(String)
+    message: Mapped[str] = mapped_column(Text)
+    entity_ids_json: Mapped[str] = mapped_column(Text, default="[]")
+    first_seen_run_id: Mapped[str] = mapped_column(String)
+    first_seen_generation: Mapped[int] = mapped_column(Integer)
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class RequirementClosure(Base):
+    __tablename__ = "requirement_closure"
+    ancestor_id: Mapped[str] = mapped_column(String, primary_key=True)
+    descendant_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+    depth: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class RequirementEffectiveCourse(Base):
+    __tablename__ = "requirement_effective_courses"
+    requirement_id: Mapped[str] = mapped_column(String, primary_key=True)
+    course_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    version_id: Mapped[str] = mapped_column(String, ForeignKey("curriculum_versions.id"), index=True)
+
+
 engine = create_engine(DATABASE_URL, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 app = FastAPI(title="USAFA CMT - Phases 1 and 2")
@@ -1679,6 +1784,63 @@ def prerequisite_constraint_groups(prereqs: list[CoursePrerequisite]) -> list[di
     return list(grouped.values())
 
 
+def dedupe_issues(issues: list[dict]) -> list[dict]:
+    seen = set()
+    out = []
+    for issue in issues:
+        if issue["message"] in seen:
+            continue
+        seen.add(issue["message"])
+        out.append(issue)
+    return out
+
+
+def propagate_prerequisite_windows(
+    windows: dict[str, tuple[int, int]],
+    groups: list[tuple[str, int, int, list[str]]],
+) -> dict[str, list[int]]:
+    # groups are (course_id, required_count, gap, required_course_ids) with gap 1 for prerequisites and
+    # 0 for corequisites. A forward pass in topological order raises each course's earliest period to
+    # the required_count-th earliest prerequisite finish; a backward pass lowers the latest period of
+    # prerequisites in groups where every listed course is needed. Courses on cycles are visited once
+    # after the acyclic part.
+    bounds = {cid: [lo, hi] for cid, (lo, hi) in windows.items()}
+    groups_by_course: dict[str, list[tuple[int, int, list[str]]]] = {}
+    successors: dict[str, list[str]] = {}
+    indegree = {cid: 0 for cid in bounds}
+    for cid, required_count, gap, required_ids in groups:
+        groups_by_course.setdefault(cid, []).append((required_count, gap, required_ids))
+        for rid in required_ids:
+            successors.setdefault(rid, []).append(cid)
+            indegree[cid] += 1
+    queue = deque(cid for cid, deg in indegree.items() if deg == 0)
+    order: list[str] = []
+    while queue:
+        cid = queue.popleft()
+        order.append(cid)
+        for nxt in successors.get(cid, []):
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                queue.append(nxt)
+    if len(order) < len(bounds):
+        placed = set(order)
+        order.extend(cid for cid in bounds if cid not in placed)
+    for cid in order:
+        for required_count, gap, required_ids in groups_by_course.get(cid, []):
+            earliest = sorted(bounds[rid][0] + gap for rid in required_ids)[required_count - 1]
+            if earliest > bounds[cid][0]:
+                bounds[cid][0] = earliest
+    for cid in reversed(order):
+        for required_count, gap, required_ids in groups_by_course.get(cid, []):
+            if required_count < len(required_ids):
+                continue
+            latest = bounds[cid][1] - gap
+            for rid in required_ids:
+                if latest < bounds[rid][1]:
+                    bounds[rid][1] = latest
+    return bounds
+
+
 def ensure_runtime_migrations() -> None:
     with engine.begin() as conn:
         conn.execute(
@@ -1819,6 +1981,8 @@ def ensure_runtime_migrations() -> None:
         vr_col_names = {c[1] for c in vr_cols}
         if "rule_code" not in vr_col_names:
             conn.execute(text("ALTER TABLE validation_rules ADD COLUMN rule_code TEXT"))
+        if "updated_at" not in vr_col_names:
+            conn.execute(text("ALTER TABLE validation_rules ADD COLUMN updated_at DATETIME"))
         prereq_cols = conn.execute(text("PRAGMA table_info(course_prerequisites)")).fetchall()
         prereq_col_names = {c[1] for c in prereq_cols}
         if "prerequisite_group_key" not in prereq_col_names:
@@ -1827,6 +1991,59 @@ def ensure_runtime_migrations() -> None:
             conn.execute(text("ALTER TABLE course_prerequisites ADD COLUMN group_min_required INTEGER DEFAULT 1"))
         if "group_label" not in prereq_col_names:
             conn.execute(text("ALTER TABLE course_prerequisites ADD COLUMN group_label TEXT"))
+        # Prerequisites, substitutions and bucket tags carry their course's version_id (stamped on flush by
+        # stamp_course_version_ids); rows written before the column existed are backfilled here.
+        for table, course_col in (
+            ("course_prerequisites", "course_id"),
+            ("course_substitutions", "original_course_id"),
+            ("course_bucket_tags", "course_id"),
+        ):
+            table_col_names = {c[1] for c in conn.execute(text(f"PRAGMA table_info({table})")).fetchall()}
+            if "version_id" not in table_col_names:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN version_id TEXT"))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_version_id ON {table} (version_id)"))
+            conn.execute(
+                text(
+                    f"UPDATE {table} SET version_id = (SELECT courses.version_id FROM courses WHERE courses.id = {table}.{course_col}) "
+                    "WHERE version_id IS NULL"
+                )
+            )
+        # One validation run per version generation. Older databases may already hold concurrent duplicates:
+        # keep the earliest run of each generation (the one lookups returned), repoint first-seen references
+        # to it and drop the rest before adding the unique index.
+        run_unique_columns = [
+            {row[2] for row in conn.execute(text(f"PRAGMA index_info('{index[1]}')")).fetchall()}
+            for index in conn.execute(text("PRAGMA index_list(validation_runs)")).fetchall()
+            if index[2]
+        ]
+        if {"version_id", "generation"} not in run_unique_columns:
+            duplicate_runs = conn.execute(
+                text(
+                    """
+                    SELECT r.id, (
+                        SELECT k.id FROM validation_runs k
+                        WHERE k.version_id = r.version_id AND k.generation = r.generation
+                        ORDER BY k.created_at, k.rowid LIMIT 1
+                    ) AS keep_id
+                    FROM validation_runs r
+                    """
+                )
+            ).fetchall()
+            for run_id, keep_id in duplicate_runs:
+                if run_id == keep_id:
+                    continue
+                conn.execute(
+                    text("UPDATE validation_findings SET first_seen_run_id = :keep_id WHERE first_seen_run_id = :run_id"),
+                    {"keep_id": keep_id, "run_id": run_id},
+                )
+                conn.execute(text("DELETE FROM validation_findings WHERE run_id = :run_id"), {"run_id": run_id})
+                conn.execute(text("DELETE FROM validation_runs WHERE id = :run_id"), {"run_id": run_id})
+            conn.execute(
+                text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_validation_runs_version_generation "
+                    "ON validation_runs (version_id, generation)"
+                )
+            )
 
         migrated = conn.execute(
             text("SELECT value FROM runtime_flags WHERE key = 'period_model_v2_migrated'")
@@ -1999,15 +2216,125 @@ def ensure_validation_rule_codes(db: Session) -> None:
         db.commit()
 
 
-def active_rules_with_config(db: Session) -> list[tuple[ValidationRule, dict]]:
-    rows: list[tuple[ValidationRule, dict]] = []
-    for r in db.scalars(select(ValidationRule).where(ValidationRule.active.is_(True))).all():
+class CompiledRule:
+    # A validation rule row with config_json parsed once. Typed parameters are coerced on first use
+    # and memoized on the object, so evaluation loops do no JSON or float/int work after the first call.
+    __slots__ = (
+        "id",
+        "name",
+        "rule_code",
+        "tier",
+        "severity",
+        "active",
+        "config_json",
+        "updated_at",
+        "stamp",
+        "cfg",
+        "type",
+        "domain",
+        "core_groups",
+        "params",
+    )
+
+    def __init__(self, row):
+        for key in ("id", "name", "rule_code", "tier", "severity", "active", "config_json", "updated_at"):
+            setattr(self, key, getattr(row, key))
+        self.stamp = (self.id, self.name, self.rule_code, self.tier, self.severity, self.active, self.config_json, self.updated_at)
         try:
-            cfg = json.loads(r.config_json or "{}")
+            cfg = json.loads(row.config_json or "{}")
         except Exception:
             cfg = {}
-        rows.append((r, cfg if isinstance(cfg, dict) else {}))
-    return rows
+        self.cfg = cfg if isinstance(cfg, dict) else {}
+        self.type = str(self.cfg.get("type") or "").upper().strip()
+        self.domain = rule_domain(self.cfg).lower()
+        groups = self.cfg.get("required_core_groups") or []
+        self.core_groups = groups if self.type in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"} and isinstance(groups, list) else []
+        self.params: dict[tuple, object] = {}
+        for coerce, default, keys in RULE_PARAM_SPECS.get(self.type, ()):
+            self.param(coerce, default, *keys)
+
+    def param(self, coerce, default, *keys):
+        # The first key present wins (like nested cfg.get calls); a value that fails to coerce gives default.
+        memo = (coerce, default, keys)
+        if memo in self.params:
+            return self.params[memo]
+        value = default
+        for key in keys:
+            if key in self.cfg:
+                try:
+                    value = coerce(self.cfg[key])
+                except Exception:
+                    value = default
+                break
+        self.params[memo] = value
+        return value
+
+
+def rule_param(rule: Optional[CompiledRule], coerce, default, *keys):
+    return rule.param(coerce, default, *keys) if rule is not None else default
+
+
+# Parameters compiled eagerly per rule type (anything else is compiled the first time it is read).
+RULE_PARAM_SPECS: dict[str, tuple[tuple[type, object, tuple[str, ...]], ...]] = {
+    "DEF_UPPER_LEVEL_COURSE_NUMBER": ((int, 300, ("min_level",)),),
+    "MINOR_MIN_COURSES": ((int, 5, ("min_courses",)),),
+    "MINOR_MIN_HOURS": ((float, 15.0, ("min_hours",)),),
+    "MINOR_MIN_UPPER_LEVEL_COURSES": ((int, 3, ("min_count",)),),
+    "DOUBLE_MAJOR_ADDITIONAL_HOURS_MIN": ((float, 12.0, ("min_additional_hours",)),),
+    "RESIDENCY_MIN_HOURS": ((float, DEFAULT_RESIDENCY_MIN_HOURS, ("min_hours", "minimum_in_residence_hours")),),
+    "RESIDENCY_MIN_ACADEMIC_SEMESTERS": ((int, DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS, ("min_semesters", "minimum_academic_semesters")),),
+    "ABET_EAC_MATH_BASIC_SCI_MIN": ((float, 30.0, ("min_credits",)),),
+    "ABET_EAC_ENGINEERING_TOPICS_MIN": ((float, 45.0, ("min_credits",)),),
+    "BUCKET_MIN_CREDITS": ((float, 0.0, ("min_credits",)),),
+    "BUCKET_MIN_COURSES": ((int, 1, ("min_courses",)),),
+    **{
+        rule_type: tuple(
+            (float, None, (key,))
+            for key in [
+                "max_credits_per_semester",
+                "max_credits",
+                "cap",
+                "value",
+                "max_credits_per_summer_period",
+                "max_summer_credits",
+                "summer_cap",
+            ]
+        )
+        for rule_type in ("MAX_CREDITS_PER_SEMESTER", "SEMESTER_CREDIT_CAP")
+    },
+}
+compiled_rule_cache: dict[str, tuple[tuple, CompiledRule]] = {}
+
+
+def compiled_validation_rules(db: Session, active_only: bool = True) -> list[CompiledRule]:
+    # Rows are re-read every call (one narrow select, so edits from any worker are seen); a rule is only
+    # recompiled when its row, including updated_at, differs from the cached one.
+    cols = [
+        ValidationRule.id,
+        ValidationRule.name,
+        ValidationRule.rule_code,
+        ValidationRule.tier,
+        ValidationRule.severity,
+        ValidationRule.active,
+        ValidationRule.config_json,
+        ValidationRule.updated_at,
+    ]
+    stmt = select(*cols)
+    if active_only:
+        stmt = stmt.where(ValidationRule.active.is_(True))
+    out: list[CompiledRule] = []
+    for row in db.execute(stmt):
+        key = tuple(row)
+        cached = compiled_rule_cache.get(row.id)
+        if cached is None or cached[0] != key:
+            cached = (key, CompiledRule(row))
+            compiled_rule_cache[row.id] = cached
+        out.append(cached[1])
+    return out
+
+
+def active_rules_with_config(db: Session) -> list[tuple[CompiledRule, dict]]:
+    return [(r, r.cfg) for r in compiled_validation_rules(db)]
 
 
 def rule_domain(cfg: dict) -> str:
@@ -2022,7 +2349,7 @@ def is_definitional_rule(cfg: dict) -> bool:
     return rule_domain(cfg).lower() == "definitional"
 
 
-def active_design_rules_with_config(db: Session) -> list[tuple[ValidationRule, dict]]:
+def active_design_rules_with_config(db: Session) -> list[tuple[CompiledRule, dict]]:
     return [
         (rule, cfg)
         for rule, cfg in active_rules_with_config(db)
@@ -2085,7 +2412,7 @@ def bucket_credits_for_course_ids(
 
 
 def abet_validation_items_for_courses(
-    rule_rows: list[tuple[ValidationRule, dict]],
+    rule_rows: list[tuple[CompiledRule, dict]],
     *,
     programs: list[AcademicProgram],
     course_ids: set[str],
@@ -2096,17 +2423,14 @@ def abet_validation_items_for_courses(
     if not programs or not course_ids:
         return out
     for rule, cfg in rule_rows:
-        rtype = str(cfg.get("type") or "").upper().strip()
+        rtype = rule.type
         if rtype not in {"ABET_EAC_MATH_BASIC_SCI_MIN", "ABET_EAC_ENGINEERING_TOPICS_MIN"}:
             continue
         if not rule_targets_programs(cfg, programs):
             continue
         default_bucket = "ABET_MATH_BASIC_SCI" if rtype == "ABET_EAC_MATH_BASIC_SCI_MIN" else "ABET_ENGINEERING_TOPICS"
         bucket_code = str(cfg.get("bucket_code") or default_bucket).strip().upper()
-        try:
-            min_credits = float(cfg.get("min_credits", 30.0 if rtype == "ABET_EAC_MATH_BASIC_SCI_MIN" else 45.0))
-        except Exception:
-            min_credits = 30.0 if rtype == "ABET_EAC_MATH_BASIC_SCI_MIN" else 45.0
+        min_credits = rule.param(float, 30.0 if rtype == "ABET_EAC_MATH_BASIC_SCI_MIN" else 45.0, "min_credits")
         actual = bucket_credits_for_course_ids(course_ids, bucket_rows, course_by_id, bucket_code)
         out.append(
             {
@@ -2120,7 +2444,7 @@ def abet_validation_items_for_courses(
 
 
 def bucket_validation_items_for_courses(
-    rule_rows: list[tuple[ValidationRule, dict]],
+    rule_rows: list[tuple[CompiledRule, dict]],
     *,
     programs: list[AcademicProgram],
     course_ids: set[str],
@@ -2131,7 +2455,7 @@ def bucket_validation_items_for_courses(
     if not course_ids:
         return out
     for rule, cfg in rule_rows:
-        rtype = str(cfg.get("type") or "").upper().strip()
+        rtype = rule.type
         if rtype not in {"BUCKET_MIN_CREDITS", "BUCKET_MIN_COURSES"}:
             continue
         if programs and (not rule_targets_programs(cfg, programs)):
@@ -2140,10 +2464,7 @@ def bucket_validation_items_for_courses(
         if not bucket_code:
             continue
         if rtype == "BUCKET_MIN_CREDITS":
-            try:
-                minimum = float(cfg.get("min_credits", 0.0))
-            except Exception:
-                minimum = 0.0
+            minimum = rule.param(float, 0.0, "min_credits")
             actual = bucket_credits_for_course_ids(course_ids, bucket_rows, course_by_id, bucket_code)
             out.append(
                 {
@@ -2155,11 +2476,7 @@ def bucket_validation_items_for_courses(
             )
             continue
 
-        try:
-            minimum_count = int(cfg.get("min_courses", 1))
-        except Exception:
-            minimum_count = 1
-        minimum_count = max(0, minimum_count)
+        minimum_count = max(0, rule.param(int, 1, "min_courses"))
         tagged_course_ids = {
             row.course_id
             for row in bucket_rows
@@ -2177,19 +2494,15 @@ def bucket_validation_items_for_courses(
     return out
 
 
-def get_pathway_definitions(rule_rows: list[tuple[ValidationRule, dict]]) -> dict:
+def get_pathway_definitions(rule_rows: list[tuple[CompiledRule, dict]]) -> dict:
     upper_level_min = 300
 
-    _def_upper_rule, def_upper_cfg = find_active_rule(
+    def_upper_rule, _def_upper_cfg = find_active_rule(
         rule_rows,
         rule_type="DEF_UPPER_LEVEL_COURSE_NUMBER",
         names=["Program/Major Pathway Definition: Upper-level course number minimum"],
     )
-
-    try:
-        upper_level_min = int(def_upper_cfg.get("min_level", upper_level_min))
-    except Exception:
-        upper_level_min = 300
+    upper_level_min = rule_param(def_upper_rule, int, upper_level_min, "min_level")
 
     return {
         "upper_level_min": upper_level_min,
@@ -2199,31 +2512,32 @@ def get_pathway_definitions(rule_rows: list[tuple[ValidationRule, dict]]) -> dic
 
 def build_pathway_validation_items(
     *,
-    rule_rows: list[tuple[ValidationRule, dict]],
+    rule_rows: list[tuple[CompiledRule, dict]],
     programs: list[AcademicProgram],
-    program_course_sets: dict[str, set[str]],
+    program_course_sets: dict[str, int],
     program_credit_sums: dict[str, float],
-    course_by_id: dict[str, Course],
+    course_index: dict,
     definitions: dict,
     program_upper_lbs: Optional[dict[str, float]] = None,
     program_upper_ubs: Optional[dict[str, float]] = None,
+    course_levels: dict[str, Optional[int]],
 ) -> list[dict]:
     out: list[dict] = []
     selected_majors = [p for p in programs if (p.program_type or "").upper() == "MAJOR"]
     selected_minors = [p for p in programs if (p.program_type or "").upper() == "MINOR"]
     upper_min = int(definitions.get("upper_level_min", 300))
 
-    minor_courses_rule, minor_courses_cfg = find_active_rule(
+    minor_courses_rule, _minor_courses_cfg = find_active_rule(
         rule_rows,
         rule_type="MINOR_MIN_COURSES",
         names=["Program/Major Pathway: Minor minimum courses"],
     )
-    minor_hours_rule, minor_hours_cfg = find_active_rule(
+    minor_hours_rule, _minor_hours_cfg = find_active_rule(
         rule_rows,
         rule_type="MINOR_MIN_HOURS",
         names=["Program/Major Pathway: Minor minimum hours"],
     )
-    minor_upper_rule, minor_upper_cfg = find_active_rule(
+    minor_upper_rule, _minor_upper_cfg = find_active_rule(
         rule_rows,
         rule_type="MINOR_MIN_UPPER_LEVEL_COURSES",
         names=["Program/Major Pathway: Minor upper-level courses minimum"],
@@ -2233,42 +2547,23 @@ def build_pathway_validation_items(
         rule_type="DOUBLE_MAJOR_DIVISION_SEPARATION",
         names=["Program/Major Pathway: Double major divisional separation"],
     )
-    dm_add_rule, dm_add_cfg = find_active_rule(
+    dm_add_rule, _dm_add_cfg = find_active_rule(
         rule_rows,
         rule_type="DOUBLE_MAJOR_ADDITIONAL_HOURS_MIN",
         names=["Program/Major Pathway: Double major additional hours minimum"],
     )
 
-    try:
-        minor_min_courses = int(minor_courses_cfg.get("min_courses", 5))
-    except Exception:
-        minor_min_courses = 5
-    try:
-        minor_min_hours = float(minor_hours_cfg.get("min_hours", 15))
-    except Exception:
-        minor_min_hours = 15.0
-    try:
-        minor_min_upper = int(minor_upper_cfg.get("min_count", 3))
-    except Exception:
-        minor_min_upper = 3
-    try:
-        minor_upper_level = int(minor_upper_cfg.get("min_level", upper_min))
-    except Exception:
-        minor_upper_level = upper_min
-    try:
-        double_major_min_additional = float(dm_add_cfg.get("min_additional_hours", 12))
-    except Exception:
-        double_major_min_additional = 12.0
-
-    course_level = {}
-    for cid, c in course_by_id.items():
-        m = re.search(r"(\d{3})", str(c.course_number or ""))
-        course_level[cid] = int(m.group(1)) if m else None
+    minor_min_courses = rule_param(minor_courses_rule, int, 5, "min_courses")
+    minor_min_hours = rule_param(minor_hours_rule, float, 15.0, "min_hours")
+    minor_min_upper = rule_param(minor_upper_rule, int, 3, "min_count")
+    minor_upper_level = rule_param(minor_upper_rule, int, upper_min, "min_level")
+    double_major_min_additional = rule_param(dm_add_rule, float, 12.0, "min_additional_hours")
 
     for mn in selected_minors:
-        minor_courses = set(program_course_sets.get(mn.id, set()))
+        minor_courses = program_course_sets.get(mn.id, 0)
+        minor_course_count = minor_courses.bit_count()
         minor_credits = float(program_credit_sums.get(mn.id, 0.0))
-        upper_count_actual = sum(1 for cid in minor_courses if (course_level.get(cid) or 0) >= minor_upper_level)
+        upper_count_actual = (minor_courses & course_level_mask(course_index, course_levels, minor_upper_level)).bit_count()
         upper_count_lb = float(program_upper_lbs.get(mn.id, 0.0)) if isinstance(program_upper_lbs, dict) else None
         upper_count_ub = float(program_upper_ubs.get(mn.id, 0.0)) if isinstance(program_upper_ubs, dict) else None
         if minor_courses_rule:
@@ -2276,8 +2571,8 @@ def build_pathway_validation_items(
                 {
                     "rule_code": str(minor_courses_rule.rule_code or "").strip(),
                     "rule_name": minor_courses_rule.name,
-                    "status": status_for_check(len(minor_courses) >= minor_min_courses, minor_courses_rule.severity),
-                    "message": f"Minor - {mn.name}: courses {len(minor_courses)}; minimum {minor_min_courses}.",
+                    "status": status_for_check(minor_course_count >= minor_min_courses, minor_courses_rule.severity),
+                    "message": f"Minor - {mn.name}: courses {minor_course_count}; minimum {minor_min_courses}.",
                 }
             )
         if minor_hours_rule:
@@ -2313,11 +2608,10 @@ def build_pathway_validation_items(
         for primary, secondary in oriented_pairs:
             same_division_conflict = bool(primary.division and secondary.division and primary.division == secondary.division)
 
-            p_courses = set(program_course_sets.get(primary.id, set()))
-            s_courses = set(program_course_sets.get(secondary.id, set()))
             p_credits = float(program_credit_sums.get(primary.id, 0.0))
-            union_course_ids = p_courses | s_courses
-            union_credits = sum(float(course_by_id[cid].credit_hours or 0.0) for cid in union_course_ids if cid in course_by_id)
+            union_credits = mask_credit_sum(
+                course_index, program_course_sets.get(primary.id, 0) | program_course_sets.get(secondary.id, 0)
+            )
             additional_vs_primary = union_credits - p_credits
 
             if dm_div_rule:
@@ -2347,16 +2641,100 @@ def build_pathway_validation_items(
     return out
 
 
+def course_level_map(courses) -> dict[str, Optional[int]]:
+    out: dict[str, Optional[int]] = {}
+    for c in courses:
+        m = re.search(r"(\d{3})", str(c.course_number or ""))
+        out[c.id] = int(m.group(1)) if m else None
+    return out
+
+
+# Course sets in the feasibility/checklist engines are Python ints with one bit per course, so unions
+# and intersections are single big-int operations instead of set copies over UUID strings.
+def build_course_bit_index(courses) -> dict:
+    ids = [c.id for c in courses]
+    return {
+        "ids": ids,
+        "bit_by_id": {cid: 1 << i for i, cid in enumerate(ids)},
+        "credits": [float(c.credit_hours or 0.0) for c in courses],
+        "level_masks": {},
+    }
+
+
+def course_mask(index: dict, course_ids) -> int:
+    bit_by_id = index["bit_by_id"]
+    mask = 0
+    for cid in course_ids:
+        bit = bit_by_id.get(cid)
+        if bit is None:
+            # Links can reference courses outside the loaded catalog; they count as members with no credit.
+            bit = 1 << len(index["ids"])
+            bit_by_id[cid] = bit
+            index["ids"].append(cid)
+            index["credits"].append(0.0)
+        mask |= bit
+    return mask
+
+
+def iter_mask_positions(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_course_ids(index: dict, mask: int) -> list[str]:
+    ids = index["ids"]
+    return [ids[i] for i in iter_mask_positions(mask)]
+
+
+def mask_credit_sum(index: dict, mask: int) -> float:
+    credits = index["credits"]
+    return sum(credits[i] for i in iter_mask_positions(mask))
+
+
+def overlap_components(masks: list[int]) -> list[list[int]]:
+    # Union-find over a course -> first-owning-unit index: units sharing any course end up in one component.
+    parent = list(range(len(masks)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: dict[int, int] = {}
+    for i, mask in enumerate(masks):
+        for pos in iter_mask_positions(mask):
+            j = owner.setdefault(pos, i)
+            if j != i:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[rj] = ri
+    groups: dict[int, list[int]] = {}
+    for i in range(len(masks)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def course_level_mask(index: dict, course_levels: dict[str, Optional[int]], min_level: int) -> int:
+    cached = index["level_masks"].get(min_level)
+    if cached is None:
+        cached = course_mask(index, [cid for cid, level in course_levels.items() if (level or 0) >= min_level])
+        index["level_masks"][min_level] = cached
+    return cached
+
+
 def find_active_rule(
-    rules_with_cfg: list[tuple[ValidationRule, dict]],
+    rules_with_cfg: list[tuple[CompiledRule, dict]],
     *,
     rule_type: Optional[str] = None,
     names: Optional[list[str]] = None,
-) -> tuple[Optional[ValidationRule], dict]:
+) -> tuple[Optional[CompiledRule], dict]:
     names_lc = {str(n).strip().lower() for n in (names or [])}
     target_type = str(rule_type or "").upper().strip()
     for rule, cfg in rules_with_cfg:
-        if target_type and str(cfg.get("type") or "").upper().strip() == target_type:
+        if target_type and rule.type == target_type:
             return rule, cfg
     if names_lc:
         for rule, cfg in rules_with_cfg:
@@ -3153,6 +3531,7 @@ def startup():
             if prog.program_type == "MAJOR" and not prog.division:
                 prog.division = infer_division_from_program_name(prog.name)
         db.commit()
+        backfill_requirement_closure(db)
 
 
 @app.get("/health")
@@ -3238,6 +3617,193 @@ def set_version_status(version_id: str, status: str, db: Session = Depends(get_d
     return {"status": v.status}
 
 
+class ReportPayloadCache:
+    # LRU of pickled report payloads bounded by entry count and total bytes. Each entry remembers the
+    # version generation it was computed at; a lookup at any other generation is a (stale) miss.
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[tuple, tuple[int, bytes]] = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0, "oversize": 0}
+
+    def get(self, key: tuple, generation: int):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry[0] != generation:
+                self.stats["stale"] += 1
+                self.stats["misses"] += 1
+                self.bytes -= len(self.entries.pop(key)[1])
+                return None
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            blob = entry[1]
+        return pickle.loads(blob)
+
+    def contains(self, key: tuple, generation: int) -> bool:
+        # Readiness check only: no unpickling, LRU move, stats or stale eviction.
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and entry[0] == generation
+
+    def put(self, key: tuple, generation: int, payload) -> None:
+        blob = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old[1])
+            if len(blob) > self.max_bytes or self.max_entries <= 0:
+                self.stats["oversize"] += 1
+                return
+            self.entries[key] = (generation, blob)
+            self.bytes += len(blob)
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                _key, (_generation, evicted) = self.entries.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.stats["evictions"] += 1
+
+    def metrics(self) -> dict:
+        with self.lock:
+            return {
+                **self.stats,
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+report_payload_cache = ReportPayloadCache(REPORT_CACHE_MAX_ENTRIES, REPORT_CACHE_MAX_BYTES)
+
+
+def cached_report_payload(endpoint: str, version_id: str, params: dict, db: Session, compute):
+    # Sessions with uncommitted changes to the version compute directly; their generation may be rolled back.
+    if db.new or db.dirty or db.deleted:
+        db.flush()
+    if version_id in db.info.get("pending_version_ids", ()):
+        return compute()
+    key = (endpoint, version_id, json.dumps(params, sort_keys=True, default=str))
+    generation = version_generation(db, version_id)
+    payload = report_payload_cache.get(key, generation)
+    if payload is None:
+        payload = compute()
+        report_payload_cache.put(key, generation, payload)
+    return payload
+
+
+def report_payload_ready(endpoint: str, version_id: str, params: dict, db: Session) -> bool:
+    if version_id in db.info.get("pending_version_ids", ()):
+        return False
+    key = (endpoint, version_id, json.dumps(params, sort_keys=True, default=str))
+    return report_payload_cache.contains(key, version_generation(db, version_id))
+
+
+VALIDATION_TIERS = (1, 2, 3)
+validation_warmups: set[str] = set()
+validation_warmup_lock = threading.Lock()
+
+
+def parse_validation_tiers(tiers: Optional[str]) -> Optional[set[int]]:
+    if tiers is None or not str(tiers).strip():
+        return None
+    out: set[int] = set()
+    for part in str(tiers).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if not part.isdigit() or int(part) not in VALIDATION_TIERS:
+            raise HTTPException(status_code=400, detail=f"Invalid validation tier: {part}")
+        out.add(int(part))
+    return out or None
+
+
+def warm_validation_report(version_id: str) -> None:
+    # Runs after the response is sent, on its own session; the full result lands in the report cache
+    # under the same key validation_dashboard reads.
+    with validation_warmup_lock:
+        if version_id in validation_warmups:
+            return
+        validation_warmups.add(version_id)
+    db = SessionLocal()
+    try:
+        cached_report_payload("validate", version_id, {}, db, lambda: validate(version_id, db, None))
+    finally:
+        db.close()
+        with validation_warmup_lock:
+            validation_warmups.discard(version_id)
+
+
+def schedule_validation_warmup(background_tasks: Optional[BackgroundTasks], version_id: str, db: Session) -> None:
+    if background_tasks is None or version_id in db.info.get("pending_version_ids", ()):
+        return
+    background_tasks.add_task(warm_validation_report, version_id)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [x.strip() for x in if_none_match.split(",")]
+    return "*" in tags or etag in [x[2:] if x.startswith("W/") else x for x in tags]
+
+
+def conditional_design_response(
+    request: Optional[Request], response: Optional[Response], version_id: str, db: Session, *salt
+) -> Optional[Response]:
+    # Strong ETag from the version's generation plus the query string (minus the session token), checked
+    # before anything is loaded. Returns the 304 to send, or None after tagging the normal response.
+    if request is None or response is None:
+        return None
+    params = sorted((k, v) for k, v in request.query_params.multi_items() if k != "session_token")
+    raw = json.dumps([request.url.path, version_generation(db, version_id), params, *salt])
+    etag = '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+@app.get("/versions/{version_id}/changes")
+def version_changes(
+    version_id: str,
+    since: int = 0,
+    after_id: int = 0,
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+):
+    if not db.get(CurriculumVersion, version_id):
+        raise HTTPException(status_code=404, detail="Version not found")
+    rows = db.scalars(
+        select(VersionChange)
+        .where(VersionChange.version_id == version_id, VersionChange.generation > since, VersionChange.id > after_id)
+        .order_by(VersionChange.id.asc())
+        .limit(limit + 1)
+    ).all()
+    return {
+        "version_id": version_id,
+        "generation": version_generation(db, version_id),
+        "since": since,
+        "has_more": len(rows) > limit,
+        "next_after_id": rows[limit - 1].id if len(rows) > limit else None,
+        "changes": [
+            {
+                "id": r.id,
+                "generation": r.generation,
+                "entity_type": r.entity_type,
+                "entity_id": r.entity_id,
+                "op": r.op,
+                "created_at": r.created_at,
+            }
+            for r in rows[:limit]
+        ],
+    }
+
+
 @app.get("/design/versioning/diff/{from_id}/{to_id}")
 def detailed_diff(from_id: str, to_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
     from_courses = {c.course_number: c for c in db.scalars(select(Course).where(Course.version_id == from_id)).all()}
@@ -3436,13 +4002,21 @@ def list_course_buckets(course_id: str, db: Session = Depends(get_db), _: User =
     return [serialize(r) for r in rows]
 
 
+@app.get("/courses/{course_id}/dependents")
+def list_course_dependents(course_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
+    found = course_dependents(db, [course_id])
+    if course_id not in found:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return found[course_id]
+
+
 @app.get("/courses/buckets/version/{version_id}")
 def list_version_course_buckets(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
     courses = db.scalars(select(Course).where(Course.version_id == version_id)).all()
     course_by_id = {c.id: c for c in courses}
     if not course_by_id:
         return []
-    rows = db.scalars(select(CourseBucketTag).where(CourseBucketTag.course_id.in_(list(course_by_id.keys())))).all()
+    rows = db.scalars(select(CourseBucketTag).where(CourseBucketTag.version_id == version_id)).all()
     return [
         {
             **serialize(r),
@@ -3580,8 +4154,8 @@ def prerequisite_graph(version_id: str, db: Session = Depends(get_db), _: User =
     ids = {c.id for c in courses}
     nodes = [{"id": c.id, "label": c.course_number, "title": c.title, "semester": c.designated_semester} for c in courses]
     edges = []
-    for pre in db.scalars(select(CoursePrerequisite)).all():
-        if pre.course_id in ids and pre.required_course_id in ids:
+    for pre in db.scalars(select(CoursePrerequisite).where(CoursePrerequisite.version_id == version_id)).all():
+        if pre.required_course_id in ids:
             edges.append(
                 {
                     "id": pre.id,
@@ -4223,139 +4797,210 @@ def restructure_requirements(payload: list[RequirementTreeNodeIn], db: Session =
 
 
 @app.get("/design/requirements/tree/{version_id}")
-def requirements_tree(version_id: str, program_id: Optional[str] = None, db: Session = Depends(get_db), _: User = Depends(current_user)):
-    stmt = select(Requirement).where(Requirement.version_id == version_id)
-    if program_id:
-        stmt = stmt.where(Requirement.program_id == program_id)
-    all_reqs = db.scalars(stmt.order_by(Requirement.sort_order.asc(), Requirement.name.asc())).all()
-    req_ids = [r.id for r in all_reqs]
-    links = (
-        db.scalars(
-            select(RequirementFulfillment)
-            .where(RequirementFulfillment.requirement_id.in_(req_ids))
-            .order_by(RequirementFulfillment.requirement_id.asc(), RequirementFulfillment.sort_order.asc())
-        ).all()
-        if req_ids
-        else []
-    )
-    basket_links = (
-        db.scalars(
-            select(RequirementBasketLink)
-            .where(RequirementBasketLink.requirement_id.in_(req_ids))
-            .order_by(RequirementBasketLink.requirement_id.asc(), RequirementBasketLink.sort_order.asc())
-        ).all()
-        if req_ids
-        else []
-    )
-    basket_ids = [x.basket_id for x in basket_links]
-    baskets = {b.id: b for b in db.scalars(select(CourseBasket).where(CourseBasket.id.in_(basket_ids))).all()} if basket_ids else {}
-    basket_items = (
-        db.scalars(
-            select(CourseBasketItem)
-            .where(CourseBasketItem.basket_id.in_(basket_ids))
-            .order_by(CourseBasketItem.basket_id.asc(), CourseBasketItem.sort_order.asc())
-        ).all()
-        if basket_ids
-        else []
-    )
-    basket_subs = (
-        db.scalars(
-            select(CourseBasketSubstitution)
-            .where(CourseBasketSubstitution.basket_id.in_(basket_ids))
-            .order_by(CourseBasketSubstitution.basket_id.asc(), CourseBasketSubstitution.primary_course_id.asc())
-        ).all()
-        if basket_ids
-        else []
+def requirements_tree(
+    version_id: str,
+    program_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+    request: Request = None,
+    response: Response = None,
+    depth: Optional[int] = None,
+):
+    if depth is not None and depth < 1:
+        raise HTTPException(status_code=400, detail="depth must be >= 1")
+    not_modified = conditional_design_response(request, response, version_id, db)
+    if not_modified:
+        return not_modified
+    body = requirement_tree_body(version_id, db, program_id, depth)
+    if request is None:
+        return json.loads(body)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers) if response is not None else None)
+
+
+@app.get("/design/requirements/tree/{version_id}/subtree/{requirement_id}")
+def requirement_subtree(
+    version_id: str,
+    requirement_id: str,
+    program_id: Optional[str] = None,
+    depth: Optional[int] = None,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+    request: Request = None,
+    response: Response = None,
+):
+    if depth is not None and depth < 1:
+        raise HTTPException(status_code=400, detail="depth must be >= 1")
+    not_modified = conditional_design_response(request, response, version_id, db)
+    if not_modified:
+        return not_modified
+    body = requirement_tree_body(version_id, db, program_id, depth, requirement_id)
+    if request is None:
+        return json.loads(body)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers) if response is not None else None)
+
+
+def requirement_tree_body(
+    version_id: str, db: Session, program_id: Optional[str], depth: Optional[int] = None, requirement_id: Optional[str] = None
+) -> bytes:
+    # The serialized tree is cached per (version, program, depth, subtree root, generation); HTTP callers get the
+    # cached JSON bytes as-is. Shallow and subtree payloads carry child_count and subtree_hash on every node, so
+    # the UI can expand nodes on demand and skip subtrees whose hash it already has.
+    def compute() -> dict:
+        tree = build_requirements_tree(get_curriculum_graph(version_id, db), program_id)
+        if depth is None and requirement_id is None:
+            return tree
+        annotate_requirement_subtrees(tree["tree"])
+        if requirement_id is None:
+            return {"tree": prune_requirement_tree(tree["tree"], depth), "depth": depth}
+        stack = list(tree["tree"])
+        while stack:
+            node = stack.pop()
+            if node["id"] == requirement_id:
+                return {"node": prune_requirement_tree([node], depth)[0], "depth": depth}
+            stack.extend(node["children"])
+        raise HTTPException(status_code=404, detail="Requirement not found in tree")
+
+    params = {"program_id": program_id}
+    if depth is not None:
+        params["depth"] = depth
+    if requirement_id is not None:
+        params["requirement_id"] = requirement_id
+    return cached_report_payload(
+        "requirements_tree",
+        version_id,
+        params,
+        db,
+        lambda: json.dumps(compute(), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8"),
     )
-    items_by_basket: dict[str, list[dict]] = {}
-    for item in basket_items:
-        course = db.get(Course, item.course_id)
-        items_by_basket.setdefault(item.basket_id, []).append(
-            {
-                "id": item.id,
-                "course_id": item.course_id,
-                "course_number": course.course_number if course else None,
-                "course_title": course.title if course else None,
-                "sort_order": item.sort_order,
-            }
-        )
-    subs_by_basket: dict[str, list[dict]] = {}
-    for row in basket_subs:
-        primary = db.get(Course, row.primary_course_id)
-        sub = db.get(Course, row.substitute_course_id)
-        subs_by_basket.setdefault(row.basket_id, []).append(
-            {
-                "id": row.id,
-                "basket_id": row.basket_id,
-                "primary_course_id": row.primary_course_id,
-                "substitute_course_id": row.substitute_course_id,
-                "is_bidirectional": row.is_bidirectional,
-                "primary_course_number": primary.course_number if primary else None,
-                "primary_course_title": primary.title if primary else None,
-                "substitute_course_number": sub.course_number if sub else None,
-                "substitute_course_title": sub.title if sub else None,
-            }
-        )
-    baskets_by_req: dict[str, list[dict]] = {}
-    for row in basket_links:
-        b = baskets.get(row.basket_id)
-        baskets_by_req.setdefault(row.requirement_id, []).append(
-            {
-                "id": row.id,
-                "requirement_id": row.requirement_id,
-                "basket_id": row.basket_id,
-                "basket_name": b.name if b else None,
-                "min_count": row.min_count,
-                "max_count": row.max_count,
-                "sort_order": row.sort_order,
-                "courses": items_by_basket.get(row.basket_id, []),
-                "substitutions": subs_by_basket.get(row.basket_id, []),
-            }
-        )
-    links_by_req: dict[str, list[dict]] = {}
-    for link in links:
-        course = db.get(Course, link.course_id)
-        links_by_req.setdefault(link.requirement_id, []).append(
-            {
-                "id": link.id,
-                "course_id": link.course_id,
-                "course_number": course.course_number if course else None,
-                "course_title": course.title if course else None,
-                "is_primary": link.is_primary,
-            }
-        )
-    by_parent: dict[Optional[str], list[Requirement]] = {}
-    for req in all_reqs:
-        by_parent.setdefault(req.parent_requirement_id, []).append(req)
-    program_by_id = {p.id: p for p in db.scalars(select(AcademicProgram).where(AcademicProgram.version_id == version_id)).all()}
-    code_map = build_program_designer_code_map(all_reqs, program_by_id)
 
-    def build(parent: Optional[str]):
-        nodes = []
-        for req in by_parent.get(parent, []):
-            program = db.get(AcademicProgram, req.program_id) if req.program_id else None
-            nodes.append(
+
+def annotate_requirement_subtrees(nodes: list[dict]) -> None:
+    for node in nodes:
+        annotate_requirement_subtrees(node["children"])
+        digest = {k: v for k, v in node.items() if k != "children"}
+        digest["children"] = [child["subtree_hash"] for child in node["children"]]
+        node["child_count"] = len(node["children"])
+        node["subtree_hash"] = hashlib.sha1(json.dumps(digest, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def prune_requirement_tree(nodes: list[dict], depth: Optional[int]) -> list[dict]:
+    out = []
+    for node in nodes:
+        node = dict(node)
+        if depth is None or depth > 1:
+            node["children"] = prune_requirement_tree(node["children"], None if depth is None else depth - 1)
+        else:
+            node["children"] = []
+        node["children_loaded"] = depth is None or depth > 1 or not node["child_count"]
+        out.append(node)
+    return out
+
+
+def build_requirements_tree(graph: CurriculumGraph, program_id: Optional[str]) -> dict:
+    all_reqs = [r for r in graph.reqs_by_name if r.program_id == program_id] if program_id else graph.reqs_by_name
+    course_by_id = graph.course_by_id
+    basket_payloads: dict[str, tuple[list[dict], list[dict]]] = {}
+
+    def basket_payload(basket_id: str) -> tuple[list[dict], list[dict]]:
+        if basket_id in basket_payloads:
+            return basket_payloads[basket_id]
+        courses = []
+        for item in graph.basket_items_by_basket.get(basket_id, ()):
+            course = course_by_id.get(item.course_id)
+            courses.append(
                 {
-                    "id": req.id,
-                    "node_code": code_map.get(req.id),
-                    "version_id": req.version_id,
-                    "name": req.name,
-                    "logic_type": req.logic_type,
-                    "pick_n": req.pick_n,
-                    "sort_order": req.sort_order,
-                    "program_id": req.program_id,
-                    "program_name": program.name if program else None,
-                    "program_type": program.program_type if program else None,
-                    "program_division": program.division if program else None,
-                    "scope": "CORE" if req.program_id is None else (program.program_type if program else "PROGRAM"),
-                    "parent_requirement_id": req.parent_requirement_id,
+                    "id": item.id,
+                    "course_id": item.course_id,
+                    "course_number": course.course_number if course else None,
+                    "course_title": course.title if course else None,
+                    "sort_order": item.sort_order,
+                }
+            )
+        substitutions = []
+        for row in graph.basket_subs_by_basket.get(basket_id, ()):
+            primary = course_by_id.get(row.primary_course_id)
+            sub = course_by_id.get(row.substitute_course_id)
+            substitutions.append(
+                {
+                    "id": row.id,
+                    "basket_id": row.basket_id,
+                    "primary_course_id": row.primary_course_id,
+                    "substitute_course_id": row.substitute_course_id,
+                    "is_bidirectional": row.is_bidirectional,
+                    "primary_course_number": primary.course_number if primary else None,
+                    "primary_course_title": primary.title if primary else None,
+                    "substitute_course_number": sub.course_number if sub else None,
+                    "substitute_course_title": sub.title if sub else None,
+                }
+            )
+        basket_payloads[basket_id] = (courses, substitutions)
+        return basket_payloads[basket_id]
+
+    def baskets_for(requirement_id: str) -> list[dict]:
+        out = []
+        for row in graph.baskets_by_req.get(requirement_id, ()):
+            b = graph.basket_by_id.get(row.basket_id)
+            courses, substitutions = basket_payload(row.basket_id)
+            out.append(
+                {
+                    "id": row.id,
+                    "requirement_id": row.requirement_id,
+                    "basket_id": row.basket_id,
+                    "basket_name": b.name if b else None,
+                    "min_count": row.min_count,
+                    "max_count": row.max_count,
+                    "sort_order": row.sort_order,
+                    "courses": courses,
+                    "substitutions": substitutions,
+                }
+            )
+        return out
+
+    def courses_for(requirement_id: str) -> list[dict]:
+        out = []
+        for link in graph.links_by_req.get(requirement_id, ()):
+            course = course_by_id.get(link.course_id)
+            out.append(
+                {
+                    "id": link.id,
+                    "course_id": link.course_id,
+                    "course_number": course.course_number if course else None,
+                    "course_title": course.title if course else None,
+                    "is_primary": link.is_primary,
+                }
+            )
+        return out
+
+    by_parent = group_graph_nodes(all_reqs, "parent_requirement_id") if program_id else graph.tree_child_map
+    program_by_id = graph.program_by_id
+    code_map = build_program_designer_code_map(all_reqs, program_by_id)
+
+    def build(parent: Optional[str]):
+        nodes = []
+        for req in by_parent.get(parent, []):
+            program = program_by_id.get(req.program_id) if req.program_id else None
+            nodes.append(
+                {
+                    "id": req.id,
+                    "node_code": code_map.get(req.id),
+                    "version_id": req.version_id,
+                    "name": req.name,
+                    "logic_type": req.logic_type,
+                    "pick_n": req.pick_n,
+                    "sort_order": req.sort_order,
+                    "program_id": req.program_id,
+                    "program_name": program.name if program else None,
+                    "program_type": program.program_type if program else None,
+                    "program_division": program.division if program else None,
+                    "scope": "CORE" if req.program_id is None else (program.program_type if program else "PROGRAM"),
+                    "parent_requirement_id": req.parent_requirement_id,
                     "category": req.category or ("CORE" if req.program_id is None else "MAJOR"),
                     "major_mode": req.major_mode,
                     "track_name": req.track_name,
                     "option_slot_key": req.option_slot_key,
                     "option_slot_capacity": req.option_slot_capacity,
-                    "courses": links_by_req.get(req.id, []),
-                    "baskets": baskets_by_req.get(req.id, []),
+                    "courses": courses_for(req.id),
+                    "baskets": baskets_for(req.id),
                     "children": build(req.id),
                 }
             )
@@ -4502,6 +5147,31 @@ def list_version_fulfillment(version_id: str, db: Session = Depends(get_db), _:
     return out
 
 
+@app.get("/requirements/{requirement_id}/effective-courses")
+def list_requirement_effective_courses(
+    requirement_id: str, include_baskets: bool = True, db: Session = Depends(get_db), _: User = Depends(current_user)
+):
+    req = db.get(Requirement, requirement_id)
+    if not req:
+        raise HTTPException(status_code=404, detail="Requirement not found")
+    stmt = (
+        select(RequirementEffectiveCourse.course_id, RequirementEffectiveCourse.source, Course.course_number, Course.title)
+        .join(Course, Course.id == RequirementEffectiveCourse.course_id)
+        .where(RequirementEffectiveCourse.requirement_id == requirement_id)
+        .order_by(Course.course_number.asc())
+    )
+    if not include_baskets:
+        stmt = stmt.where(RequirementEffectiveCourse.source == "LINK")
+    courses: dict[str, dict] = {}
+    for course_id, source, course_number, title in db.execute(stmt).all():
+        row = courses.setdefault(course_id, {"course_id": course_id, "course_number": course_number, "course_title": title, "sources": []})
+        row["sources"].append(source)
+    descendant_count = db.scalar(
+        select(func.count()).select_from(RequirementClosure).where(RequirementClosure.ancestor_id == requirement_id, RequirementClosure.depth > 0)
+    )
+    return {"requirement_id": requirement_id, "descendant_count": int(descendant_count or 0), "courses": list(courses.values())}
+
+
 @app.post("/requirements/substitutions")
 def create_requirement_substitution(payload: RequirementSubstitutionIn, db: Session = Depends(get_db), _: User = Depends(require_design)):
     if payload.primary_course_id == payload.substitute_course_id:
@@ -4936,6 +5606,23 @@ def stable_hash(payload: dict | list) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
 
 
+# Bookkeeping columns left out of dataset bundle payloads (and so out of module ids), so unchanged
+# content keeps the ids it had in bundles exported before those columns existed.
+DATASET_EXCLUDED_COLUMNS: dict[type, set[str]] = {
+    ValidationRule: {"updated_at"},
+    CoursePrerequisite: {"version_id"},
+    CourseSubstitution: {"version_id"},
+    CourseBucketTag: {"version_id"},
+}
+
+
+def serialize_dataset_row(instance) -> dict:
+    row = serialize(instance)
+    for key in DATASET_EXCLUDED_COLUMNS.get(type(instance), ()):
+        row.pop(key, None)
+    return row
+
+
 def model_columns(model) -> set[str]:
     return {c.key for c in inspect(model).mapper.column_attrs}
 
@@ -4948,21 +5635,30 @@ def filter_model_row(model, row: dict) -> dict:
 def build_course_definitions_payload(version_id: str, db: Session) -> dict:
     courses = db.scalars(select(Course).where(Course.version_id == version_id).order_by(Course.course_number.asc(), Course.id.asc())).all()
     course_rows = [serialize(c) for c in courses]
-    course_ids = {c["id"] for c in course_rows}
+    version_course_ids = select(Course.id).where(Course.version_id == version_id)
     prereq_rows = [
-        serialize(p)
-        for p in db.scalars(select(CoursePrerequisite).order_by(CoursePrerequisite.course_id.asc(), CoursePrerequisite.required_course_id.asc())).all()
-        if p.course_id in course_ids or p.required_course_id in course_ids
+        serialize_dataset_row(p)
+        for p in db.scalars(
+            select(CoursePrerequisite)
+            .where(or_(CoursePrerequisite.version_id == version_id, CoursePrerequisite.required_course_id.in_(version_course_ids)))
+            .order_by(CoursePrerequisite.course_id.asc(), CoursePrerequisite.required_course_id.asc())
+        ).all()
     ]
     substitution_rows = [
-        serialize(s)
-        for s in db.scalars(select(CourseSubstitution).order_by(CourseSubstitution.original_course_id.asc(), CourseSubstitution.substitute_course_id.asc())).all()
-        if s.original_course_id in course_ids or s.substitute_course_id in course_ids
+        serialize_dataset_row(s)
+        for s in db.scalars(
+            select(CourseSubstitution)
+            .where(or_(CourseSubstitution.version_id == version_id, CourseSubstitution.substitute_course_id.in_(version_course_ids)))
+            .order_by(CourseSubstitution.original_course_id.asc(), CourseSubstitution.substitute_course_id.asc())
+        ).all()
     ]
     bucket_rows = [
-        serialize(b)
-        for b in db.scalars(select(CourseBucketTag).order_by(CourseBucketTag.bucket_code.asc(), CourseBucketTag.sort_order.asc())).all()
-        if b.course_id in course_ids
+        serialize_dataset_row(b)
+        for b in db.scalars(
+            select(CourseBucketTag)
+            .where(CourseBucketTag.version_id == version_id)
+            .order_by(CourseBucketTag.bucket_code.asc(), CourseBucketTag.sort_order.asc())
+        ).all()
     ]
     return {
         "courses": course_rows,
@@ -4973,43 +5669,16 @@ def build_course_definitions_payload(version_id: str, db: Session) -> dict:
 
 
 def build_rule_sets_payload(version_id: str, db: Session) -> dict:
-    programs = [serialize(p) for p in db.scalars(select(AcademicProgram).where(AcademicProgram.version_id == version_id).order_by(AcademicProgram.name.asc())).all()]
-    requirements = [serialize(r) for r in db.scalars(select(Requirement).where(Requirement.version_id == version_id).order_by(Requirement.sort_order.asc(), Requirement.name.asc())).all()]
-    req_ids = {r["id"] for r in requirements}
-    baskets = [serialize(b) for b in db.scalars(select(CourseBasket).where(CourseBasket.version_id == version_id).order_by(CourseBasket.sort_order.asc(), CourseBasket.name.asc())).all()]
-    basket_ids = {b["id"] for b in baskets}
-    basket_items = [
-        serialize(i)
-        for i in db.scalars(select(CourseBasketItem).order_by(CourseBasketItem.basket_id.asc(), CourseBasketItem.sort_order.asc())).all()
-        if i.basket_id in basket_ids
-    ]
-    basket_substitutions = [
-        serialize(s)
-        for s in db.scalars(
-            select(CourseBasketSubstitution).order_by(
-                CourseBasketSubstitution.basket_id.asc(),
-                CourseBasketSubstitution.primary_course_id.asc(),
-                CourseBasketSubstitution.substitute_course_id.asc(),
-            )
-        ).all()
-        if s.basket_id in basket_ids
-    ]
-    requirement_baskets = [
-        serialize(x)
-        for x in db.scalars(select(RequirementBasketLink).order_by(RequirementBasketLink.requirement_id.asc(), RequirementBasketLink.sort_order.asc())).all()
-        if x.requirement_id in req_ids and x.basket_id in basket_ids
-    ]
-    fulfillment = [
-        serialize(f)
-        for f in db.scalars(select(RequirementFulfillment).order_by(RequirementFulfillment.requirement_id.asc(), RequirementFulfillment.sort_order.asc())).all()
-        if f.requirement_id in req_ids
-    ]
-    req_substitutions = [
-        serialize(s)
-        for s in db.scalars(select(RequirementSubstitution).order_by(RequirementSubstitution.requirement_id.asc())).all()
-        if s.requirement_id in req_ids
-    ]
-    validation_rules = [serialize(v) for v in db.scalars(select(ValidationRule).order_by(ValidationRule.tier.asc(), ValidationRule.name.asc())).all()]
+    graph = get_curriculum_graph(version_id, db)
+    programs = [p.as_dict() for p in graph.programs]
+    requirements = [r.as_dict() for r in graph.reqs_by_name]
+    baskets = [b.as_dict() for b in graph.baskets]
+    basket_items = [i.as_dict() for i in graph.basket_items]
+    basket_substitutions = [x.as_dict() for x in graph.basket_substitutions]
+    requirement_baskets = [x.as_dict() for x in graph.req_basket_links if x.basket_id in graph.basket_by_id]
+    fulfillment = [f.as_dict() for f in graph.fulfillments]
+    req_substitutions = [x.as_dict() for x in graph.req_substitutions]
+    validation_rules = [serialize_dataset_row(v) for v in db.scalars(select(ValidationRule).order_by(ValidationRule.tier.asc(), ValidationRule.name.asc())).all()]
     return {
         "academic_programs": programs,
         "requirements": requirements,
@@ -5035,9 +5704,11 @@ def build_canvas_payload(version_id: str, db: Session) -> dict:
 def build_report_results_payload(version_id: str, db: Session) -> dict:
     return {
         "generated_at": datetime.utcnow().isoformat() + "Z",
-        "validation": validate(version_id, db, None),
-        "feasibility": design_feasibility(version_id, db, None),
-        "checklist_core_only": design_checklist(version_id, None, True, db, None),
+        "validation": cached_report_payload("validate", version_id, {}, db, lambda: validate(version_id, db, None)),
+        "feasibility": cached_report_payload("feasibility", version_id, {}, db, lambda: design_feasibility(version_id, db, None)),
+        "checklist_core_only": cached_report_payload(
+            "checklist", version_id, {"include_core": True}, db, lambda: design_checklist(version_id, None, True, db, None)
+        ),
     }
 
 
@@ -5099,14 +5770,21 @@ def apply_course_definitions_import(version_id: str, course_payload: dict, repla
         if existing_course_ids:
             for row in db.scalars(select(PlanItem).where(PlanItem.course_id.in_(existing_course_ids))).all():
                 db.delete(row)
-            for row in db.scalars(select(CourseBucketTag).where(CourseBucketTag.course_id.in_(existing_course_ids))).all():
+            for row in db.scalars(select(CourseBucketTag).where(CourseBucketTag.version_id == version_id)).all():
+                db.delete(row)
+            version_course_ids = select(Course.id).where(Course.version_id == version_id)
+            for row in db.scalars(
+                select(CoursePrerequisite).where(
+                    or_(CoursePrerequisite.version_id == version_id, CoursePrerequisite.required_course_id.in_(version_course_ids))
+                )
+            ).all():
+                db.delete(row)
+            for row in db.scalars(
+                select(CourseSubstitution).where(
+                    or_(CourseSubstitution.version_id == version_id, CourseSubstitution.substitute_course_id.in_(version_course_ids))
+                )
+            ).all():
                 db.delete(row)
-            for row in db.scalars(select(CoursePrerequisite)).all():
-                if row.course_id in existing_course_ids or row.required_course_id in existing_course_ids:
-                    db.delete(row)
-            for row in db.scalars(select(CourseSubstitution)).all():
-                if row.original_course_id in existing_course_ids or row.substitute_course_id in existing_course_ids:
-                    db.delete(row)
             for row in db.scalars(select(Course).where(Course.version_id == version_id)).all():
                 db.delete(row)
             db.flush()
@@ -5127,6 +5805,7 @@ def apply_course_definitions_import(version_id: str, course_payload: dict, repla
     created_prereqs = 0
     for raw in incoming_prereqs:
         row = filter_model_row(CoursePrerequisite, raw)
+        row["version_id"] = version_id
         if row.get("course_id") not in version_course_ids or row.get("required_course_id") not in version_course_ids:
             continue
         if row.get("id") and db.get(CoursePrerequisite, row["id"]):
@@ -5137,6 +5816,7 @@ def apply_course_definitions_import(version_id: str, course_payload: dict, repla
     created_subs = 0
     for raw in incoming_subs:
         row = filter_model_row(CourseSubstitution, raw)
+        row["version_id"] = version_id
         if row.get("original_course_id") not in version_course_ids or row.get("substitute_course_id") not in version_course_ids:
             continue
         if row.get("id") and db.get(CourseSubstitution, row["id"]):
@@ -5147,6 +5827,7 @@ def apply_course_definitions_import(version_id: str, course_payload: dict, repla
     created_buckets = 0
     for raw in incoming_buckets:
         row = filter_model_row(CourseBucketTag, raw)
+        row["version_id"] = version_id
         if row.get("course_id") not in version_course_ids:
             continue
         if row.get("id") and db.get(CourseBucketTag, row["id"]):
@@ -5388,7 +6069,10 @@ def apply_dataset_bundle_import(version_id: str, bundle: dict, db: Session, modu
 
 
 @app.get("/design/canvas/{version_id}")
-def canvas(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
+def canvas(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user), request: Request = None, response: Response = None):
+    not_modified = conditional_design_response(request, response, version_id, db)
+    if not_modified:
+        return not_modified
     out = {str(i): [] for i in ALL_PLAN_PERIODS}
     items = db.scalars(select(PlanItem).where(PlanItem.version_id == version_id).order_by(PlanItem.semester_index, PlanItem.position)).all()
     for item in items:
@@ -5812,7 +6496,12 @@ def design_checklist(
     include_core: bool = True,
     db: Session = Depends(get_db),
     _: User = Depends(current_user),
+    request: Request = None,
+    response: Response = None,
 ):
+    not_modified = conditional_design_response(request, response, version_id, db)
+    if not_modified:
+        return not_modified
     selected_program_ids = []
     if program_ids:
         selected_program_ids = [x.strip() for x in program_ids.split(",") if x.strip()]
@@ -5823,23 +6512,24 @@ def design_checklist(
     for x in canvas_items:
         planned_course_semesters.setdefault(x.course_id, set()).add(x.semester_index)
 
-    reqs = db.scalars(select(Requirement).where(Requirement.version_id == version_id).order_by(Requirement.sort_order.asc())).all()
-    req_by_id = {r.id: r for r in reqs}
-    program_by_id = {p.id: p for p in db.scalars(select(AcademicProgram).where(AcademicProgram.version_id == version_id)).all()}
+    graph = get_curriculum_graph(version_id, db)
+    reqs = graph.reqs
+    req_by_id = graph.req_by_id
+    program_by_id = graph.program_by_id
     node_code_map = build_program_designer_code_map(reqs, program_by_id)
-    courses = db.scalars(select(Course).where(Course.version_id == version_id)).all()
-    course_by_id = {c.id: c for c in courses}
+    courses = graph.courses
+    course_by_id = graph.course_by_id
     course_num_by_id = {c.id: c.course_number for c in courses}
     course_id_by_number = {normalize_course_number(c.course_number): c.id for c in courses}
+    course_index = build_course_bit_index(courses)
+    planned_mask = course_mask(course_index, planned_course_ids)
     planned_credit_hours = 0.0
     for item in canvas_items:
         c = course_by_id.get(item.course_id)
         if c:
             planned_credit_hours += float(c.credit_hours or 0.0)
     planned_academic_semesters = sorted({x.semester_index for x in canvas_items if x.semester_index in ACADEMIC_PERIODS})
-    child_map: dict[Optional[str], list[Requirement]] = {}
-    for r in reqs:
-        child_map.setdefault(r.parent_requirement_id, []).append(r)
+    child_map = graph.child_map
 
     root_reqs_by_program_id: dict[str, Requirement] = {}
     target_reqs = []
@@ -5853,73 +6543,34 @@ def design_checklist(
         elif r.program_id in selected_program_ids:
             target_reqs.append(r)
 
-    direct_links = db.scalars(select(RequirementFulfillment).where(RequirementFulfillment.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    links_by_req: dict[str, list[RequirementFulfillment]] = {}
-    for link in direct_links:
-        links_by_req.setdefault(link.requirement_id, []).append(link)
-    req_basket_links = (
-        db.scalars(select(RequirementBasketLink).where(RequirementBasketLink.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    )
-    basket_ids = [x.basket_id for x in req_basket_links]
-    basket_items = (
-        db.scalars(select(CourseBasketItem).where(CourseBasketItem.basket_id.in_(basket_ids))).all() if basket_ids else []
-    )
-    basket_course_ids_by_basket: dict[str, list[str]] = {}
-    for item in basket_items:
-        basket_course_ids_by_basket.setdefault(item.basket_id, []).append(item.course_id)
-    baskets_by_req: dict[str, list[RequirementBasketLink]] = {}
-    for bl in req_basket_links:
-        baskets_by_req.setdefault(bl.requirement_id, []).append(bl)
-    req_sub_rows = (
-        db.scalars(select(RequirementSubstitution).where(RequirementSubstitution.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    )
+    links_by_req = graph.links_by_req
+    basket_course_ids_by_basket = graph.basket_course_ids_by_basket
+    baskets_by_req = graph.baskets_by_req
     req_sub_map: dict[str, dict[str, set[str]]] = {}
-    for row in req_sub_rows:
+    for row in graph.req_substitutions:
         m = req_sub_map.setdefault(row.requirement_id, {})
         m.setdefault(row.primary_course_id, set()).add(row.substitute_course_id)
         if row.is_bidirectional:
             m.setdefault(row.substitute_course_id, set()).add(row.primary_course_id)
     req_by_name: dict[str, list[Requirement]] = {}
-    req_children: dict[Optional[str], list[Requirement]] = {}
     for r in reqs:
         req_by_name.setdefault((r.name or "").strip().lower(), []).append(r)
-        req_children.setdefault(r.parent_requirement_id, []).append(r)
-    direct_links_by_req: dict[str, list[RequirementFulfillment]] = {}
-    for link in direct_links:
-        direct_links_by_req.setdefault(link.requirement_id, []).append(link)
-    collect_cache: dict[str, set[str]] = {}
-
-    def collect_requirement_course_ids(req_id: str) -> set[str]:
-        if req_id in collect_cache:
-            return set(collect_cache[req_id])
-        found: set[str] = set()
-        stack = [req_id]
-        seen = set()
-        while stack:
-            cur = stack.pop()
-            if cur in seen:
-                continue
-            seen.add(cur)
-            for link in direct_links_by_req.get(cur, []):
-                if link.course_id:
-                    found.add(link.course_id)
-            for bl in baskets_by_req.get(cur, []):
-                for cid in basket_course_ids_by_basket.get(bl.basket_id, []):
-                    if cid:
-                        found.add(cid)
-            for child in req_children.get(cur, []):
-                stack.append(child.id)
-        collect_cache[req_id] = set(found)
-        return found
+    collect_cache: dict[str, int] = {}
 
-    def gather_planned_program_requirement_courses(program_id: str) -> tuple[set[str], float]:
+    def collect_requirement_course_mask(req_id: str) -> int:
+        cached = collect_cache.get(req_id)
+        if cached is None:
+            cached = course_mask(course_index, requirement_effective_course_ids(db, [req_id])[req_id])
+            collect_cache[req_id] = cached
+        return cached
+
+    def gather_planned_program_requirement_courses(program_id: str) -> tuple[int, float]:
         top_program_reqs = [r for r in reqs if r.program_id == program_id and r.parent_requirement_id is None]
-        out_courses: set[str] = set()
+        out_courses = 0
         for tr in top_program_reqs:
-            out_courses |= collect_requirement_course_ids(tr.id)
-        out_courses = {cid for cid in out_courses if cid in planned_course_ids}
-        out_credits = sum(float(course_by_id[cid].credit_hours or 0.0) for cid in out_courses if cid in course_by_id)
-        return out_courses, out_credits
+            out_courses |= collect_requirement_course_mask(tr.id)
+        out_courses &= planned_mask
+        return out_courses, mask_credit_sum(course_index, out_courses)
 
     def evaluate(req_id: str) -> dict:
         req = req_by_id[req_id]
@@ -6066,15 +6717,11 @@ def design_checklist(
     )
     selected_program_by_name = {(p.name or "").strip().lower(): p for p in selected_programs}
     rule_nodes = []
-    for rule in db.scalars(select(ValidationRule).where(ValidationRule.active.is_(True))).all():
-        try:
-            cfg = json.loads(rule.config_json or "{}")
-        except Exception:
-            cfg = {}
-        if is_cadet_performance_rule(cfg):
+    for rule in compiled_validation_rules(db):
+        cfg = rule.cfg
+        if rule.domain == "cadet performance":
             continue
-        rule_type = str(cfg.get("type") or "").upper()
-        if rule_type not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
+        if rule.type not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
             continue
         target_program = None
         pid = cfg.get("program_id")
@@ -6111,18 +6758,22 @@ def design_checklist(
                 violations.append("Fixed semester cannot be combined with no-earlier/no-later.")
             if required_semester_min is not None and required_semester_max is not None and required_semester_min > required_semester_max:
                 violations.append("No-earlier semester cannot be later than no-later semester.")
-            group_course_ids: set[str] = set()
-            for num in g.get("course_numbers") or []:
-                cid = course_id_by_number.get(normalize_course_number(str(num)))
-                if cid:
-                    group_course_ids.add(cid)
+            group_courses = course_mask(
+                course_index,
+                [
+                    cid
+                    for cid in (course_id_by_number.get(normalize_course_number(str(num))) for num in g.get("course_numbers") or [])
+                    if cid
+                ],
+            )
             for req_id in g.get("requirement_ids") or []:
                 if req_id in req_by_id:
-                    group_course_ids |= collect_requirement_course_ids(req_id)
+                    group_courses |= collect_requirement_course_mask(req_id)
             for req_name in g.get("requirement_names") or []:
                 for req in req_by_name.get(str(req_name).strip().lower(), []):
-                    group_course_ids |= collect_requirement_course_ids(req.id)
-            matched_ids = sorted([cid for cid in group_course_ids if cid in planned_course_ids])
+                    group_courses |= collect_requirement_course_mask(req.id)
+            group_course_count = group_courses.bit_count()
+            matched_ids = sorted(mask_course_ids(course_index, group_courses & planned_mask))
             matched_ids_without_timing = list(matched_ids)
             if required_semester is not None or required_semester_min is not None or required_semester_max is not None:
                 def semester_ok(sem: int) -> bool:
@@ -6134,7 +6785,7 @@ def design_checklist(
                         return False
                     return True
                 matched_ids = sorted([cid for cid in matched_ids if any(semester_ok(s) for s in planned_course_semesters.get(cid, set()))])
-            if not group_course_ids:
+            if not group_courses:
                 violations.append("No resolvable courses for this rule.")
             if len(matched_ids) < min_count:
                 sem_bits = []
@@ -6158,8 +6809,8 @@ def design_checklist(
                     "pick_n": min_count,
                     "is_satisfied": child_satisfied,
                     "matched_direct_course_count": len(matched_ids),
-                    "direct_course_count": len(group_course_ids),
-                    "available_option_count": len(group_course_ids),
+                    "direct_course_count": group_course_count,
+                    "available_option_count": group_course_count,
                     "satisfied_units": len(matched_ids),
                     "required_units": min_count,
                     "fixed_semester_violations": violations,
@@ -6206,20 +6857,12 @@ def design_checklist(
         rule_type="RESIDENCY_MIN_ACADEMIC_SEMESTERS",
         names=["Residency minimum academic semesters", "COI residency requirements"],
     )
-    residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-    residency_min_academic = DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS
-    try:
-        residency_min_hours = float(
-            residency_hours_cfg.get("min_hours", residency_hours_cfg.get("minimum_in_residence_hours", residency_min_hours))
-        )
-    except Exception:
-        residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-    try:
-        residency_min_academic = int(
-            residency_sem_cfg.get("min_semesters", residency_sem_cfg.get("minimum_academic_semesters", residency_min_academic))
-        )
-    except Exception:
-        residency_min_academic = DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS
+    residency_min_hours = rule_param(
+        residency_hours_rule, float, DEFAULT_RESIDENCY_MIN_HOURS, "min_hours", "minimum_in_residence_hours"
+    )
+    residency_min_academic = rule_param(
+        residency_sem_rule, int, DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS, "min_semesters", "minimum_academic_semesters"
+    )
 
     all_results = [*results, *rule_nodes]
     total = len(all_results)
@@ -6278,11 +6921,11 @@ def design_checklist(
         )
     )
     pathway_definitions = get_pathway_definitions(active_rules)
-    pathway_program_course_sets: dict[str, set[str]] = {}
+    pathway_program_course_sets: dict[str, int] = {}
     pathway_program_credit_sums: dict[str, float] = {}
     for p in selected_programs:
         pcs, pcredits = gather_planned_program_requirement_courses(p.id)
-        pathway_program_course_sets[p.id] = set(pcs)
+        pathway_program_course_sets[p.id] = pcs
         pathway_program_credit_sums[p.id] = float(pcredits)
     validation_items.extend(
         build_pathway_validation_items(
@@ -6290,8 +6933,9 @@ def design_checklist(
             programs=selected_programs,
             program_course_sets=pathway_program_course_sets,
             program_credit_sums=pathway_program_credit_sums,
-            course_by_id=course_by_id,
+            course_index=course_index,
             definitions=pathway_definitions,
+            course_levels=course_level_map(courses),
         )
     )
 
@@ -6312,147 +6956,570 @@ def design_checklist(
     }
 
 
-@app.get("/design/feasibility/{version_id}")
-def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
-    programs = db.scalars(select(AcademicProgram).where(AcademicProgram.version_id == version_id).order_by(AcademicProgram.name.asc())).all()
-    reqs = db.scalars(select(Requirement).where(Requirement.version_id == version_id).order_by(Requirement.sort_order.asc())).all()
-    # Key feasibility combos to programs that are actually present in Program Design Rules
-    # (top-level requirement nodes), avoiding duplicate/legacy program variants.
-    program_ids_in_designer = {r.program_id for r in reqs if r.parent_requirement_id is None and r.program_id}
-    majors = [p for p in programs if (p.program_type or "").upper() == "MAJOR" and p.id in program_ids_in_designer]
-    minors = [p for p in programs if (p.program_type or "").upper() == "MINOR" and p.id in program_ids_in_designer]
+class GraphNode:
+    # Read-only row copy; subclasses get one slot per mapped column of their model.
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for key, value in zip(self.__slots__, values):
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, key) for key in self.__slots__)
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def graph_node_type(model, name: str) -> type:
+    keys = tuple(c.key for c in inspect(model).column_attrs)
+    return type(name, (GraphNode,), {"__slots__": keys, "__module__": __name__, "model": model})
+
+
+ProgramNode = graph_node_type(AcademicProgram, "ProgramNode")
+RequirementNode = graph_node_type(Requirement, "RequirementNode")
+FulfillmentNode = graph_node_type(RequirementFulfillment, "FulfillmentNode")
+RequirementSubstitutionNode = graph_node_type(RequirementSubstitution, "RequirementSubstitutionNode")
+BasketNode = graph_node_type(CourseBasket, "BasketNode")
+BasketLinkNode = graph_node_type(RequirementBasketLink, "BasketLinkNode")
+BasketItemNode = graph_node_type(CourseBasketItem, "BasketItemNode")
+BasketSubstitutionNode = graph_node_type(CourseBasketSubstitution, "BasketSubstitutionNode")
+CourseNode = graph_node_type(Course, "CourseNode")
+PrerequisiteNode = graph_node_type(CoursePrerequisite, "PrerequisiteNode")
+BucketTagNode = graph_node_type(CourseBucketTag, "BucketTagNode")
+
+
+def load_graph_nodes(db: Session, node_type: type, *clauses, join=None, order_by=()) -> tuple:
+    model = node_type.model
+    stmt = select(*[getattr(model, key) for key in node_type.__slots__])
+    if join is not None:
+        stmt = stmt.join(*join)
+    return tuple(node_type(*row) for row in db.execute(stmt.where(*clauses).order_by(*order_by)))
+
+
+def group_graph_nodes(nodes, attr: str) -> dict:
+    out: dict = {}
+    for node in nodes:
+        out.setdefault(getattr(node, attr), []).append(node)
+    return {key: tuple(value) for key, value in out.items()}
+
+
+class CurriculumGraph:
+    # Immutable per-version view of the requirement/basket/course tables shared by the checklist,
+    # feasibility, validation, tree and rule-set builders. Grouped lookups are tuples keyed by parent id.
+    __slots__ = (
+        "version_id",
+        "generation",
+        "programs",
+        "program_by_id",
+        "reqs",
+        "reqs_by_name",
+        "req_by_id",
+        "child_map",
+        "tree_child_map",
+        "fulfillments",
+        "links_by_req",
+        "req_substitutions",
+        "req_subs_by_req",
+        "baskets",
+        "basket_by_id",
+        "req_basket_links",
+        "baskets_by_req",
+        "basket_items",
+        "basket_items_by_basket",
+        "basket_course_ids_by_basket",
+        "basket_substitutions",
+        "basket_subs_by_basket",
+        "courses",
+        "course_by_id",
+        "prereqs",
+        "bucket_rows",
+    )
+
+    def __init__(self, version_id: str, db: Session, generation: int = 0):
+        on_req = (Requirement, Requirement.id == RequirementFulfillment.requirement_id)
+        set_ = object.__setattr__
+        set_(self, "version_id", version_id)
+        set_(self, "generation", generation)
+        set_(self, "programs", load_graph_nodes(db, ProgramNode, AcademicProgram.version_id == version_id, order_by=(AcademicProgram.name.asc(),)))
+        set_(
+            self,
+            "reqs",
+            load_graph_nodes(db, RequirementNode, Requirement.version_id == version_id, order_by=(Requirement.sort_order.asc(), text("requirements.rowid"))),
+        )
+        set_(
+            self,
+            "fulfillments",
+            load_graph_nodes(
+                db,
+                FulfillmentNode,
+                Requirement.version_id == version_id,
+                join=on_req,
+                order_by=(RequirementFulfillment.requirement_id.asc(), RequirementFulfillment.sort_order.asc()),
+            ),
+        )
+        set_(
+            self,
+            "req_substitutions",
+            load_graph_nodes(
+                db,
+                RequirementSubstitutionNode,
+                Requirement.version_id == version_id,
+                join=(Requirement, Requirement.id == RequirementSubstitution.requirement_id),
+                order_by=(RequirementSubstitution.requirement_id.asc(),),
+            ),
+        )
+        set_(
+            self,
+            "baskets",
+            load_graph_nodes(db, BasketNode, CourseBasket.version_id == version_id, order_by=(CourseBasket.sort_order.asc(), CourseBasket.name.asc())),
+        )
+        set_(
+            self,
+            "req_basket_links",
+            load_graph_nodes(
+                db,
+                BasketLinkNode,
+                Requirement.version_id == version_id,
+                join=(Requirement, Requirement.id == RequirementBasketLink.requirement_id),
+                order_by=(RequirementBasketLink.requirement_id.asc(), RequirementBasketLink.sort_order.asc()),
+            ),
+        )
+        set_(
+            self,
+            "basket_items",
+            load_graph_nodes(
+                db,
+                BasketItemNode,
+                CourseBasket.version_id == version_id,
+                join=(CourseBasket, CourseBasket.id == CourseBasketItem.basket_id),
+                order_by=(CourseBasketItem.basket_id.asc(), CourseBasketItem.sort_order.asc()),
+            ),
+        )
+        set_(
+            self,
+            "basket_substitutions",
+            load_graph_nodes(
+                db,
+                BasketSubstitutionNode,
+                CourseBasket.version_id == version_id,
+                join=(CourseBasket, CourseBasket.id == CourseBasketSubstitution.basket_id),
+                order_by=(
+                    CourseBasketSubstitution.basket_id.asc(),
+                    CourseBasketSubstitution.primary_course_id.asc(),
+                    CourseBasketSubstitution.substitute_course_id.asc(),
+                ),
+            ),
+        )
+        set_(self, "courses", load_graph_nodes(db, CourseNode, Course.version_id == version_id))
+        set_(
+            self,
+            "prereqs",
+            load_graph_nodes(db, PrerequisiteNode, CoursePrerequisite.version_id == version_id),
+        )
+        set_(
+            self,
+            "bucket_rows",
+            load_graph_nodes(db, BucketTagNode, CourseBucketTag.version_id == version_id),
+        )
+        set_(self, "program_by_id", {p.id: p for p in self.programs})
+        set_(self, "req_by_id", {r.id: r for r in self.reqs})
+        set_(self, "child_map", group_graph_nodes(self.reqs, "parent_requirement_id"))
+        # reqs ties on sort_order keep insertion order (checklist, feasibility, validation); the tree and
+        # rule-set views break ties by name, as their own queries always did.
+        set_(self, "reqs_by_name", tuple(sorted(self.reqs, key=lambda r: (r.sort_order or 0, r.name or ""))))
+        set_(self, "tree_child_map", group_graph_nodes(self.reqs_by_name, "parent_requirement_id"))
+        set_(self, "links_by_req", group_graph_nodes(self.fulfillments, "requirement_id"))
+        set_(self, "req_subs_by_req", group_graph_nodes(self.req_substitutions, "requirement_id"))
+        set_(self, "basket_by_id", {b.id: b for b in self.baskets})
+        set_(self, "baskets_by_req", group_graph_nodes(self.req_basket_links, "requirement_id"))
+        set_(self, "basket_items_by_basket", group_graph_nodes(self.basket_items, "basket_id"))
+        set_(
+            self,
+            "basket_course_ids_by_basket",
+            {key: tuple(item.course_id for item in items) for key, items in self.basket_items_by_basket.items()},
+        )
+        set_(self, "basket_subs_by_basket", group_graph_nodes(self.basket_substitutions, "basket_id"))
+        set_(self, "course_by_id", {c.id: c for c in self.courses})
+
+    def __setattr__(self, key, value):
+        raise AttributeError("CurriculumGraph is read-only")
+
+
+curriculum_graph_cache: dict[str, CurriculumGraph] = {}
+
+
+def get_curriculum_graph(version_id: str, db: Session) -> CurriculumGraph:
+    # Per-process cache, validated against the version's generation on every call so writes made by
+    # other workers are picked up. The generation is read before the tables, so a graph can only ever
+    # be newer than the generation it is filed under, never older.
+    # A session holding uncommitted changes to this version gets a private graph.
+    if db.new or db.dirty or db.deleted:
+        db.flush()
+    generation = version_generation(db, version_id)
+    pending = db.info.get("curriculum_graph_versions")
+    if pending is not None and (version_id in pending or None in pending):
+        return CurriculumGraph(version_id, db, generation)
+    graph = curriculum_graph_cache.get(version_id)
+    if graph is not None and graph.generation == generation:
+        return graph
+    graph = CurriculumGraph(version_id, db, generation)
+    curriculum_graph_cache[version_id] = graph
+    return graph
+
+
+def evict_curriculum_graphs(version_ids: set) -> None:
+    # Same-process fast path; other workers notice through the generation check.
+    if None in version_ids:
+        curriculum_graph_cache.clear()
+        return
+    for version_id in version_ids:
+        curriculum_graph_cache.pop(version_id, None)
+
+
+# Course-owned rows that carry a denormalized copy of their course's version_id, and the owning column.
+COURSE_VERSION_SCOPED_MODELS: dict[type, str] = {
+    CoursePrerequisite: "course_id",
+    CourseSubstitution: "original_course_id",
+    CourseBucketTag: "course_id",
+}
+
+
+@event.listens_for(Session, "before_flush")
+def stamp_course_version_ids(session: Session, _flush_context, _instances) -> None:
+    # Fills version_id from the owning course for new rows and rows whose course changed, so
+    # version-scoped readers can filter these tables by version_id in SQL.
+    pending: list[tuple[object, Optional[str]]] = []
+    for obj in [*session.new, *session.dirty]:
+        attr = COURSE_VERSION_SCOPED_MODELS.get(type(obj))
+        if attr is None:
+            continue
+        if obj.version_id is None or inspect(obj).attrs[attr].history.has_changes():
+            pending.append((obj, getattr(obj, attr)))
+    if not pending:
+        return
+    version_by_course = {obj.id: obj.version_id for obj in session.new if isinstance(obj, Course) and obj.id}
+    missing = {course_id for _obj, course_id in pending if course_id and course_id not in version_by_course}
+    if missing:
+        version_by_course.update(
+            execute_in_chunks(
+                session.connection(),
+                text("SELECT id, version_id FROM courses WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                "ids",
+                list(missing),
+            )
+        )
+    for obj, course_id in pending:
+        obj.version_id = version_by_course.get(course_id)
+
+
+# How each tracked model resolves to its version: its own column, or a parent row's version_id.
+# None means the row is shared by every version.
+VERSION_SCOPE_BY_MODEL: dict[type, Optional[tuple[Optional[str], str]]] = {
+    CurriculumVersion: (None, "id"),
+    Course: (None, "version_id"),
+    AcademicProgram: (None, "version_id"),
+    Requirement: (None, "version_id"),
+    CourseBasket: (None, "version_id"),
+    PlanItem: (None, "version_id"),
+    SuggestedCanvasSequence: (None, "version_id"),
+    Section: (None, "version_id"),
+    RequirementFulfillment: ("requirements", "requirement_id"),
+    RequirementSubstitution: ("requirements", "requirement_id"),
+    RequirementBasketLink: ("requirements", "requirement_id"),
+    CourseBasketItem: ("course_baskets", "basket_id"),
+    CourseBasketSubstitution: ("course_baskets", "basket_id"),
+    CoursePrerequisite: (None, "version_id"),
+    CourseSubstitution: (None, "version_id"),
+    CourseBucketTag: (None, "version_id"),
+    InstructorQualification: ("courses", "course_id"),
+    ValidationRule: None,
+    Instructor: None,
+    Classroom: None,
+}
+CURRICULUM_GRAPH_MODELS = (
+    AcademicProgram,
+    Requirement,
+    RequirementFulfillment,
+    RequirementSubstitution,
+    CourseBasket,
+    RequirementBasketLink,
+    CourseBasketItem,
+    CourseBasketSubstitution,
+    Course,
+    CoursePrerequisite,
+    CourseBucketTag,
+)
+VERSION_PARENT_MODELS = {"requirements": Requirement, "course_baskets": CourseBasket, "courses": Course}
+
+
+@event.listens_for(Session, "after_flush")
+def record_version_changes(session: Session, _flush_context) -> None:
+    # Bumps version_generations and appends to version_changes for every version this flush touched,
+    # in the same transaction. Also evicts those versions' cached curriculum graphs (None = all of them);
+    # they are evicted again after commit, so a graph built from pre-commit data never sticks.
+    changes: list[tuple[str, object, str]] = []
+    for op, objs in [("CREATE", session.new), ("UPDATE", session.dirty), ("DELETE", session.deleted)]:
+        for obj in objs:
+            if type(obj) not in VERSION_SCOPE_BY_MODEL:
+                continue
+            if op == "UPDATE" and not session.is_modified(obj, include_collections=False):
+                continue
+            changes.append((op, obj, type(obj).__name__))
+    if not changes:
+        return
+
+    def values(obj, attr: str) -> list:
+        return list(dict.fromkeys([getattr(obj, attr), *[x for x in inspect(obj).attrs[attr].history.deleted if x]]))
+
+    conn = session.connection()
+    # Parents touched in this flush resolve locally (deleted ones are already gone from the table).
+    parent_versions: dict[str, dict[str, str]] = {table: {} for table in VERSION_PARENT_MODELS}
+    for op, obj, _entity_type in changes:
+        for table, model in VERSION_PARENT_MODELS.items():
+            if isinstance(obj, model):
+                parent_versions[table][obj.id] = obj.version_id
+    wanted: dict[str, set[str]] = {table: set() for table in VERSION_PARENT_MODELS}
+    for op, obj, _entity_type in changes:
+        scope = VERSION_SCOPE_BY_MODEL[type(obj)]
+        if scope and scope[0]:
+            wanted[scope[0]].update(x for x in values(obj, scope[1]) if x and x not in parent_versions[scope[0]])
+    for table, ids in wanted.items():
+        if ids:
+            parent_versions[table].update(
+                execute_in_chunks(
+                    conn, text(f"SELECT id, version_id FROM {table} WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)), "ids", list(ids)
+                )
+            )
+    all_version_ids: Optional[list[str]] = None
+    rows: dict[tuple[str, str, str], str] = {}
+    graph_versions: set[Optional[str]] = set()
+    for op, obj, entity_type in changes:
+        scope = VERSION_SCOPE_BY_MODEL[type(obj)]
+        if scope is None:
+            if all_version_ids is None:
+                all_version_ids = [r[0] for r in conn.execute(text("SELECT id FROM curriculum_versions"))]
+            version_ids = list(all_version_ids)
+        elif scope[0] is None:
+            version_ids = [x for x in values(obj, scope[1]) if x]
+        else:
+            version_ids = [parent_versions[scope[0]].get(x) for x in values(obj, scope[1]) if x]
+        for version_id in version_ids:
+            if version_id:
+                rows.setdefault((version_id, entity_type, obj.id), op)
+        if isinstance(obj, CURRICULUM_GRAPH_MODELS):
+            graph_versions.update(version_ids or [None])
+    if graph_versions:
+        session.info.setdefault("curriculum_graph_versions", set()).update(graph_versions)
+        evict_curriculum_graphs(set(graph_versions))
+    if not rows:
+        return
+    now = datetime.utcnow()
+    version_ids = sorted({version_id for version_id, _entity_type, _entity_id in rows})
+    session.info.setdefault("pending_version_ids", set()).update(version_ids)
+    for version_id in version_ids:
+        conn.execute(
+            text(
+                """
+                INSERT INTO version_generations (version_id, generation, updated_at) VALUES (:version_id, 1, :now)
+                ON CONFLICT(version_id) DO UPDATE SET generation = generation + 1, updated_at = excluded.updated_at
+                """
+            ),
+            {"version_id": version_id, "now": now},
+        )
+    generations = dict(
+        execute_in_chunks(
+            conn,
+            text("SELECT version_id, generation FROM version_generations WHERE version_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            "ids",
+            version_ids,
+        )
+    )
+    conn.execute(
+        text(
+            """
+            INSERT INTO version_changes (version_id, generation, entity_type, entity_id, op, created_at)
+            VALUES (:version_id, :generation, :entity_type, :entity_id, :op, :created_at)
+            """
+        ),
+        [
+            {
+                "version_id": version_id,
+                "generation": generations[version_id],
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "op": op,
+                "created_at": now,
+            }
+            for (version_id, entity_type, entity_id), op in rows.items()
+        ],
+    )
+
+
+def version_generation(db: Session, version_id: str) -> int:
+    return int(db.scalar(select(VersionGeneration.generation).where(VersionGeneration.version_id == version_id)) or 0)
+
+
+@event.listens_for(Session, "after_commit")
+def evict_committed_curriculum_graphs(session: Session) -> None:
+    session.info.pop("pending_version_ids", None)
+    version_ids = session.info.pop("curriculum_graph_versions", None)
+    if version_ids:
+        evict_curriculum_graphs(version_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def forget_curriculum_graph_changes(session: Session, _previous_transaction) -> None:
+    session.info.pop("pending_version_ids", None)
+    version_ids = session.info.pop("curriculum_graph_versions", None)
+    if version_ids:
+        evict_curriculum_graphs(version_ids)
+
+
+def plain_row(instance) -> SimpleNamespace:
+    return SimpleNamespace(**serialize(instance))
+
+
+def load_feasibility_snapshot(version_id: str, db: Session, program_ids: Optional[set[str]] = None) -> dict:
+    # Plain-data copy of everything the feasibility engine reads, so it can be pickled to worker processes.
+    # With program_ids, only the core trees and those programs' trees (and their links) are included.
+    # Node codes number majors and minors across the whole version, so they are built before scoping.
+    graph = get_curriculum_graph(version_id, db)
+    reqs = graph.reqs
+    node_code_map = build_program_designer_code_map(reqs, graph.program_by_id)
+    if program_ids is not None:
+        keep_ids: set[str] = set()
+        stack = [
+            r
+            for r in graph.child_map.get(None, ())
+            if (r.program_id is None and (r.category or "").upper() == "CORE") or r.program_id in program_ids
+        ]
+        while stack:
+            r = stack.pop()
+            if r.id in keep_ids:
+                continue
+            keep_ids.add(r.id)
+            stack.extend(graph.child_map.get(r.id, ()))
+        reqs = [r for r in reqs if r.id in keep_ids]
+    req_ids = {r.id for r in reqs}
+    req_basket_links = [x for x in graph.req_basket_links if x.requirement_id in req_ids]
+    basket_ids = {x.basket_id for x in req_basket_links}
+    rules_with_cfg = [(r, r.cfg) for r in compiled_validation_rules(db) if r.domain != "cadet performance"]
+    return {
+        "version_id": version_id,
+        "programs": list(graph.programs),
+        "reqs": list(reqs),
+        "node_code_map": node_code_map,
+        "fulfillments": [x for x in graph.fulfillments if x.requirement_id in req_ids],
+        "req_basket_links": req_basket_links,
+        "basket_items": [x for x in graph.basket_items if x.basket_id in basket_ids],
+        "courses": list(graph.courses),
+        "prereqs": list(graph.prereqs),
+        "bucket_rows": list(graph.bucket_rows),
+        "rules_with_cfg": rules_with_cfg,
+    }
+
+
+def build_feasibility_engine(snapshot: dict) -> dict:
+    programs = snapshot["programs"]
+    reqs = snapshot["reqs"]
     req_by_id = {r.id: r for r in reqs}
     program_by_id = {p.id: p for p in programs}
-    node_code_map = build_program_designer_code_map(reqs, program_by_id)
+    node_code_map = snapshot["node_code_map"]
     child_map: dict[Optional[str], list[Requirement]] = {}
     for r in reqs:
         child_map.setdefault(r.parent_requirement_id, []).append(r)
-    fulfillments = db.scalars(select(RequirementFulfillment).where(RequirementFulfillment.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
+    fulfillments = snapshot["fulfillments"]
     links_by_req: dict[str, list[RequirementFulfillment]] = {}
     for f in fulfillments:
         links_by_req.setdefault(f.requirement_id, []).append(f)
-    req_basket_links = (
-        db.scalars(select(RequirementBasketLink).where(RequirementBasketLink.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    )
-    basket_ids = [x.basket_id for x in req_basket_links]
-    basket_items = db.scalars(select(CourseBasketItem).where(CourseBasketItem.basket_id.in_(basket_ids))).all() if basket_ids else []
     basket_course_ids_by_basket: dict[str, list[str]] = {}
-    for item in basket_items:
+    for item in snapshot["basket_items"]:
         basket_course_ids_by_basket.setdefault(item.basket_id, []).append(item.course_id)
     baskets_by_req: dict[str, list[RequirementBasketLink]] = {}
-    for bl in req_basket_links:
+    for bl in snapshot["req_basket_links"]:
         baskets_by_req.setdefault(bl.requirement_id, []).append(bl)
-    courses = db.scalars(select(Course).where(Course.version_id == version_id)).all()
+    courses = snapshot["courses"]
     course_by_id = {c.id: c for c in courses}
     course_id_by_number = {normalize_course_number(c.course_number): c.id for c in courses}
-    prereqs = db.scalars(select(CoursePrerequisite).where(CoursePrerequisite.course_id.in_([c.id for c in courses]))).all() if courses else []
-    req_sub_rows = (
-        db.scalars(select(RequirementSubstitution).where(RequirementSubstitution.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    )
-    sub_map: dict[str, dict[str, set[str]]] = {}
-    for s in req_sub_rows:
-        m = sub_map.setdefault(s.requirement_id, {})
-        m.setdefault(s.primary_course_id, set()).add(s.substitute_course_id)
-        if s.is_bidirectional:
-            m.setdefault(s.substitute_course_id, set()).add(s.primary_course_id)
-    bucket_rows = db.scalars(select(CourseBucketTag).where(CourseBucketTag.course_id.in_([c.id for c in courses]))).all() if courses else []
-    rules = []
-    rules_with_cfg: list[tuple[ValidationRule, dict]] = []
-    for r in db.scalars(select(ValidationRule).where(ValidationRule.active.is_(True))).all():
-        try:
-            cfg = json.loads(r.config_json or "{}")
-        except Exception:
-            cfg = {}
-        cfg = cfg if isinstance(cfg, dict) else {}
-        if is_cadet_performance_rule(cfg):
-            continue
-        rules.append(r)
-        rules_with_cfg.append((r, cfg))
+    course_index = build_course_bit_index(courses)
+    prereqs = snapshot["prereqs"]
+    bucket_rows = snapshot["bucket_rows"]
+    rules_with_cfg: list[tuple[CompiledRule, dict]] = snapshot["rules_with_cfg"]
+    rules = [r for r, _cfg in rules_with_cfg]
     max_credits_per_semester = 21.0
     max_credits_per_summer_period = 9.0
     for rule in rules:
-        try:
-            cfg = json.loads(rule.config_json or "{}")
-        except Exception:
-            cfg = {}
-        t = str(cfg.get("type") or "").upper()
-        if t not in {"MAX_CREDITS_PER_SEMESTER", "SEMESTER_CREDIT_CAP"}:
+        if rule.type not in {"MAX_CREDITS_PER_SEMESTER", "SEMESTER_CREDIT_CAP"}:
             continue
         for key in ["max_credits_per_semester", "max_credits", "cap", "value"]:
-            raw = cfg.get(key)
-            if raw is None:
-                continue
-            try:
-                cap = float(raw)
-            except Exception:
-                continue
-            if cap > 0:
+            cap = rule.param(float, None, key)
+            if cap is not None and cap > 0:
                 max_credits_per_semester = min(max_credits_per_semester, cap)
         for key in ["max_credits_per_summer_period", "max_summer_credits", "summer_cap"]:
-            raw = cfg.get(key)
-            if raw is None:
-                continue
-            try:
-                cap = float(raw)
-            except Exception:
-                continue
-            if cap > 0:
+            cap = rule.param(float, None, key)
+            if cap is not None and cap > 0:
                 max_credits_per_summer_period = min(max_credits_per_summer_period, cap)
 
-    req_name_map: dict[str, list[Requirement]] = {}
-    for r in reqs:
-        req_name_map.setdefault((r.name or "").strip().lower(), []).append(r)
-
-    req_names_sorted = sorted(
-        [(r.name or "", r.id) for r in reqs if (r.name or "").strip()],
-        key=lambda x: len(x[0]),
-        reverse=True,
-    )
-
-    def infer_node_code_from_message(msg: str) -> str:
-        text_msg = str(msg or "").lower()
-        for req_name, req_id in req_names_sorted:
-            if req_name and req_name.lower() in text_msg:
-                return node_code_map.get(req_id, "")
-        return ""
+    # Issues and constraints are records that carry their provenance from the point they are raised,
+    # so callers can index them by requirement node, course or rule without parsing the message.
+    # node_codes lines up with requirement_ids and comes from the version-wide map in the snapshot.
+    def make_issue(
+        message: str,
+        *,
+        requirement_ids: tuple[str, ...] = (),
+        course_ids: tuple[str, ...] = (),
+        program_id: Optional[str] = None,
+        rule_code: Optional[str] = None,
+    ) -> dict:
+        requirement_ids = list(dict.fromkeys(rid for rid in requirement_ids if rid))
+        return {
+            "message": message,
+            "requirement_ids": requirement_ids,
+            "node_codes": [node_code_map.get(rid, "") for rid in requirement_ids],
+            "course_ids": list(dict.fromkeys(course_ids)),
+            "program_id": program_id,
+            "rule_code": rule_code,
+        }
 
     # Find active Core Rules keyed by target program.
-    core_rules_by_program_id: dict[str, list[dict]] = {}
-    core_rules_by_program_name: dict[str, list[dict]] = {}
+    core_rules_by_program_id: dict[str, list[tuple[CompiledRule, dict]]] = {}
+    core_rules_by_program_name: dict[str, list[tuple[CompiledRule, dict]]] = {}
     for rule in rules:
-        try:
-            cfg = json.loads(rule.config_json or "{}")
-        except Exception:
-            cfg = {}
-        if str(cfg.get("type") or "").upper() not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
+        if rule.type not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
             continue
-        groups = cfg.get("required_core_groups") or []
+        cfg = rule.cfg
+        groups = rule.core_groups
         if cfg.get("program_id"):
-            core_rules_by_program_id.setdefault(cfg["program_id"], []).extend(groups)
+            core_rules_by_program_id.setdefault(cfg["program_id"], []).extend((rule, g) for g in groups)
         if str(cfg.get("program_name") or "").strip():
-            core_rules_by_program_name.setdefault(str(cfg["program_name"]).strip().lower(), []).extend(groups)
+            core_rules_by_program_name.setdefault(str(cfg["program_name"]).strip().lower(), []).extend((rule, g) for g in groups)
 
-    def evaluate_requirement(req_id: str) -> dict:
-        def is_upper_level_course(cid: str) -> int:
-            c = course_by_id.get(cid)
-            if not c:
-                return 0
-            m = re.search(r"(\d{3})", str(c.course_number or ""))
-            if not m:
-                return 0
-            try:
-                return 1 if int(m.group(1)) >= 300 else 0
-            except Exception:
-                return 0
+    course_levels = course_level_map(courses)
+    upper_level_flag_by_course = {cid: 1 if (level or 0) >= 300 else 0 for cid, level in course_levels.items()}
+
+    def is_upper_level_course(cid: str) -> int:
+        return upper_level_flag_by_course.get(cid, 0)
 
+    # Requirement subtrees are shared by every combo that includes their program (and by all
+    # combos for core), so each node is evaluated once per request and reused read-only.
+    requirement_eval_cache: dict[str, dict] = {}
+
+    def evaluate_requirement(req_id: str) -> dict:
+        cached = requirement_eval_cache.get(req_id)
+        if cached is not None:
+            return cached
         req = req_by_id[req_id]
         children = child_map.get(req_id, [])
         child_results = [evaluate_requirement(c.id) for c in children]
         links = links_by_req.get(req_id, [])
-        issues: list[str] = []
+        issues: list[dict] = []
         own_issues: list[str] = []
-        constraints = []
-        mandatory_courses = set()
+        constraints: list[dict] = []
+        mandatory_courses = 0
         min_credit_lb = 0.0
         min_upper_lb = 0.0
         max_upper_ub = 0.0
@@ -6461,12 +7528,13 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             c = course_by_id.get(link.course_id)
             credit = float(c.credit_hours if c else 0.0)
             upper_flag = is_upper_level_course(link.course_id)
+            link_mask = course_mask(course_index, [link.course_id])
             units.append(
                 {
                     "label": c.course_number if c else link.course_id,
                     "type": "course",
-                    "course_ids": [link.course_id],
-                    "mandatory_courses": {link.course_id},
+                    "course_mask": link_mask,
+                    "mandatory_courses": link_mask,
                     "min_credit_lb": credit,
                     "min_upper_lb": float(upper_flag),
                     "available_count": 1,
@@ -6487,8 +7555,8 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                 {
                     "label": f"Basket ({needed} of {len(basket_course_ids)})",
                     "type": "basket",
-                    "course_ids": basket_course_ids,
-                    "mandatory_courses": set(),
+                    "course_mask": course_mask(course_index, basket_course_ids),
+                    "mandatory_courses": 0,
                     "min_credit_lb": basket_min_credit,
                     "min_upper_lb": basket_min_upper,
                     "max_upper_ub": basket_max_upper,
@@ -6503,8 +7571,8 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                 {
                     "label": child_req.name,
                     "type": "requirement",
-                    "course_ids": list(child_eval["all_courses"]),
-                    "mandatory_courses": set(child_eval["mandatory_courses"]),
+                    "course_mask": child_eval["all_courses"],
+                    "mandatory_courses": child_eval["mandatory_courses"],
                     "min_credit_lb": float(child_eval["min_credit_lb"]),
                     "min_upper_lb": float(child_eval.get("min_upper_lb") or 0.0),
                     "max_upper_ub": float(child_eval.get("max_upper_ub") or 0.0),
@@ -6515,7 +7583,7 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             )
             issues.extend(child_eval["issues"])
             constraints.extend(child_eval["constraints"])
-            mandatory_courses |= set(child_eval["always_mandatory_courses"])
+            mandatory_courses |= child_eval["always_mandatory_courses"]
         logic = (req.logic_type or "ALL_REQUIRED").upper()
         available = sum(max(0, int(u.get("available_count") or 0)) for u in units)
         credit_pool: list[float] = []
@@ -6541,7 +7609,7 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                 min_credit_lb += sum(credit_pool[:needed])
                 min_upper_lb += sum(upper_pool[:needed]) if len(upper_pool) >= needed else 0.0
                 max_upper_ub += sum(sorted(upper_pool, reverse=True)[:needed]) if len(upper_pool) >= needed else 0.0
-            constraints.append(f"{req.name}: option slot requires {needed} choice(s) of {available}.")
+            constraints.append(make_issue(f"{req.name}: option slot requires {needed} choice(s) of {available}.", requirement_ids=(req.id,)))
         elif logic in {"PICK_N", "ANY_N"}:
             needed = max(1, int(req.pick_n or 1))
             if available < needed or len(credit_pool) < needed:
@@ -6550,7 +7618,7 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                 min_credit_lb += sum(credit_pool[:needed])
                 min_upper_lb += sum(upper_pool[:needed]) if len(upper_pool) >= needed else 0.0
                 max_upper_ub += sum(sorted(upper_pool, reverse=True)[:needed]) if len(upper_pool) >= needed else 0.0
-            constraints.append(f"{req.name}: choose {needed} of {available}.")
+            constraints.append(make_issue(f"{req.name}: choose {needed} of {available}.", requirement_ids=(req.id,)))
         elif logic in {"ANY_ONE", "ONE_OF"}:
             if available < 1 or len(credit_pool) < 1:
                 own_issues.append("Requires one option but none defined.")
@@ -6558,11 +7626,11 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                 min_credit_lb += credit_pool[0]
                 min_upper_lb += upper_pool[0] if upper_pool else 0.0
                 max_upper_ub += max(upper_pool) if upper_pool else 0.0
-            constraints.append(f"{req.name}: choose 1 of {available}.")
+            constraints.append(make_issue(f"{req.name}: choose 1 of {available}.", requirement_ids=(req.id,)))
         else:
             if not units:
                 own_issues.append("No linked courses/subrequirements defined.")
-            use_overlap_lb = str(req.name or "").strip().lower() == "major - basic sciences"
+            basic_sciences_floor = str(req.name or "").strip().lower() == "major - basic sciences"
             mandatory_lb_sum = 0.0
             mandatory_upper_lb_sum = 0.0
             optional_units: list[dict] = []
@@ -6572,93 +7640,41 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                         own_issues.append(
                             f"{u['label']} has fewer available courses than required ({u.get('available_count', 0)}<{u.get('min_count', 1)})."
                         )
-                mandatory_courses |= set(u["mandatory_courses"])
-                if (not use_overlap_lb) or u["mandatory_courses"]:
+                mandatory_courses |= u["mandatory_courses"]
+                if u["mandatory_courses"]:
                     mandatory_lb_sum += float(u["min_credit_lb"])
                     mandatory_upper_lb_sum += float(u.get("min_upper_lb") or 0.0)
                     max_upper_ub += float(u.get("max_upper_ub", u.get("min_upper_lb") or 0.0))
                 else:
                     optional_units.append(u)
-                if u["type"] == "requirement":
-                    mandatory_courses |= set(u["mandatory_courses"])
-            if use_overlap_lb:
-                # Overlap-aware lower bound for layered Basic Sciences constraints:
-                # if option pools overlap heavily, summing each unit overcounts.
-                # For connected overlap components, use the strongest single lower bound.
-                optional_lb_sum = 0.0
-                used: set[int] = set()
-                for i, seed in enumerate(optional_units):
-                    if i in used:
-                        continue
-                    seed_courses = set(seed.get("course_ids") or [])
-                    if not seed_courses:
-                        optional_lb_sum += float(seed.get("min_credit_lb") or 0.0)
-                        used.add(i)
-                        continue
-                    comp = [i]
-                    used.add(i)
-                    queue = [i]
-                    while queue:
-                        k = queue.pop(0)
-                        k_courses = set(optional_units[k].get("course_ids") or [])
-                        for j, cand in enumerate(optional_units):
-                            if j in used:
-                                continue
-                            c_courses = set(cand.get("course_ids") or [])
-                            if not c_courses:
-                                continue
-                            if k_courses & c_courses:
-                                used.add(j)
-                                queue.append(j)
-                                comp.append(j)
-                    comp_lb = 0.0
-                    for idx in comp:
-                        comp_lb = max(comp_lb, float(optional_units[idx].get("min_credit_lb") or 0.0))
-                    optional_lb_sum += comp_lb
+            # Overlap-aware lower bound: option pools that share courses can be satisfied by the same
+            # courses, so summing each unit overcounts. Each connected overlap component contributes
+            # only its strongest single bound; non-overlapping units still add up as before.
+            optional_lb_sum = 0.0
+            optional_upper_lb_sum = 0.0
+            optional_upper_ub_sum = 0.0
+            for comp in overlap_components([u["course_mask"] for u in optional_units]):
+                optional_lb_sum += max(float(optional_units[i].get("min_credit_lb") or 0.0) for i in comp)
+                optional_upper_lb_sum += max(float(optional_units[i].get("min_upper_lb") or 0.0) for i in comp)
+                optional_upper_ub_sum += sum(
+                    float(optional_units[i].get("max_upper_ub", optional_units[i].get("min_upper_lb") or 0.0)) for i in comp
+                )
+            if basic_sciences_floor:
                 # COI major guidance indicates a 36-semester-hour major floor for Basic Sciences.
                 min_credit_lb += mandatory_lb_sum + max(optional_lb_sum, 36.0)
-                optional_upper_lb_sum = 0.0
-                used_up: set[int] = set()
-                for i, seed in enumerate(optional_units):
-                    if i in used_up:
-                        continue
-                    seed_courses = set(seed.get("course_ids") or [])
-                    if not seed_courses:
-                        optional_upper_lb_sum += float(seed.get("min_upper_lb") or 0.0)
-                        used_up.add(i)
-                        continue
-                    comp = [i]
-                    used_up.add(i)
-                    queue = [i]
-                    while queue:
-                        k = queue.pop(0)
-                        k_courses = set(optional_units[k].get("course_ids") or [])
-                        for j, cand in enumerate(optional_units):
-                            if j in used_up:
-                                continue
-                            c_courses = set(cand.get("course_ids") or [])
-                            if not c_courses:
-                                continue
-                            if k_courses & c_courses:
-                                used_up.add(j)
-                                queue.append(j)
-                                comp.append(j)
-                    comp_upper_lb = 0.0
-                    for idx in comp:
-                        comp_upper_lb = max(comp_upper_lb, float(optional_units[idx].get("min_upper_lb") or 0.0))
-                    optional_upper_lb_sum += comp_upper_lb
                 min_upper_lb += mandatory_upper_lb_sum + optional_upper_lb_sum
                 # Conservative upper bound for layered Basic Sciences constraints.
                 max_upper_ub += mandatory_upper_lb_sum + optional_upper_lb_sum
             else:
-                min_credit_lb += mandatory_lb_sum
-                min_upper_lb += mandatory_upper_lb_sum
-        issues.extend(own_issues)
-        all_courses = set()
+                min_credit_lb += mandatory_lb_sum + optional_lb_sum
+                min_upper_lb += mandatory_upper_lb_sum + optional_upper_lb_sum
+                max_upper_ub += optional_upper_ub_sum
+        issues.extend(make_issue(msg, requirement_ids=(req.id,)) for msg in own_issues)
+        all_courses = 0
         for u in units:
-            all_courses |= set(u["course_ids"])
+            all_courses |= u["course_mask"]
         # always_mandatory_courses excludes optional parent-choice units
-        always_mandatory_courses = set(mandatory_courses if logic == "ALL_REQUIRED" else set())
+        always_mandatory_courses = mandatory_courses if logic == "ALL_REQUIRED" else 0
         child_consistency_nodes = [c["consistency_node"] for c in child_results]
         node_status = "INCONSISTENT" if own_issues or any(x.get("status") == "INCONSISTENT" for x in child_consistency_nodes) else "CONSISTENT"
         consistency_node = {
@@ -6671,7 +7687,7 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             "message": " | ".join(own_issues) if own_issues else "",
             "children": child_consistency_nodes,
         }
-        return {
+        result = {
             "issues": issues,
             "constraints": constraints,
             "mandatory_courses": mandatory_courses,
@@ -6682,55 +7698,273 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             "max_upper_ub": max_upper_ub,
             "consistency_node": consistency_node,
         }
+        requirement_eval_cache[req_id] = result
+        return result
 
-    def gather_program_requirement_courses(program_id: str) -> tuple[set[str], float, float, float]:
-        top_program_reqs = [r for r in reqs if r.program_id == program_id and r.parent_requirement_id is None]
-        out_courses: set[str] = set()
+    top_level_reqs = [r for r in reqs if r.parent_requirement_id is None]
+    top_reqs_by_program: dict[str, list[Requirement]] = {}
+    for r in top_level_reqs:
+        if r.program_id:
+            top_reqs_by_program.setdefault(r.program_id, []).append(r)
+    program_summary_cache: dict[str, tuple[int, float, float, float]] = {}
+
+    def gather_program_requirement_courses(program_id: str) -> tuple[int, float, float, float]:
+        cached = program_summary_cache.get(program_id)
+        if cached is not None:
+            return cached
+        out_courses = 0
         out_credits = 0.0
         out_upper_lb = 0.0
         out_upper_ub = 0.0
-        for tr in top_program_reqs:
+        for tr in top_reqs_by_program.get(program_id, []):
             ev = evaluate_requirement(tr.id)
-            out_courses |= set(ev["all_courses"])
+            out_courses |= ev["all_courses"]
             out_credits += float(ev["min_credit_lb"])
             out_upper_lb += float(ev.get("min_upper_lb") or 0.0)
             out_upper_ub += float(ev.get("max_upper_ub") or 0.0)
-        return out_courses, out_credits, out_upper_lb, out_upper_ub
-
-    def evaluate_combo(combo_programs: list[AcademicProgram], kind: str, label: str) -> dict:
-        issues: list[str] = []
-        constraints: list[str] = []
-        selected_ids = {p.id for p in combo_programs}
-        top_reqs = []
-        for r in reqs:
-            if r.parent_requirement_id is not None:
+        program_summary_cache[program_id] = (out_courses, out_credits, out_upper_lb, out_upper_ub)
+        return program_summary_cache[program_id]
+
+    # Everything below is identical for every combo, so it is resolved once per request.
+    pathway_definitions = get_pathway_definitions(rules_with_cfg)
+    prereq_groups_by_course: dict[str, list[tuple[dict, int, list[tuple[CoursePrerequisite, int]]]]] = {}
+    for g in prerequisite_constraint_groups(prereqs):
+        gap = 0 if g["relationship_type"] == "COREQUISITE" else 1
+        prereq_groups_by_course.setdefault(g["course_id"], []).append(
+            (g, gap, [(p, course_mask(course_index, [p.required_course_id])) for p in g["items"]])
+        )
+    requirement_scope_by_id: dict[str, Optional[str]] = {}
+    for r in reqs:
+        if r.program_id is None and (r.category or "").upper() == "CORE":
+            requirement_scope_by_id[r.id] = "__CORE__"
+        elif r.program_id:
+            requirement_scope_by_id[r.id] = r.program_id
+    timed_fulfillments_by_scope: dict[str, list[tuple[int, str, tuple[Optional[int], Optional[int], Optional[int], str, str]]]] = {}
+    for idx, rf in enumerate(fulfillments):
+        scope = requirement_scope_by_id.get(rf.requirement_id)
+        if scope is None:
+            continue
+        if rf.required_semester is None and rf.required_semester_min is None and rf.required_semester_max is None:
+            continue
+        req = req_by_id.get(rf.requirement_id)
+        src = req.name if req else "Requirement"
+        timed_fulfillments_by_scope.setdefault(scope, []).append(
+            (idx, rf.course_id, (rf.required_semester, rf.required_semester_min, rf.required_semester_max, src, rf.requirement_id))
+        )
+    core_timing_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int]]]] = {}
+    for _idx, cid, window in timed_fulfillments_by_scope.get("__CORE__", []):
+        core_timing_by_course.setdefault(cid, []).append(window[:3])
+
+    def parse_core_rule_window(g: dict) -> tuple[Optional[int], Optional[int], Optional[int]]:
+        rs = g.get("required_semester")
+        rs_min = g.get("required_semester_min")
+        rs_max = g.get("required_semester_max")
+        try:
+            rs = int(rs) if rs is not None else None
+        except Exception:
+            rs = None
+        try:
+            rs_min = int(rs_min) if rs_min is not None else None
+        except Exception:
+            rs_min = None
+        try:
+            rs_max = int(rs_max) if rs_max is not None else None
+        except Exception:
+            rs_max = None
+        return rs, rs_min, rs_max
+
+    core_rule_summary_cache: dict[str, dict] = {}
+
+    def core_rule_summary(p: AcademicProgram) -> dict:
+        cached = core_rule_summary_cache.get(p.id)
+        if cached is not None:
+            return cached
+        out_issues: list[dict] = []
+        out_constraints: list[dict] = []
+        out_windows: list[tuple[str, tuple[Optional[int], Optional[int], Optional[int], str]]] = []
+        groups = []
+        groups.extend(core_rules_by_program_id.get(p.id, []))
+        groups.extend(core_rules_by_program_name.get((p.name or "").strip().lower(), []))
+        for idx, (rule, g) in enumerate(groups):
+            g = g or {}
+            rule_code = str(rule.rule_code or "").strip() or None
+            group_name = str(g.get("name") or f"Core Rule {idx + 1}").strip()
+            rs, rs_min, rs_max = parse_core_rule_window(g)
+            nums = [normalize_course_number(str(x)) for x in (g.get("course_numbers") or []) if str(x).strip()]
+            if rs is not None or rs_min is not None or rs_max is not None:
+                for num in nums:
+                    cid = course_id_by_number.get(num)
+                    if cid:
+                        out_windows.append((cid, (rs, rs_min, rs_max, f"{p.name} - {group_name}")))
+            min_count = max(1, int(g.get("min_count") or 1))
+            cids = [course_id_by_number[n] for n in nums if n in course_id_by_number]
+            if not cids:
+                out_issues.append(make_issue(f"{p.name} - {group_name}: no resolvable courses.", program_id=p.id, rule_code=rule_code))
                 continue
+            viable = 0
+            for cid in cids:
+                core_windows = core_timing_by_course.get(cid, [])
+                if rs is None and rs_min is None and rs_max is None:
+                    viable += 1
+                    continue
+                if not core_windows:
+                    viable += 1
+                    continue
+                if any(timing_constraints_overlap(rs, rs_min, rs_max, cw[0], cw[1], cw[2]) for cw in core_windows):
+                    viable += 1
+            if viable < min_count:
+                out_issues.append(
+                    make_issue(
+                        f"{p.name} - {group_name}: timing leaves only {viable} viable choices, needs {min_count}.",
+                        course_ids=tuple(cids),
+                        program_id=p.id,
+                        rule_code=rule_code,
+                    )
+                )
+            sem_parts = []
+            if rs is not None:
+                sem_parts.append(period_short_label(rs))
+            if rs_min is not None:
+                sem_parts.append(f">={period_short_label(rs_min)}")
+            if rs_max is not None:
+                sem_parts.append(f"<={period_short_label(rs_max)}")
+            if sem_parts:
+                out_constraints.append(
+                    make_issue(
+                        f"{p.name} - {group_name}: must satisfy {' ,'.join(sem_parts)}.",
+                        course_ids=tuple(cids),
+                        program_id=p.id,
+                        rule_code=rule_code,
+                    )
+                )
+        core_rule_summary_cache[p.id] = {"issues": out_issues, "constraints": out_constraints, "windows": out_windows}
+        return core_rule_summary_cache[p.id]
+
+    total_credit_capacity = (max_credits_per_semester * float(len(ACADEMIC_PERIODS))) + (
+        max_credits_per_summer_period * float(len(SUMMER_PERIODS))
+    )
+    residency_hours_rule, residency_hours_cfg = find_active_rule(
+        rules_with_cfg,
+        rule_type="RESIDENCY_MIN_HOURS",
+        names=["Residency minimum in-residence hours", "COI residency requirements"],
+    )
+    residency_min_hours = rule_param(
+        residency_hours_rule, float, DEFAULT_RESIDENCY_MIN_HOURS, "min_hours", "minimum_in_residence_hours"
+    )
+    residency_applies_pf = rule_applies_to_context(residency_hours_cfg, "PROGRAM_FEASIBILITY")
+    program_feasibility_bucket_rules = [
+        (rule, cfg)
+        for rule, cfg in rules_with_cfg
+        if str(rule_domain(cfg) or "").strip().lower() != "non-academic graduation"
+    ]
+    gate_rule, _gate_cfg = find_active_rule(
+        rules_with_cfg,
+        rule_type="PROGRAM_FEASIBILITY_GATE",
+        names=["Program feasibility gate"],
+    )
+
+    def combo_top_reqs(selected_ids: set[str]) -> list[Requirement]:
+        top_reqs = []
+        for r in top_level_reqs:
             if r.program_id is None and (r.category or "").upper() == "CORE":
                 top_reqs.append(r)
             elif r.program_id in selected_ids:
                 top_reqs.append(r)
-        mandatory = set()
-        all_courses = set()
+        return top_reqs
+
+    def combo_timing(selected_ids: set[str]) -> tuple[dict[str, list[tuple[Optional[int], Optional[int], Optional[int], str, str]]], list[dict]]:
+        timing_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int], str, str]]] = {}
+        clashes: list[dict] = []
+        scoped_timed = list(timed_fulfillments_by_scope.get("__CORE__", []))
+        for pid in selected_ids:
+            scoped_timed.extend(timed_fulfillments_by_scope.get(pid, []))
+        scoped_timed.sort(key=lambda x: x[0])
+        for _idx, cid, window in scoped_timed:
+            timing_by_course.setdefault(cid, []).append(window)
+        for cid, windows in timing_by_course.items():
+            for i in range(len(windows)):
+                for j in range(i + 1, len(windows)):
+                    a = windows[i]
+                    b = windows[j]
+                    if not timing_constraints_overlap(a[0], a[1], a[2], b[0], b[1], b[2]):
+                        cnum = course_by_id.get(cid).course_number if course_by_id.get(cid) else cid
+                        clashes.append(
+                            make_issue(
+                                f"{cnum}: timing clash between '{a[3]}' and '{b[3]}'.",
+                                requirement_ids=(a[4], b[4]),
+                                course_ids=(cid,),
+                            )
+                        )
+        return timing_by_course, clashes
+
+    def credit_capacity_issue(min_credit_lb: float) -> Optional[dict]:
+        if min_credit_lb <= total_credit_capacity:
+            return None
+        return make_issue(
+            f"Minimum required credits {min_credit_lb:.1f} exceeds total period capacity {total_credit_capacity:.1f} "
+            f"({max_credits_per_semester:.1f} x {len(ACADEMIC_PERIODS)} academic, "
+            f"{max_credits_per_summer_period:.1f} x {len(SUMMER_PERIODS)} summer)."
+        )
+
+    def consistency_summary(consistency_roots: list[dict]) -> tuple[list[dict], list[dict], int, int]:
+        if not consistency_roots:
+            consistency_roots = [
+                {
+                    "requirement_id": "none",
+                    "node_code": "",
+                    "name": "Program Rules",
+                    "status": "CONSISTENT",
+                    "message": "",
+                    "children": [],
+                }
+            ]
+        consistency_items = []
+        def flatten_consistency(nodes: list[dict], depth: int = 0):
+            for n in nodes or []:
+                consistency_items.append(
+                    {
+                        "node_code": n.get("node_code", ""),
+                        "name": n.get("name", ""),
+                        "status": n.get("status", "CONSISTENT"),
+                        "message": n.get("message", ""),
+                        "depth": depth,
+                    }
+                )
+                flatten_consistency(n.get("children") or [], depth + 1)
+        flatten_consistency(consistency_roots)
+        consistency_fail_count = sum(1 for x in consistency_items if x.get("status") == "INCONSISTENT")
+        consistency_pass_count = sum(1 for x in consistency_items if x.get("status") == "CONSISTENT")
+        return consistency_roots, consistency_items, consistency_pass_count, consistency_fail_count
+
+    def evaluate_combo(combo_programs: list[AcademicProgram], kind: str, label: str) -> dict:
+        if len(combo_programs) > 2:
+            for pair in itertools.combinations(combo_programs, 2):
+                pair_issues = pair_prune_issues(pair)
+                if pair_issues:
+                    return pruned_combo_row(combo_programs, kind, label, pair, pair_issues)
+        issues: list[dict] = []
+        constraints: list[dict] = []
+        selected_ids = {p.id for p in combo_programs}
+        mandatory = 0
         min_credit_lb = 0.0
         consistency_roots = []
-        for tr in top_reqs:
+        for tr in combo_top_reqs(selected_ids):
             e = evaluate_requirement(tr.id)
             issues.extend(e["issues"])
             constraints.extend(e["constraints"])
-            mandatory |= set(e["always_mandatory_courses"])
-            all_courses |= set(e["all_courses"])
+            mandatory |= e["always_mandatory_courses"]
             min_credit_lb += float(e["min_credit_lb"])
             consistency_roots.append(e["consistency_node"])
+        mandatory_ids = mask_course_ids(course_index, mandatory)
 
         # Program/major pathway validation checks.
-        pathway_definitions = get_pathway_definitions(rules_with_cfg)
-        pathway_program_course_sets: dict[str, set[str]] = {}
+        pathway_program_course_sets: dict[str, int] = {}
         pathway_program_credit_sums: dict[str, float] = {}
         pathway_program_upper_lbs: dict[str, float] = {}
         pathway_program_upper_ubs: dict[str, float] = {}
         for p in combo_programs:
             pcs, pcredits, pupper_lb, pupper_ub = gather_program_requirement_courses(p.id)
-            pathway_program_course_sets[p.id] = set(pcs)
+            pathway_program_course_sets[p.id] = pcs
             pathway_program_credit_sums[p.id] = float(pcredits)
             pathway_program_upper_lbs[p.id] = float(pupper_lb)
             pathway_program_upper_ubs[p.id] = float(pupper_ub)
@@ -6739,125 +7973,27 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             programs=combo_programs,
             program_course_sets=pathway_program_course_sets,
             program_credit_sums=pathway_program_credit_sums,
-            course_by_id=course_by_id,
+            course_index=course_index,
             definitions=pathway_definitions,
             program_upper_lbs=pathway_program_upper_lbs,
             program_upper_ubs=pathway_program_upper_ubs,
+            course_levels=course_levels,
         )
 
         # Requirement timing windows and clashes.
-        timing_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int], str]]] = {}
-        scoped_req_ids = {r.id for r in reqs if (r.program_id is None and (r.category or "").upper() == "CORE") or r.program_id in selected_ids}
-        for rf in fulfillments:
-            if rf.requirement_id not in scoped_req_ids:
-                continue
-            if rf.required_semester is None and rf.required_semester_min is None and rf.required_semester_max is None:
-                continue
-            req = req_by_id.get(rf.requirement_id)
-            src = req.name if req else "Requirement"
-            timing_by_course.setdefault(rf.course_id, []).append((rf.required_semester, rf.required_semester_min, rf.required_semester_max, src))
-        for cid, windows in timing_by_course.items():
-            for i in range(len(windows)):
-                for j in range(i + 1, len(windows)):
-                    a = windows[i]
-                    b = windows[j]
-                    if not timing_constraints_overlap(a[0], a[1], a[2], b[0], b[1], b[2]):
-                        cnum = course_by_id.get(cid).course_number if course_by_id.get(cid) else cid
-                        issues.append(f"{cnum}: timing clash between '{a[3]}' and '{b[3]}'.")
+        timing_by_course, timing_clashes = combo_timing(selected_ids)
+        issues.extend(timing_clashes)
 
         # Core Rules compatibility (with core timing) and constraints.
-        core_req_ids = {r.id for r in reqs if (r.program_id is None and (r.category or "").upper() == "CORE")}
-        core_timing_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int]]]] = {}
-        for rf in fulfillments:
-            if rf.requirement_id not in core_req_ids:
-                continue
-            if rf.required_semester is None and rf.required_semester_min is None and rf.required_semester_max is None:
-                continue
-            core_timing_by_course.setdefault(rf.course_id, []).append((rf.required_semester, rf.required_semester_min, rf.required_semester_max))
+        core_rule_windows_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int], str]]] = {}
         for p in combo_programs:
-            groups = []
-            groups.extend(core_rules_by_program_id.get(p.id, []))
-            groups.extend(core_rules_by_program_name.get((p.name or "").strip().lower(), []))
-            for idx, g in enumerate(groups):
-                g = g or {}
-                group_name = str(g.get("name") or f"Core Rule {idx + 1}").strip()
-                min_count = max(1, int(g.get("min_count") or 1))
-                rs = g.get("required_semester")
-                rs_min = g.get("required_semester_min")
-                rs_max = g.get("required_semester_max")
-                try:
-                    rs = int(rs) if rs is not None else None
-                except Exception:
-                    rs = None
-                try:
-                    rs_min = int(rs_min) if rs_min is not None else None
-                except Exception:
-                    rs_min = None
-                try:
-                    rs_max = int(rs_max) if rs_max is not None else None
-                except Exception:
-                    rs_max = None
-                nums = [normalize_course_number(str(x)) for x in (g.get("course_numbers") or []) if str(x).strip()]
-                cids = [course_id_by_number[n] for n in nums if n in course_id_by_number]
-                if not cids:
-                    issues.append(f"{p.name} - {group_name}: no resolvable courses.")
-                    continue
-                viable = 0
-                for cid in cids:
-                    core_windows = core_timing_by_course.get(cid, [])
-                    if rs is None and rs_min is None and rs_max is None:
-                        viable += 1
-                        continue
-                    if not core_windows:
-                        viable += 1
-                        continue
-                    if any(timing_constraints_overlap(rs, rs_min, rs_max, cw[0], cw[1], cw[2]) for cw in core_windows):
-                        viable += 1
-                if viable < min_count:
-                    issues.append(f"{p.name} - {group_name}: timing leaves only {viable} viable choices, needs {min_count}.")
-                sem_parts = []
-                if rs is not None:
-                    sem_parts.append(period_short_label(rs))
-                if rs_min is not None:
-                    sem_parts.append(f">={period_short_label(rs_min)}")
-                if rs_max is not None:
-                    sem_parts.append(f"<={period_short_label(rs_max)}")
-                if sem_parts:
-                    constraints.append(f"{p.name} - {group_name}: must satisfy {' ,'.join(sem_parts)}.")
+            summary = core_rule_summary(p)
+            issues.extend(summary["issues"])
+            constraints.extend(summary["constraints"])
+            for cid, window in summary["windows"]:
+                core_rule_windows_by_course.setdefault(cid, []).append(window)
 
         # Cross-program Core Rules timing clashes (major-major / major-minor / minor-minor).
-        core_rule_windows_by_course: dict[str, list[tuple[Optional[int], Optional[int], Optional[int], str]]] = {}
-        for p in combo_programs:
-            groups = []
-            groups.extend(core_rules_by_program_id.get(p.id, []))
-            groups.extend(core_rules_by_program_name.get((p.name or "").strip().lower(), []))
-            for idx, g in enumerate(groups):
-                g = g or {}
-                rs = g.get("required_semester")
-                rs_min = g.get("required_semester_min")
-                rs_max = g.get("required_semester_max")
-                try:
-                    rs = int(rs) if rs is not None else None
-                except Exception:
-                    rs = None
-                try:
-                    rs_min = int(rs_min) if rs_min is not None else None
-                except Exception:
-                    rs_min = None
-                try:
-                    rs_max = int(rs_max) if rs_max is not None else None
-                except Exception:
-                    rs_max = None
-                if rs is None and rs_min is None and rs_max is None:
-                    continue
-                group_name = str(g.get("name") or f"Core Rule {idx + 1}").strip()
-                source = f"{p.name} - {group_name}"
-                nums = [normalize_course_number(str(x)) for x in (g.get("course_numbers") or []) if str(x).strip()]
-                for num in nums:
-                    cid = course_id_by_number.get(num)
-                    if not cid:
-                        continue
-                    core_rule_windows_by_course.setdefault(cid, []).append((rs, rs_min, rs_max, source))
         for cid, windows in core_rule_windows_by_course.items():
             for i in range(len(windows)):
                 for j in range(i + 1, len(windows)):
@@ -6865,13 +8001,15 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
                     b = windows[j]
                     if not timing_constraints_overlap(a[0], a[1], a[2], b[0], b[1], b[2]):
                         cnum = course_by_id.get(cid).course_number if course_by_id.get(cid) else cid
-                        issues.append(f"{cnum}: Core Rules timing clash between '{a[3]}' and '{b[3]}'.")
+                        issues.append(make_issue(f"{cnum}: Core Rules timing clash between '{a[3]}' and '{b[3]}'.", course_ids=(cid,)))
 
         # Dependency feasibility for mandatory courses.
         windows: dict[str, tuple[int, int]] = {}
-        for cid in mandatory:
+        for cid in mandatory_ids:
             lo, hi = 0, MAX_PLAN_PERIOD
-            for rs, rs_min, rs_max, _ in timing_by_course.get(cid, []):
+            timing_requirement_ids = []
+            for rs, rs_min, rs_max, _src, timing_requirement_id in timing_by_course.get(cid, []):
+                timing_requirement_ids.append(timing_requirement_id)
                 if rs is not None:
                     lo = max(lo, rs)
                     hi = min(hi, rs)
@@ -6882,110 +8020,89 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             if lo > hi:
                 cnum = course_by_id.get(cid).course_number if course_by_id.get(cid) else cid
                 issues.append(
-                    f"{cnum}: no feasible period window ({period_short_label(lo)}>{period_short_label(hi)})."
+                    make_issue(
+                        f"{cnum}: no feasible period window ({period_short_label(lo)}>{period_short_label(hi)}).",
+                        requirement_ids=tuple(timing_requirement_ids),
+                        course_ids=(cid,),
+                    )
                 )
             windows[cid] = (lo, hi)
-        prereq_constraints = prerequisite_constraint_groups(prereqs)
-        for g in prereq_constraints:
-            course_id = g["course_id"]
-            if course_id not in mandatory:
-                continue
-            considered = [p for p in g["items"] if p.required_course_id in mandatory]
-            if not considered:
-                continue
-            b_lo, b_hi = windows.get(course_id, (0, MAX_PLAN_PERIOD))
-            rel = str(g["relationship_type"] or "PREREQUISITE").upper()
+        # Propagate windows along the prerequisite DAG so collapsing chains are caught, then check each
+        # group against the tightened windows (a course with an empty timing window satisfies nothing).
+        active_groups = []
+        for course_id in mandatory_ids:
+            for g, gap, item_bits in prereq_groups_by_course.get(course_id, []):
+                considered = [p for p, bit in item_bits if mandatory & bit]
+                if not considered:
+                    continue
+                required_count = max(1, int(g.get("min_required") or 1))
+                required_count = min(required_count, len(considered))
+                active_groups.append((course_id, g, gap, required_count, considered))
+        bounds = propagate_prerequisite_windows(
+            windows,
+            [
+                (course_id, required_count, gap, [p.required_course_id for p in considered])
+                for course_id, _g, gap, required_count, considered in active_groups
+            ],
+        )
+        for course_id, g, gap, required_count, considered in active_groups:
+            b_lo, b_hi = windows[course_id]
+            latest = bounds[course_id][1]
             feasible_count = 0
-            for p in considered:
-                a_lo, a_hi = windows.get(p.required_course_id, (0, MAX_PLAN_PERIOD))
-                feasible = False
-                for sa in range(a_lo, a_hi + 1):
-                    for sb in range(b_lo, b_hi + 1):
-                        if rel == "COREQUISITE":
-                            if sa <= sb:
-                                feasible = True
-                                break
-                        else:
-                            if sa < sb:
-                                feasible = True
-                                break
-                    if feasible:
-                        break
-                if feasible:
-                    feasible_count += 1
-            required_count = max(1, int(g.get("min_required") or 1))
-            required_count = min(required_count, len(considered))
+            if b_lo <= b_hi:
+                for p in considered:
+                    a_lo, a_hi = windows[p.required_course_id]
+                    if a_lo <= a_hi and bounds[p.required_course_id][0] + gap <= latest:
+                        feasible_count += 1
             if feasible_count < required_count:
                 course_num = course_by_id.get(course_id).course_number if course_by_id.get(course_id) else course_id
                 req_nums = [
                     course_by_id.get(p.required_course_id).course_number if course_by_id.get(p.required_course_id) else p.required_course_id
                     for p in considered
                 ]
+                dependency_course_ids = (course_id, *(p.required_course_id for p in considered))
                 if g.get("group_key"):
                     issues.append(
-                        f"{course_num}: dependency group infeasible ({required_count} of {len(considered)} required) "
-                        f"within timing windows: {' / '.join(req_nums)}."
+                        make_issue(
+                            f"{course_num}: dependency group infeasible ({required_count} of {len(considered)} required) "
+                            f"within timing windows: {' / '.join(req_nums)}.",
+                            course_ids=dependency_course_ids,
+                        )
                     )
                 else:
                     req_num = req_nums[0] if req_nums else "UNKNOWN"
-                    issues.append(f"{course_num}: dependency on {req_num} infeasible within timing windows.")
+                    issues.append(
+                        make_issue(f"{course_num}: dependency on {req_num} infeasible within timing windows.", course_ids=dependency_course_ids)
+                    )
 
         # Credit cap checks.
-        total_credit_capacity = (max_credits_per_semester * float(len(ACADEMIC_PERIODS))) + (
-            max_credits_per_summer_period * float(len(SUMMER_PERIODS))
-        )
-        residency_hours_rule, residency_hours_cfg = find_active_rule(
-            rules_with_cfg,
-            rule_type="RESIDENCY_MIN_HOURS",
-            names=["Residency minimum in-residence hours", "COI residency requirements"],
-        )
-        residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-        try:
-            residency_min_hours = float(
-                residency_hours_cfg.get("min_hours", residency_hours_cfg.get("minimum_in_residence_hours", residency_min_hours))
-            )
-        except Exception:
-            residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-        residency_applies_pf = rule_applies_to_context(residency_hours_cfg, "PROGRAM_FEASIBILITY")
         if residency_applies_pf and min_credit_lb < residency_min_hours:
             constraints.append(
-                f"Residency requires >= {residency_min_hours:.0f} in-residence credit hours; "
-                f"defined minimum is {min_credit_lb:.1f}, so additional electives/requirements are needed."
-            )
-        if min_credit_lb > total_credit_capacity:
-            issues.append(
-                f"Minimum required credits {min_credit_lb:.1f} exceeds total period capacity {total_credit_capacity:.1f} "
-                f"({max_credits_per_semester:.1f} x {len(ACADEMIC_PERIODS)} academic, "
-                f"{max_credits_per_summer_period:.1f} x {len(SUMMER_PERIODS)} summer)."
+                make_issue(
+                    f"Residency requires >= {residency_min_hours:.0f} in-residence credit hours; "
+                    f"defined minimum is {min_credit_lb:.1f}, so additional electives/requirements are needed.",
+                    rule_code=str(residency_hours_rule.rule_code or "").strip() or None if residency_hours_rule else None,
+                )
             )
+        capacity_issue = credit_capacity_issue(min_credit_lb)
+        if capacity_issue:
+            issues.append(capacity_issue)
         avg = min_credit_lb / float(len(ALL_PLAN_PERIODS)) if min_credit_lb > 0 else 0.0
         if avg > max_credits_per_semester * 0.9:
             constraints.append(
-                f"Average load {avg:.1f}/period is near academic cap {max_credits_per_semester:.1f}; limited schedule flexibility."
+                make_issue(f"Average load {avg:.1f}/period is near academic cap {max_credits_per_semester:.1f}; limited schedule flexibility.")
             )
 
-        # De-duplicate message lists while preserving order.
-        seen = set()
-        issues_dedup = []
-        for i in issues:
-            if i in seen:
-                continue
-            seen.add(i)
-            issues_dedup.append(i)
-        seen = set()
-        constraints_dedup = []
-        for c in constraints:
-            if c in seen:
-                continue
-            seen.add(c)
-            constraints_dedup.append(c)
+        issues_dedup = dedupe_issues(issues)
         validation_items = []
         if residency_applies_pf:
             validation_items.append(
                 {
                     "rule_code": str(residency_hours_rule.rule_code or "").strip() if residency_hours_rule else "",
                     "rule_name": residency_hours_rule.name if residency_hours_rule else "Residency minimum in-residence hours",
-                    "status": status_for_check(min_credit_lb >= residency_min_hours, min_credit_rule.severity),
+                    "status": status_for_check(
+                        min_credit_lb >= residency_min_hours, residency_hours_rule.severity if residency_hours_rule else None
+                    ),
                     "message": f"Defined minimum in-residence hours {min_credit_lb:.1f}; threshold {residency_min_hours:.0f}.",
                 }
             )
@@ -6993,60 +8110,24 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             abet_validation_items_for_courses(
                 rules_with_cfg,
                 programs=combo_programs,
-                course_ids=set(mandatory),
+                course_ids=set(mandatory_ids),
                 bucket_rows=bucket_rows,
                 course_by_id=course_by_id,
             )
         )
-        program_feasibility_bucket_rules = [
-            (rule, cfg)
-            for rule, cfg in rules_with_cfg
-            if str(rule_domain(cfg) or "").strip().lower() != "non-academic graduation"
-        ]
         validation_items.extend(
             bucket_validation_items_for_courses(
                 program_feasibility_bucket_rules,
                 programs=combo_programs,
-                course_ids=set(mandatory),
+                course_ids=set(mandatory_ids),
                 bucket_rows=bucket_rows,
                 course_by_id=course_by_id,
             )
         )
         validation_items.extend(pathway_validation_items)
-        if not consistency_roots:
-            consistency_roots = [
-                {
-                    "requirement_id": "none",
-                    "node_code": "",
-                    "name": "Program Rules",
-                    "status": "CONSISTENT",
-                    "message": "",
-                    "children": [],
-                }
-            ]
-        consistency_items = []
-        def flatten_consistency(nodes: list[dict], depth: int = 0):
-            for n in nodes or []:
-                consistency_items.append(
-                    {
-                        "node_code": n.get("node_code", ""),
-                        "name": n.get("name", ""),
-                        "status": n.get("status", "CONSISTENT"),
-                        "message": n.get("message", ""),
-                        "depth": depth,
-                    }
-                )
-                flatten_consistency(n.get("children") or [], depth + 1)
-        flatten_consistency(consistency_roots)
-        consistency_fail_count = sum(1 for x in consistency_items if x.get("status") == "INCONSISTENT")
-        consistency_pass_count = sum(1 for x in consistency_items if x.get("status") == "CONSISTENT")
+        consistency_roots, consistency_items, consistency_pass_count, consistency_fail_count = consistency_summary(consistency_roots)
         consistency_status = "INCONSISTENT" if consistency_fail_count > 0 else "CONSISTENT"
         status = "FAIL" if issues_dedup else "PASS"
-        gate_rule, _ = find_active_rule(
-            rules_with_cfg,
-            rule_type="PROGRAM_FEASIBILITY_GATE",
-            names=["Program feasibility gate"],
-        )
         validation_items.append(
             {
                 "rule_code": str(gate_rule.rule_code or "").strip() if gate_rule else "",
@@ -7068,7 +8149,8 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             "consistency_status": consistency_status,
             "overall_status": f"{status} / {consistency_status}",
             "issue_count": len(issues_dedup),
-            "issues": issues_dedup,
+            "issues": [i["message"] for i in issues_dedup],
+            "issue_records": issues_dedup,
             "program_design_consistency_items": consistency_items,
             "program_design_consistency_tree": consistency_roots,
             "validation_pass_count": validation_pass_count,
@@ -7076,7 +8158,79 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             "validation_fail_count": validation_fail_count,
             "consistency_pass_count": consistency_pass_count,
             "consistency_fail_count": consistency_fail_count,
-            "mandatory_course_count": len(mandatory),
+            "mandatory_course_count": len(mandatory_ids),
+            "min_required_credits": round(min_credit_lb, 1),
+            "max_credits_per_semester": max_credits_per_semester,
+            "max_credits_per_summer_period": max_credits_per_summer_period,
+            "residency_hours_minimum": residency_min_hours,
+            "validation_items": validation_items,
+        }
+
+    core_root_ids = [r.id for r in top_level_reqs if r.program_id is None and (r.category or "").upper() == "CORE"]
+    pair_prune_cache: dict[tuple[str, str], list[dict]] = {}
+
+    def pair_prune_issues(pair: tuple[AcademicProgram, AcademicProgram]) -> list[dict]:
+        # Both checks are monotone: adding a program only adds requirement credit and timing windows,
+        # so a pair that fails here fails every larger combination containing it.
+        key = tuple(sorted(p.id for p in pair))
+        cached = pair_prune_cache.get(key)
+        if cached is not None:
+            return cached
+        out = list(combo_timing(set(key))[1])
+        min_credit_lb = sum(float(evaluate_requirement(rid)["min_credit_lb"]) for rid in core_root_ids)
+        min_credit_lb += sum(float(gather_program_requirement_courses(pid)[1]) for pid in key)
+        capacity_issue = credit_capacity_issue(min_credit_lb)
+        if capacity_issue:
+            out.append(capacity_issue)
+        pair_prune_cache[key] = dedupe_issues(out)
+        return pair_prune_cache[key]
+
+    def pruned_combo_row(
+        combo_programs: list[AcademicProgram],
+        kind: str,
+        label: str,
+        pair: tuple[AcademicProgram, AcademicProgram],
+        pair_issues: list[dict],
+    ) -> dict:
+        mandatory = 0
+        min_credit_lb = 0.0
+        consistency_roots = []
+        for tr in combo_top_reqs({p.id for p in combo_programs}):
+            e = evaluate_requirement(tr.id)
+            mandatory |= e["always_mandatory_courses"]
+            min_credit_lb += float(e["min_credit_lb"])
+            consistency_roots.append(e["consistency_node"])
+        consistency_roots, consistency_items, consistency_pass_count, consistency_fail_count = consistency_summary(consistency_roots)
+        consistency_status = "INCONSISTENT" if consistency_fail_count > 0 else "CONSISTENT"
+        pair_names = " + ".join(p.name for p in pair)
+        validation_items = [
+            {
+                "rule_code": str(gate_rule.rule_code or "").strip() if gate_rule else "",
+                "rule_name": gate_rule.name if gate_rule else "Program feasibility gate",
+                "status": "FAIL",
+                "message": f"{len(pair_issues)} consistency conflicts detected in {pair_names}; remaining checks skipped.",
+            }
+        ]
+        return {
+            "kind": kind,
+            "label": label,
+            "program_ids": [p.id for p in combo_programs],
+            "program_names": [p.name for p in combo_programs],
+            "status": "FAIL",
+            "consistency_status": consistency_status,
+            "overall_status": f"FAIL / {consistency_status}",
+            "issue_count": len(pair_issues),
+            "issues": [i["message"] for i in pair_issues],
+            "issue_records": pair_issues,
+            "pruned_by_program_ids": [p.id for p in pair],
+            "program_design_consistency_items": consistency_items,
+            "program_design_consistency_tree": consistency_roots,
+            "validation_pass_count": 0,
+            "validation_warn_count": 0,
+            "validation_fail_count": 1,
+            "consistency_pass_count": consistency_pass_count,
+            "consistency_fail_count": consistency_fail_count,
+            "mandatory_course_count": mandatory.bit_count(),
             "min_required_credits": round(min_credit_lb, 1),
             "max_credits_per_semester": max_credits_per_semester,
             "max_credits_per_summer_period": max_credits_per_summer_period,
@@ -7084,30 +8238,901 @@ def design_feasibility(version_id: str, db: Session = Depends(get_db), _: User =
             "validation_items": validation_items,
         }
 
-    rows = []
-    for m in majors:
-        rows.append(evaluate_combo([m], "MAJOR", f"Major - {m.name}"))
-    for n in minors:
-        rows.append(evaluate_combo([n], "MINOR", f"Minor - {n.name}"))
-    for a, b in itertools.combinations(majors, 2):
-        rows.append(evaluate_combo([a, b], "DOUBLE_MAJOR", f"Double Major - {a.name} + {b.name}"))
-    for m in majors:
-        for n in minors:
-            rows.append(evaluate_combo([m, n], "MAJOR_MINOR", f"Major/Minor - {m.name} + {n.name}"))
+    def combo_dependencies(program_ids: tuple[str, ...]) -> list[tuple[str, str]]:
+        deps = [("REQUIREMENT", rid) for rid in core_root_ids]
+        for pid in program_ids:
+            deps.append(("PROGRAM", pid))
+            deps.extend(("REQUIREMENT", r.id) for r in top_reqs_by_program.get(pid, []))
+        return deps
+
+    return {
+        "program_by_id": program_by_id,
+        "evaluate_requirement": evaluate_requirement,
+        "evaluate_combo": evaluate_combo,
+        "combo_dependencies": combo_dependencies,
+    }
+
+
+FEASIBILITY_KINDS = ("MAJOR", "MINOR", "DOUBLE_MAJOR", "MAJOR_MINOR")
+# Three-program combos are only enumerated when requested through `kinds`; they are pruned pairwise.
+FEASIBILITY_TRIPLE_KINDS = ("DOUBLE_MAJOR_MINOR", "MAJOR_TWO_MINORS")
+
+
+def feasibility_programs(version_id: str, db: Session) -> tuple[list[AcademicProgram], list[AcademicProgram]]:
+    programs = db.scalars(select(AcademicProgram).where(AcademicProgram.version_id == version_id).order_by(AcademicProgram.name.asc())).all()
+    # Key feasibility combos to programs that are actually present in Program Design Rules
+    # (top-level requirement nodes), avoiding duplicate/legacy program variants.
+    program_ids_in_designer = set(
+        db.scalars(
+            select(Requirement.program_id).where(
+                Requirement.version_id == version_id,
+                Requirement.parent_requirement_id.is_(None),
+                Requirement.program_id.is_not(None),
+            )
+        ).all()
+    )
+    majors = [p for p in programs if (p.program_type or "").upper() == "MAJOR" and p.id in program_ids_in_designer]
+    minors = [p for p in programs if (p.program_type or "").upper() == "MINOR" and p.id in program_ids_in_designer]
+    return majors, minors
+
+
+def feasibility_combo_specs(
+    majors: list[AcademicProgram],
+    minors: list[AcademicProgram],
+    program_ids: Optional[set[str]] = None,
+    kinds: Optional[set[str]] = None,
+) -> list[tuple[tuple[str, ...], str, str]]:
+    # Scope is applied while enumerating so out-of-scope combos are never built, let alone evaluated.
+    def wanted(kind: str, *combo: AcademicProgram) -> bool:
+        if kinds is not None and kind not in kinds:
+            return False
+        return program_ids is None or any(p.id in program_ids for p in combo)
+
+    specs: list[tuple[tuple[str, ...], str, str]] = []
+    for m in majors:
+        if wanted("MAJOR", m):
+            specs.append(((m.id,), "MAJOR", f"Major - {m.name}"))
+    for n in minors:
+        if wanted("MINOR", n):
+            specs.append(((n.id,), "MINOR", f"Minor - {n.name}"))
+    if kinds is None or "DOUBLE_MAJOR" in kinds:
+        for a, b in itertools.combinations(majors, 2):
+            if wanted("DOUBLE_MAJOR", a, b):
+                specs.append(((a.id, b.id), "DOUBLE_MAJOR", f"Double Major - {a.name} + {b.name}"))
+    if kinds is None or "MAJOR_MINOR" in kinds:
+        for m in majors:
+            for n in minors:
+                if wanted("MAJOR_MINOR", m, n):
+                    specs.append(((m.id, n.id), "MAJOR_MINOR", f"Major/Minor - {m.name} + {n.name}"))
+    if kinds is not None and "DOUBLE_MAJOR_MINOR" in kinds:
+        for a, b in itertools.combinations(majors, 2):
+            for n in minors:
+                if wanted("DOUBLE_MAJOR_MINOR", a, b, n):
+                    specs.append(
+                        ((a.id, b.id, n.id), "DOUBLE_MAJOR_MINOR", f"Double Major/Minor - {a.name} + {b.name} + {n.name}")
+                    )
+    if kinds is not None and "MAJOR_TWO_MINORS" in kinds:
+        for m in majors:
+            for a, b in itertools.combinations(minors, 2):
+                if wanted("MAJOR_TWO_MINORS", m, a, b):
+                    specs.append(((m.id, a.id, b.id), "MAJOR_TWO_MINORS", f"Major/Two Minors - {m.name} + {a.name} + {b.name}"))
+    return specs
+
+
+def feasibility_combo_key(spec: tuple[tuple[str, ...], str, str]) -> str:
+    program_ids, kind, _label = spec
+    return f"{kind}:{'+'.join(program_ids)}"
+
+
+# Engines a pool worker has built, keyed by snapshot hash. A worker keeps the last few so concurrent
+# requests on different snapshots do not rebuild on every chunk.
+_feasibility_worker_engines: OrderedDict[str, dict] = OrderedDict()
+_feasibility_pool: Optional[ProcessPoolExecutor] = None
+_feasibility_pool_lock = threading.Lock()
+
+
+def feasibility_pool() -> Optional[ProcessPoolExecutor]:
+    # One pool per process, sized by CMT_FEASIBILITY_WORKERS and built on first use. Workers start from
+    # forkserver/spawn rather than fork, since the server process is already multithreaded.
+    global _feasibility_pool
+    if FEASIBILITY_WORKERS <= 1:
+        return None
+    with _feasibility_pool_lock:
+        if _feasibility_pool is None:
+            start_methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context("forkserver" if "forkserver" in start_methods else "spawn")
+            _feasibility_pool = ProcessPoolExecutor(max_workers=FEASIBILITY_WORKERS, mp_context=mp_context)
+        return _feasibility_pool
+
+
+@app.on_event("shutdown")
+def shutdown_feasibility_pool():
+    global _feasibility_pool
+    with _feasibility_pool_lock:
+        pool, _feasibility_pool = _feasibility_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def evaluate_feasibility_spec(engine: dict, spec: tuple[tuple[str, ...], str, str]) -> dict:
+    program_ids, kind, label = spec
+    return engine["evaluate_combo"]([engine["program_by_id"][pid] for pid in program_ids], kind, label)
+
+
+def evaluate_feasibility_chunk_in_worker(snapshot_key: str, snapshot_path: str, specs: list[tuple[tuple[str, ...], str, str]]) -> list[dict]:
+    engine = _feasibility_worker_engines.get(snapshot_key)
+    if engine is None:
+        with open(snapshot_path, "rb") as f:
+            engine = build_feasibility_engine(pickle.load(f))
+        _feasibility_worker_engines[snapshot_key] = engine
+        while len(_feasibility_worker_engines) > 4:
+            _feasibility_worker_engines.popitem(last=False)
+    else:
+        _feasibility_worker_engines.move_to_end(snapshot_key)
+    return [evaluate_feasibility_spec(engine, spec) for spec in specs]
+
+
+def iter_feasibility_rows(snapshot: dict, engine: dict, specs: list, workers: int = 0):
+    # workers is how many chunks of this request may be in flight on the shared pool, capped at its size.
+    workers = min(max(0, int(workers or 0)), FEASIBILITY_WORKERS)
+    pool = feasibility_pool() if workers > 1 and len(specs) >= workers * 2 else None
+    if pool is None:
+        for spec in specs:
+            yield evaluate_feasibility_spec(engine, spec)
+        return
+    chunk_size = max(1, min(32, len(specs) // (workers * 4)))
+    chunks = [specs[i:i + chunk_size] for i in range(0, len(specs), chunk_size)]
+    # The snapshot is pickled once to a temp file; a worker loads it and builds the engine only the first
+    # time it sees this snapshot. Only a bounded number of chunks is in flight, results are yielded in spec
+    # order, and closing the generator early cancels the rest.
+    blob = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    snapshot_key = hashlib.sha256(blob).hexdigest()
+    with tempfile.NamedTemporaryFile(prefix="cmt-feasibility-", suffix=".pickle", delete=False) as f:
+        f.write(blob)
+        snapshot_path = f.name
+    del blob
+    pending = deque()
+    next_chunk = 0
+    try:
+        while pending or next_chunk < len(chunks):
+            while next_chunk < len(chunks) and len(pending) < workers * 2:
+                pending.append(pool.submit(evaluate_feasibility_chunk_in_worker, snapshot_key, snapshot_path, chunks[next_chunk]))
+                next_chunk += 1
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        for future in pending:
+            if not future.cancelled():
+                future.exception()
+        os.unlink(snapshot_path)
+
+
+# Bump whenever evaluate_combo output changes so persisted rows from older engines are recomputed.
+FEASIBILITY_ENGINE_REVISION = 6
+# Rows a feasibility stream evaluates before it persists them and lets them go.
+FEASIBILITY_SAVE_BATCH_SIZE = 100
+
+
+def execute_in_chunks(conn, statement, name: str, values: list, **params) -> list:
+    out: list = []
+    for i in range(0, len(values), 500):
+        result = conn.execute(statement, {name: values[i:i + 500], **params})
+        if result.returns_rows:
+            out.extend(result.fetchall())
+    return out
+
+
+@event.listens_for(Session, "after_flush")
+def invalidate_feasibility_results(session: Session, _flush_context) -> None:
+    # Marks persisted feasibility combos dirty for whatever this flush touched, in the same transaction.
+    # Requirement-tree edits resolve to root requirement ids; course-level edits resolve through the
+    # requirements (and baskets) that reference the course; rule edits invalidate every version.
+    req_ids: set[str] = set()
+    course_ids: set[str] = set()
+    basket_ids: set[str] = set()
+    program_ids: set[str] = set()
+    version_ids: set[str] = set()
+    wide_version_ids: set[str] = set()
+    all_versions = False
+
+    def previous(obj, attr: str) -> list:
+        return [x for x in inspect(obj).attrs[attr].history.deleted if x]
+
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, Requirement):
+            version_ids.add(obj.version_id)
+            req_ids.add(obj.id)
+            req_ids.update(x for x in [obj.parent_requirement_id, *previous(obj, "parent_requirement_id")] if x)
+            program_ids.update(x for x in [obj.program_id, *previous(obj, "program_id")] if x)
+            if obj.parent_requirement_id is None and obj.program_id is None:
+                wide_version_ids.add(obj.version_id)
+        elif isinstance(obj, (RequirementFulfillment, RequirementBasketLink)):
+            req_ids.update([obj.requirement_id, *previous(obj, "requirement_id")])
+        elif isinstance(obj, CourseBasketItem):
+            basket_ids.update([obj.basket_id, *previous(obj, "basket_id")])
+        elif isinstance(obj, (CoursePrerequisite, CourseBucketTag)):
+            course_ids.update([obj.course_id, *previous(obj, "course_id")])
+        elif isinstance(obj, Course):
+            wide_version_ids.add(obj.version_id)
+        elif isinstance(obj, AcademicProgram):
+            version_ids.add(obj.version_id)
+            program_ids.add(obj.id)
+        elif isinstance(obj, ValidationRule):
+            all_versions = True
+    if not (req_ids or course_ids or basket_ids or program_ids or wide_version_ids or all_versions):
+        return
+
+    conn = session.connection()
+    if course_ids:
+        ids = list(course_ids)
+        version_ids.update(
+            r[0] for r in execute_in_chunks(conn, text("SELECT version_id FROM courses WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)), "ids", ids)
+        )
+        req_ids.update(
+            r[0]
+            for r in execute_in_chunks(
+                conn,
+                text("SELECT requirement_id FROM requirement_fulfillment WHERE course_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                "ids",
+                ids,
+            )
+        )
+        basket_ids.update(
+            r[0]
+            for r in execute_in_chunks(
+                conn, text("SELECT basket_id FROM course_basket_items WHERE course_id IN :ids").bindparams(bindparam("ids", expanding=True)), "ids", ids
+            )
+        )
+    if basket_ids:
+        ids = list(basket_ids)
+        version_ids.update(
+            r[0] for r in execute_in_chunks(conn, text("SELECT version_id FROM course_baskets WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)), "ids", ids)
+        )
+        req_ids.update(
+            r[0]
+            for r in execute_in_chunks(
+                conn,
+                text("SELECT requirement_id FROM requirement_basket_links WHERE basket_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                "ids",
+                ids,
+            )
+        )
+    root_ids = set(req_ids)
+    if req_ids:
+        for rid, version_id in execute_in_chunks(
+            conn,
+            text(
+                """
+                WITH RECURSIVE ancestors(id, parent_requirement_id, version_id) AS (
+                    SELECT id, parent_requirement_id, version_id FROM requirements WHERE id IN :ids
+                    UNION
+                    SELECT r.id, r.parent_requirement_id, r.version_id
+                    FROM requirements r JOIN ancestors a ON r.id = a.parent_requirement_id
+                )
+                SELECT id, version_id FROM ancestors WHERE parent_requirement_id IS NULL
+                """
+            ).bindparams(bindparam("ids", expanding=True)),
+            "ids",
+            list(req_ids),
+        ):
+            root_ids.add(rid)
+            version_ids.add(version_id)
+
+    dependency_filter = text(
+        """
+        UPDATE feasibility_combo_results SET dirty = 1
+        WHERE dirty = 0 AND id IN (
+            SELECT result_id FROM feasibility_combo_dependencies
+            WHERE dependency_type = :dependency_type AND dependency_id IN :ids
+        )
+        """
+    ).bindparams(bindparam("ids", expanding=True))
+    if root_ids:
+        execute_in_chunks(conn, dependency_filter, "ids", list(root_ids), dependency_type="REQUIREMENT")
+    if program_ids:
+        execute_in_chunks(conn, dependency_filter, "ids", list(program_ids), dependency_type="PROGRAM")
+    if wide_version_ids:
+        execute_in_chunks(
+            conn,
+            text("UPDATE feasibility_combo_results SET dirty = 1 WHERE dirty = 0 AND version_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            "ids",
+            list(wide_version_ids),
+        )
+    if all_versions:
+        conn.execute(text("UPDATE feasibility_combo_results SET dirty = 1 WHERE dirty = 0"))
+        conn.execute(text("UPDATE feasibility_version_state SET epoch = epoch + 1"))
+        return
+    # The epoch lets an in-flight evaluation notice that its snapshot went stale before it saves.
+    execute_in_chunks(
+        conn,
+        text("UPDATE feasibility_version_state SET epoch = epoch + 1 WHERE version_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+        "ids",
+        list((version_ids | wide_version_ids) - {None}),
+    )
+
+
+REQUIREMENT_CLOSURE_MAX_DEPTH = 64
+
+
+def refresh_requirement_closure(conn, seed_ids: set[str]) -> None:
+    # Rebuilds requirement_closure and requirement_effective_courses for the whole trees containing seed_ids
+    # (ids of requirements that are gone only have their rows removed). Effective courses are LINK rows from
+    # requirement_fulfillment and BASKET rows from linked basket items, for every descendant-or-self.
+    ids_param = bindparam("ids", expanding=True)
+    roots = {
+        r[0]
+        for r in execute_in_chunks(
+            conn,
+            text(
+                """
+                WITH RECURSIVE ancestors(id, parent_requirement_id, depth) AS (
+                    SELECT id, parent_requirement_id, 0 FROM requirements WHERE id IN :ids
+                    UNION
+                    SELECT r.id, r.parent_requirement_id, a.depth + 1
+                    FROM requirements r JOIN ancestors a ON r.id = a.parent_requirement_id
+                    WHERE a.depth < :max_depth
+                )
+                SELECT a.id FROM ancestors a
+                WHERE a.parent_requirement_id IS NULL
+                   OR NOT EXISTS (SELECT 1 FROM requirements p WHERE p.id = a.parent_requirement_id)
+                """
+            ).bindparams(ids_param),
+            "ids",
+            list(seed_ids),
+            max_depth=REQUIREMENT_CLOSURE_MAX_DEPTH,
+        )
+    }
+    members = {
+        r[0]
+        for r in execute_in_chunks(
+            conn,
+            text(
+                """
+                WITH RECURSIVE subtree(id, depth) AS (
+                    SELECT id, 0 FROM requirements WHERE id IN :ids
+                    UNION
+                    SELECT r.id, s.depth + 1 FROM requirements r JOIN subtree s ON r.parent_requirement_id = s.id
+                    WHERE s.depth < :max_depth
+                )
+                SELECT DISTINCT id FROM subtree
+                """
+            ).bindparams(ids_param),
+            "ids",
+            list(roots),
+            max_depth=REQUIREMENT_CLOSURE_MAX_DEPTH,
+        )
+    }
+    stale = list(members | seed_ids)
+    execute_in_chunks(conn, text("DELETE FROM requirement_closure WHERE ancestor_id IN :ids").bindparams(ids_param), "ids", stale)
+    execute_in_chunks(conn, text("DELETE FROM requirement_closure WHERE descendant_id IN :ids").bindparams(ids_param), "ids", stale)
+    execute_in_chunks(conn, text("DELETE FROM requirement_effective_courses WHERE requirement_id IN :ids").bindparams(ids_param), "ids", stale)
+    if not members:
+        return
+    execute_in_chunks(
+        conn,
+        text(
+            """
+            INSERT OR IGNORE INTO requirement_closure (ancestor_id, descendant_id, version_id, depth)
+            WITH RECURSIVE closure(ancestor_id, descendant_id, version_id, depth) AS (
+                SELECT id, id, version_id, 0 FROM requirements WHERE id IN :ids
+                UNION
+                SELECT c.ancestor_id, r.id, c.version_id, c.depth + 1
+                FROM closure c JOIN requirements r ON r.parent_requirement_id = c.descendant_id
+                WHERE c.depth < :max_depth
+            )
+            SELECT ancestor_id, descendant_id, version_id, MIN(depth) FROM closure GROUP BY ancestor_id, descendant_id
+            """
+        ).bindparams(ids_param),
+        "ids",
+        list(members),
+        max_depth=REQUIREMENT_CLOSURE_MAX_DEPTH,
+    )
+    execute_in_chunks(
+        conn,
+        text(
+            """
+            INSERT OR IGNORE INTO requirement_effective_courses (requirement_id, course_id, source, version_id)
+            SELECT c.ancestor_id, f.course_id, 'LINK', c.version_id
+            FROM requirement_closure c JOIN requirement_fulfillment f ON f.requirement_id = c.descendant_id
+            WHERE c.ancestor_id IN :ids AND f.course_id IS NOT NULL
+            UNION
+            SELECT c.ancestor_id, i.course_id, 'BASKET', c.version_id
+            FROM requirement_closure c
+            JOIN requirement_basket_links l ON l.requirement_id = c.descendant_id
+            JOIN course_basket_items i ON i.basket_id = l.basket_id
+            WHERE c.ancestor_id IN :ids AND i.course_id IS NOT NULL
+            """
+        ).bindparams(ids_param),
+        "ids",
+        list(members),
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def maintain_requirement_closure(session: Session, _flush_context) -> None:
+    # Keeps the closure tables current in the same transaction: any requirement, link, basket link or basket
+    # item write refreshes only the requirement trees it touched.
+    req_ids: set[str] = set()
+    basket_ids: set[str] = set()
+    # model -> (attribute naming the owning requirement/basket, other attribute whose change matters)
+    tracked = {
+        Requirement: ("parent_requirement_id", "parent_requirement_id"),
+        RequirementFulfillment: ("requirement_id", "course_id"),
+        RequirementBasketLink: ("requirement_id", "basket_id"),
+        CourseBasketItem: ("basket_id", "course_id"),
+    }
+
+    def values(obj, attr: str) -> list:
+        return [x for x in [getattr(obj, attr), *inspect(obj).attrs[attr].history.deleted] if x]
+
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        attrs = tracked.get(type(obj))
+        if attrs is None:
+            continue
+        if obj in session.dirty and not any(inspect(obj).attrs[attr].history.has_changes() for attr in attrs):
+            continue
+        target = basket_ids if isinstance(obj, CourseBasketItem) else req_ids
+        target.update(values(obj, attrs[0]))
+        if isinstance(obj, Requirement):
+            req_ids.add(obj.id)
+    if not (req_ids or basket_ids):
+        return
+    conn = session.connection()
+    if basket_ids:
+        req_ids.update(
+            r[0]
+            for r in execute_in_chunks(
+                conn,
+                text("SELECT requirement_id FROM requirement_basket_links WHERE basket_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                "ids",
+                list(basket_ids),
+            )
+        )
+    req_ids.discard(None)
+    if req_ids:
+        refresh_requirement_closure(conn, req_ids)
+
+
+def backfill_requirement_closure(db: Session) -> None:
+    # Requirements written before the closure tables existed (or outside the ORM) have no self row yet.
+    missing = db.scalars(
+        select(Requirement.id).where(Requirement.id.not_in(select(RequirementClosure.descendant_id).where(RequirementClosure.depth == 0)))
+    ).all()
+    if missing:
+        refresh_requirement_closure(db.connection(), set(missing))
+        db.commit()
+
+
+def requirement_effective_course_ids(db: Session, requirement_ids: list[str], include_baskets: bool = True) -> dict[str, set[str]]:
+    out: dict[str, set[str]] = {rid: set() for rid in requirement_ids}
+    if not requirement_ids:
+        return out
+    stmt = select(RequirementEffectiveCourse.requirement_id, RequirementEffectiveCourse.course_id).where(
+        RequirementEffectiveCourse.requirement_id.in_(requirement_ids)
+    )
+    if not include_baskets:
+        stmt = stmt.where(RequirementEffectiveCourse.source == "LINK")
+    for rid, cid in db.execute(stmt).all():
+        out[rid].add(cid)
+    return out
+
+
+# Pathway rules name courses by number (and requirements by id or name) inside required_core_groups.
+# The groups are indexed once and rebuilt only when a rule row changes.
+pathway_rule_group_cache: dict[str, tuple[tuple, dict[str, dict[str, list[dict]]]]] = {}
+
+
+def pathway_rule_group_index(db: Session) -> dict[str, dict[str, list[dict]]]:
+    rules = [rule for rule in compiled_validation_rules(db) if rule.core_groups]
+    stamp = tuple(rule.stamp for rule in rules)
+    cached = pathway_rule_group_cache.get("index")
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index: dict[str, dict[str, list[dict]]] = {"course_number": {}, "requirement_id": {}, "requirement_name": {}}
+    for rule in rules:
+        for idx, g in enumerate(rule.core_groups):
+            g = g if isinstance(g, dict) else {}
+            entry = {
+                "rule_id": rule.id,
+                "rule_name": rule.name,
+                "rule_code": rule.rule_code,
+                "group_index": idx,
+                "group_name": str(g.get("name") or f"Core Rule {idx + 1}").strip(),
+                "program_id": rule.cfg.get("program_id") or None,
+                "program_name": str(rule.cfg.get("program_name") or "").strip() or None,
+            }
+            for num in g.get("course_numbers") or []:
+                if str(num).strip():
+                    index["course_number"].setdefault(normalize_course_number(str(num)), []).append(entry)
+            for req_id in g.get("requirement_ids") or []:
+                index["requirement_id"].setdefault(str(req_id), []).append(entry)
+            for req_name in g.get("requirement_names") or []:
+                if str(req_name).strip():
+                    index["requirement_name"].setdefault(str(req_name).strip().lower(), []).append(entry)
+    pathway_rule_group_cache["index"] = (stamp, index)
+    return index
+
+
+def course_dependents(db: Session, course_ids: list[str]) -> dict[str, dict]:
+    # Reverse index from course to everything that references it. Requirement ancestors come from
+    # requirement_effective_courses (kept current with the closure table), so nested parents and basket
+    # links are already resolved; pathway rule groups match by course number or through those requirements.
+    out: dict[str, dict] = {}
+    if not course_ids:
+        return out
+    courses = db.execute(select(Course.id, Course.version_id, Course.course_number).where(Course.id.in_(course_ids))).all()
+    for cid, version_id, course_number in courses:
+        out[cid] = {
+            "course_id": cid,
+            "version_id": version_id,
+            "course_number": course_number,
+            "requirements": {},
+            "programs": {},
+            "baskets": [],
+            "pathway_rule_groups": {},
+            "bucket_tags": [],
+        }
+    ids = list(out.keys())
+    if not ids:
+        return out
+    version_ids = sorted({row["version_id"] for row in out.values()})
+    program_by_id: dict[str, tuple] = {}
+    program_by_name: dict[tuple[str, str], tuple] = {}
+    for program in db.execute(
+        select(AcademicProgram.id, AcademicProgram.version_id, AcademicProgram.name, AcademicProgram.program_type).where(
+            AcademicProgram.version_id.in_(version_ids)
+        )
+    ).all():
+        program_by_id[program.id] = program
+        program_by_name.setdefault((program.version_id, (program.name or "").strip().lower()), program)
+
+    def add_program(row: dict, program, via: str) -> None:
+        entry = row["programs"].setdefault(
+            program.id, {"program_id": program.id, "program_name": program.name, "program_type": program.program_type, "via": []}
+        )
+        if via not in entry["via"]:
+            entry["via"].append(via)
+
+    for cid, source, req_id, req_name, program_id in db.execute(
+        select(
+            RequirementEffectiveCourse.course_id,
+            RequirementEffectiveCourse.source,
+            Requirement.id,
+            Requirement.name,
+            Requirement.program_id,
+        )
+        .join(Requirement, Requirement.id == RequirementEffectiveCourse.requirement_id)
+        .where(RequirementEffectiveCourse.course_id.in_(ids))
+        .order_by(Requirement.sort_order.asc(), Requirement.name.asc())
+    ).all():
+        row = out[cid]
+        entry = row["requirements"].setdefault(
+            req_id, {"requirement_id": req_id, "requirement_name": req_name, "program_id": program_id, "sources": []}
+        )
+        entry["sources"].append(source)
+        if program_id in program_by_id:
+            add_program(row, program_by_id[program_id], "REQUIREMENT")
+    for cid, basket_id, basket_name in db.execute(
+        select(CourseBasketItem.course_id, CourseBasket.id, CourseBasket.name)
+        .join(CourseBasket, CourseBasket.id == CourseBasketItem.basket_id)
+        .where(CourseBasketItem.course_id.in_(ids))
+        .order_by(CourseBasket.sort_order.asc(), CourseBasket.name.asc())
+    ).all():
+        out[cid]["baskets"].append({"basket_id": basket_id, "basket_name": basket_name})
+    for tag in db.scalars(
+        select(CourseBucketTag)
+        .where(CourseBucketTag.course_id.in_(ids))
+        .order_by(CourseBucketTag.sort_order.asc(), CourseBucketTag.bucket_code.asc())
+    ).all():
+        out[tag.course_id]["bucket_tags"].append(
+            {"bucket_code": tag.bucket_code, "credit_hours_override": tag.credit_hours_override}
+        )
+
+    index = pathway_rule_group_index(db)
+    for row in out.values():
+        matches = [("COURSE_NUMBER", e) for e in index["course_number"].get(normalize_course_number(row["course_number"] or ""), [])]
+        for req in row["requirements"].values():
+            matches.extend(("REQUIREMENT", e) for e in index["requirement_id"].get(req["requirement_id"], []))
+            matches.extend(("REQUIREMENT", e) for e in index["requirement_name"].get((req["requirement_name"] or "").strip().lower(), []))
+        for via, e in matches:
+            program = program_by_id.get(e["program_id"]) if e["program_id"] else None
+            if program is not None and program.version_id != row["version_id"]:
+                program = None
+            if program is None and e["program_name"]:
+                program = program_by_name.get((row["version_id"], e["program_name"].lower()))
+            group = row["pathway_rule_groups"].setdefault(
+                (e["rule_id"], e["group_index"]),
+                {**e, "program_id": program.id if program else e["program_id"], "program_name": program.name if program else e["program_name"], "matched_by": []},
+            )
+            if via not in group["matched_by"]:
+                group["matched_by"].append(via)
+            if program is not None:
+                add_program(row, program, "PATHWAY_RULE")
+    for row in out.values():
+        row["requirements"] = list(row["requirements"].values())
+        row["programs"] = sorted(row["programs"].values(), key=lambda p: (p["program_name"] or "").lower())
+        row["pathway_rule_groups"] = list(row["pathway_rule_groups"].values())
+    return out
+
+
+def load_feasibility_results(db: Session, version_id: str, specs: list) -> tuple[int, dict[str, dict]]:
+    state = db.get(FeasibilityVersionState, version_id)
+    if not state:
+        state = FeasibilityVersionState(version_id=version_id, epoch=0)
+        db.add(state)
+        db.commit()
+    keys = [feasibility_combo_key(spec) for spec in specs]
+    cached: dict[str, dict] = {}
+    for i in range(0, len(keys), 500):
+        for row in db.execute(
+            select(FeasibilityComboResult.combo_key, FeasibilityComboResult.result_json).where(
+                FeasibilityComboResult.version_id == version_id,
+                FeasibilityComboResult.combo_key.in_(keys[i:i + 500]),
+                FeasibilityComboResult.dirty.is_(False),
+                FeasibilityComboResult.engine_revision == FEASIBILITY_ENGINE_REVISION,
+            )
+        ).all():
+            cached[row.combo_key] = json.loads(row.result_json)
+    return int(state.epoch or 0), cached
+
+
+def save_feasibility_results(db: Session, version_id: str, epoch: int, engine: dict, computed: list) -> int:
+    if not computed:
+        return 0
+    state = db.get(FeasibilityVersionState, version_id)
+    db.refresh(state)
+    if int(state.epoch or 0) != epoch:
+        # Something this version depends on changed while evaluating; leave those combos to the next read.
+        return 0
+    keys = [feasibility_combo_key(spec) for spec, _row in computed]
+    existing: dict[str, FeasibilityComboResult] = {}
+    for i in range(0, len(keys), 500):
+        for r in db.scalars(
+            select(FeasibilityComboResult).where(
+                FeasibilityComboResult.version_id == version_id,
+                FeasibilityComboResult.combo_key.in_(keys[i:i + 500]),
+            )
+        ).all():
+            existing[r.combo_key] = r
+    existing_ids = [r.id for r in existing.values()]
+    for i in range(0, len(existing_ids), 500):
+        db.execute(delete(FeasibilityComboDependency).where(FeasibilityComboDependency.result_id.in_(existing_ids[i:i + 500])))
+    now = datetime.utcnow()
+    for (spec, row), key in zip(computed, keys):
+        result = existing.get(key)
+        if not result:
+            result = FeasibilityComboResult(id=str(uuid.uuid4()), version_id=version_id, combo_key=key, kind=spec[1])
+            db.add(result)
+        result.engine_revision = FEASIBILITY_ENGINE_REVISION
+        result.dirty = False
+        result.result_json = json.dumps(row)
+        result.updated_at = now
+        for dependency_type, dependency_id in engine["combo_dependencies"](spec[0]):
+            db.add(
+                FeasibilityComboDependency(
+                    result_id=result.id, version_id=version_id, dependency_type=dependency_type, dependency_id=dependency_id
+                )
+            )
+    db.commit()
+    return len(computed)
+
+
+def feasibility_status_summary(statuses: list[str]) -> dict:
+    return {
+        "pass": sum(1 for s in statuses if s == "PASS"),
+        "warning": sum(1 for s in statuses if s in {"WARN", "WARNING"}),
+        "fail": sum(1 for s in statuses if s == "FAIL"),
+    }
+
+
+def plan_feasibility_query(
+    version_id: str,
+    db: Session,
+    *,
+    program_ids: Optional[str] = None,
+    kinds: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> dict:
+    scope_program_ids = {x.strip() for x in program_ids.split(",") if x.strip()} if program_ids else None
+    scope_kinds = {x.strip().upper() for x in kinds.split(",") if x.strip()} if kinds else None
+    supported_kinds = set(FEASIBILITY_KINDS) | set(FEASIBILITY_TRIPLE_KINDS)
+    if scope_kinds is not None and not scope_kinds <= supported_kinds:
+        raise HTTPException(status_code=400, detail=f"Unsupported kinds: {', '.join(sorted(scope_kinds - supported_kinds))}")
+    scope_statuses = None
+    if status:
+        scope_statuses = {"WARN" if x.strip().upper() == "WARNING" else x.strip().upper() for x in status.split(",") if x.strip()}
+        if not scope_statuses <= {"PASS", "WARN", "FAIL"}:
+            raise HTTPException(status_code=400, detail="status must be PASS, WARN and/or FAIL")
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be >= 1")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must be >= 0")
+
+    majors, minors = feasibility_programs(version_id, db)
+    specs = feasibility_combo_specs(majors, minors, scope_program_ids, scope_kinds)
+    total = len(specs)
+    start = 0
+    if cursor:
+        keys = [feasibility_combo_key(spec) for spec in specs]
+        if cursor not in keys:
+            raise HTTPException(status_code=400, detail="Unknown feasibility cursor")
+        start = keys.index(cursor) + 1
+    candidates = specs[start:]
+    if scope_statuses is None:
+        # Without a status filter every evaluated combo is returned, so paging happens before evaluation.
+        candidates = candidates[offset:(offset + limit) if limit is not None else None]
+        offset = 0
+    return {
+        "specs": candidates,
+        "total_combo_count": total,
+        "has_more_specs": start + len(candidates) < total if scope_statuses is None else False,
+        "statuses": scope_statuses,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": None,
+        "computed": [],
+        "recomputed_count": 0,
+        "save_batch": None,
+    }
+
+
+def iter_feasibility_page(plan: dict, cached: dict[str, dict], snapshot: Optional[dict], engine: Optional[dict], workers: int):
+    # Serves persisted rows where they are still clean and evaluates only the rest (recorded in
+    # plan["computed"]). Applies the status filter and the remaining offset/limit, and records next_cursor.
+    # With plan["save_batch"] set, evaluated rows are handed to it every FEASIBILITY_SAVE_BATCH_SIZE rows
+    # and dropped, so a long stream does not hold the whole matrix.
+    statuses = plan["statuses"]
+    skip = plan["offset"]
+    limit = plan["limit"]
+    specs = plan["specs"]
+    missing = [spec for spec in specs if feasibility_combo_key(spec) not in cached]
+    computed_rows = iter_feasibility_rows(snapshot, engine, missing, workers) if missing else None
+    emitted = 0
+    last_idx = -1
+    try:
+        for idx, spec in enumerate(specs):
+            last_idx = idx
+            row = cached.get(feasibility_combo_key(spec))
+            if row is None:
+                row = next(computed_rows)
+                plan["computed"].append((spec, row))
+                plan["recomputed_count"] += 1
+                if plan["save_batch"] is not None and len(plan["computed"]) >= FEASIBILITY_SAVE_BATCH_SIZE:
+                    plan["save_batch"](plan["computed"])
+                    plan["computed"].clear()
+            if statuses is not None and str(row["status"]).upper() not in statuses:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            yield row
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                break
+    finally:
+        if computed_rows is not None:
+            computed_rows.close()
+    if last_idx >= 0 and (last_idx + 1 < len(specs) or plan["has_more_specs"]):
+        plan["next_cursor"] = feasibility_combo_key(specs[last_idx])
 
+
+def prepare_feasibility_evaluation(version_id: str, db: Session, plan: dict) -> tuple[int, dict[str, dict], Optional[dict], Optional[dict]]:
+    epoch, cached = load_feasibility_results(db, version_id, plan["specs"])
+    missing = [spec for spec in plan["specs"] if feasibility_combo_key(spec) not in cached]
+    if not missing:
+        return epoch, cached, None, None
+    snapshot = load_feasibility_snapshot(version_id, db, {pid for spec in missing for pid in spec[0]})
+    return epoch, cached, snapshot, build_feasibility_engine(snapshot)
+
+
+@app.get("/design/feasibility/{version_id}")
+def design_feasibility(
+    version_id: str,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+    workers: Optional[int] = None,
+    program_ids: Optional[str] = None,
+    kinds: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    request: Request = None,
+    response: Response = None,
+):
+    not_modified = conditional_design_response(request, response, version_id, db, FEASIBILITY_ENGINE_REVISION)
+    if not_modified:
+        return not_modified
+    plan = plan_feasibility_query(
+        version_id, db, program_ids=program_ids, kinds=kinds, status=status, limit=limit, offset=offset, cursor=cursor
+    )
+    epoch, cached, snapshot, engine = prepare_feasibility_evaluation(version_id, db, plan)
+    rows = list(iter_feasibility_page(plan, cached, snapshot, engine, FEASIBILITY_WORKERS if workers is None else workers))
+    if plan["computed"]:
+        save_feasibility_results(db, version_id, epoch, engine, plan["computed"])
     return {
         "version_id": version_id,
         "period_metadata": list_period_metadata(),
         "row_count": len(rows),
-        "summary": {
-            "pass": sum(1 for r in rows if r["status"] == "PASS"),
-            "warning": sum(1 for r in rows if r["status"] in {"WARN", "WARNING"}),
-            "fail": sum(1 for r in rows if r["status"] == "FAIL"),
-        },
+        "total_combo_count": plan["total_combo_count"],
+        "next_cursor": plan["next_cursor"],
+        "recomputed_count": plan["recomputed_count"],
+        "summary": feasibility_status_summary([r["status"] for r in rows]),
         "rows": rows,
     }
 
 
+@app.get("/design/feasibility/{version_id}/stream")
+def design_feasibility_stream(
+    version_id: str,
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$"),
+    workers: Optional[int] = None,
+    program_ids: Optional[str] = None,
+    kinds: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+):
+    # All reads happen here; the generator only works on the plain snapshot and persisted rows,
+    # and saves what it evaluated through its own session in batches as the stream goes.
+    plan = plan_feasibility_query(
+        version_id, db, program_ids=program_ids, kinds=kinds, status=status, limit=limit, offset=offset, cursor=cursor
+    )
+    epoch, cached, snapshot, engine = prepare_feasibility_evaluation(version_id, db, plan)
+    worker_count = FEASIBILITY_WORKERS if workers is None else workers
+
+    def encode(event: str, payload: dict) -> str:
+        if stream_format == "sse":
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps({"type": event, **payload}) + "\n"
+
+    def generate():
+        yield encode(
+            "start",
+            {
+                "version_id": version_id,
+                "combo_count": len(plan["specs"]),
+                "total_combo_count": plan["total_combo_count"],
+                "period_metadata": list_period_metadata(),
+            },
+        )
+        statuses: list[str] = []
+        save_db = SessionLocal()
+        # Each batch re-checks the epoch, so once the version changes mid-stream later batches are not stored.
+        plan["save_batch"] = lambda computed: save_feasibility_results(save_db, version_id, epoch, engine, computed)
+        try:
+            for row in iter_feasibility_page(plan, cached, snapshot, engine, worker_count):
+                statuses.append(row["status"])
+                yield encode("row", {"row": row})
+            if plan["computed"]:
+                plan["save_batch"](plan["computed"])
+                plan["computed"].clear()
+        finally:
+            save_db.close()
+        yield encode(
+            "summary",
+            {
+                "version_id": version_id,
+                "row_count": len(statuses),
+                "next_cursor": plan["next_cursor"],
+                "recomputed_count": plan["recomputed_count"],
+                "summary": feasibility_status_summary(statuses),
+            },
+        )
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
 @app.get("/design/impact/{version_id}")
 def impact(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
     hours = {i: 0.0 for i in ALL_PLAN_PERIODS}
@@ -7124,35 +9149,29 @@ def impact(version_id: str, db: Session = Depends(get_db), _: User = Depends(cur
 
 @app.get("/design/impact-analysis/{version_id}")
 def impact_analysis(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
-    canvas_items = db.scalars(select(PlanItem).where(PlanItem.version_id == version_id)).all()
-    course_by_id: dict[str, Course] = {}
+    graph = get_curriculum_graph(version_id, db)
     semester_hours = {i: 0.0 for i in ALL_PLAN_PERIODS}
     canvas_course_ids: set[str] = set()
 
-    for item in canvas_items:
-        course = db.get(Course, item.course_id)
-        if not course:
-            continue
-        course_by_id[course.id] = course
-        canvas_course_ids.add(course.id)
-        semester_hours[item.semester_index] += course.credit_hours
+    for semester_index, course_id, credit_hours in db.execute(
+        select(PlanItem.semester_index, Course.id, Course.credit_hours)
+        .join(Course, Course.id == PlanItem.course_id)
+        .where(PlanItem.version_id == version_id)
+    ).all():
+        canvas_course_ids.add(course_id)
+        semester_hours[semester_index] += credit_hours
 
+    # Programs reached through any requirement ancestor, linked basket or pathway rule group.
     affected_programs = set()
-    for rf in db.scalars(select(RequirementFulfillment).where(RequirementFulfillment.course_id.in_(canvas_course_ids))).all() if canvas_course_ids else []:
-        req = db.get(Requirement, rf.requirement_id)
-        if req and req.program_id:
-            program = db.get(AcademicProgram, req.program_id)
-            if program:
-                affected_programs.add(program.name)
+    for row in course_dependents(db, sorted(canvas_course_ids)).values():
+        affected_programs.update(p["program_name"] for p in row["programs"] if p["program_name"])
 
     prereq_warnings = []
-    for pre in db.scalars(select(CoursePrerequisite)).all():
-        course = db.get(Course, pre.course_id)
-        required = db.get(Course, pre.required_course_id)
+    for pre in graph.prereqs:
+        course = graph.course_by_id.get(pre.course_id)
+        required = graph.course_by_id.get(pre.required_course_id)
         if not course or not required:
             continue
-        if course.version_id != version_id or required.version_id != version_id:
-            continue
         if (
             course.designated_semester is not None
             and required.designated_semester is not None
@@ -7173,22 +9192,80 @@ def impact_analysis(version_id: str, db: Session = Depends(get_db), _: User = De
     }
 
 
+# Rule families in validate() and the tables each one reads. A family's findings are kept per version and
+# reused until the change feed shows a newer change to one of those tables, or one of its rules changes.
+VALIDATION_RULE_FAMILIES: dict[str, tuple[type, ...]] = {
+    "section_size": (Course,),
+    "credit_bounds": (Course, PlanItem),
+    "residency": (Course, PlanItem),
+    "prerequisite_ordering": (Course, CoursePrerequisite),
+    "resources": (Course, Section, Classroom, Instructor, InstructorQualification),
+}
+validation_family_cache: dict[tuple[str, str], tuple[int, tuple, list[dict]]] = {}
+
+
+def validation_family_stamps(version_id: str, db: Session) -> Optional[dict[str, int]]:
+    # Newest change-feed id per family. None while this session holds unflushed or uncommitted changes
+    # to the version: those feed ids can still roll back and be reused.
+    if db.new or db.dirty or db.deleted:
+        db.flush()
+    if version_id in db.info.get("pending_version_ids", ()):
+        return None
+    latest = dict(
+        db.execute(
+            select(VersionChange.entity_type, func.max(VersionChange.id))
+            .where(VersionChange.version_id == version_id)
+            .group_by(VersionChange.entity_type)
+        ).all()
+    )
+    return {
+        family: max([int(latest.get(model.__name__) or 0) for model in models])
+        for family, models in VALIDATION_RULE_FAMILIES.items()
+    }
+
+
 @app.get("/design/validation/{version_id}")
-def validate(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
+def validate(
+    version_id: str,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+    tiers: Optional[str] = None,
+    background_tasks: BackgroundTasks = None,
+):
+    tier_filter = parse_validation_tiers(tiers)
+
+    def wanted(rule: Optional[CompiledRule], default_tier: int) -> bool:
+        return tier_filter is None or int(rule.tier if rule else default_tier) in tier_filter
+
     findings = []
-    courses = db.scalars(select(Course).where(Course.version_id == version_id)).all()
-    rules = []
-    rules_with_cfg = []
-    for r in db.scalars(select(ValidationRule).where(ValidationRule.active == True)).all():  # noqa: E712
-        try:
-            cfg = json.loads(r.config_json or "{}")
-        except Exception:
-            cfg = {}
-        cfg = cfg if isinstance(cfg, dict) else {}
-        if is_cadet_performance_rule(cfg) or is_definitional_rule(cfg):
-            continue
-        rules.append(r)
-        rules_with_cfg.append((r, cfg))
+    family_stamps = validation_family_stamps(version_id, db)
+    family_starts: dict[str, tuple[int, tuple]] = {}
+
+    def reuse_family(family: str, *family_rules: Optional[CompiledRule]) -> bool:
+        # True when the stored findings are still current (they are appended); otherwise marks where this
+        # family's findings start so finish_family can store them.
+        rule_stamps = tuple(r.stamp if r else None for r in family_rules)
+        if family_stamps is not None:
+            cached = validation_family_cache.get((version_id, family))
+            if cached and cached[0] == family_stamps[family] and cached[1] == rule_stamps:
+                findings.extend(dict(f) for f in cached[2])
+                return True
+        family_starts[family] = (len(findings), rule_stamps)
+        return False
+
+    def finish_family(family: str) -> None:
+        start, rule_stamps = family_starts.pop(family)
+        if family_stamps is not None:
+            validation_family_cache[(version_id, family)] = (
+                family_stamps[family],
+                rule_stamps,
+                [dict(f) for f in findings[start:]],
+            )
+
+    graph = get_curriculum_graph(version_id, db)
+    courses = graph.courses
+    rules_with_cfg = active_design_rules_with_config(db)
+    rules = [r for r, _cfg in rules_with_cfg]
     rule_lookup = {r.name: r for r in rules}
     plan_items = db.scalars(select(PlanItem).where(PlanItem.version_id == version_id)).all()
     planned_course_ids = {item.course_id for item in plan_items}
@@ -7197,77 +9274,55 @@ def validate(version_id: str, db: Session = Depends(get_db), _: User = Depends(c
         planned_course_semesters.setdefault(item.course_id, set()).add(item.semester_index)
     course_id_by_number = {normalize_course_number(c.course_number): c.id for c in courses}
     course_number_by_id = {c.id: c.course_number for c in courses}
-    reqs = db.scalars(select(Requirement).where(Requirement.version_id == version_id)).all()
-    req_by_id = {r.id: r for r in reqs}
+    reqs = graph.reqs
+    req_by_id = graph.req_by_id
     req_by_name: dict[str, list[Requirement]] = {}
-    req_children: dict[Optional[str], list[Requirement]] = {}
     for r in reqs:
-        req_children.setdefault(r.parent_requirement_id, []).append(r)
         req_by_name.setdefault(str(r.name or "").strip().lower(), []).append(r)
-    req_links = db.scalars(select(RequirementFulfillment).where(RequirementFulfillment.requirement_id.in_([r.id for r in reqs]))).all() if reqs else []
-    links_by_req: dict[str, list[RequirementFulfillment]] = {}
-    for link in req_links:
-        links_by_req.setdefault(link.requirement_id, []).append(link)
 
     def collect_requirement_course_ids(requirement_id: str) -> set[str]:
-        out: set[str] = set()
-        stack = [requirement_id]
-        seen: set[str] = set()
-        while stack:
-            rid = stack.pop()
-            if rid in seen:
-                continue
-            seen.add(rid)
-            for link in links_by_req.get(rid, []):
-                out.add(link.course_id)
-            for child in req_children.get(rid, []):
-                stack.append(child.id)
-        return out
+        return requirement_effective_course_ids(db, [requirement_id], include_baskets=False)[requirement_id]
 
     # Minimum section size baseline
     min_rule = rule_lookup.get("Minimum section size >= 6")
-    min_value = 6
-    if min_rule and min_rule.config_json:
-        try:
-            min_value = int(json.loads(min_rule.config_json).get("minimum", 6))
-        except Exception:
-            min_value = 6
-    for c in courses:
-        if c.min_section_size < min_value:
-            findings.append(
-                {
-                    "severity": (min_rule.severity if min_rule else "WARNING"),
-                    "tier": (min_rule.tier if min_rule else 1),
-                    "rule_code": str(min_rule.rule_code or "").strip() if min_rule else "",
-                    "rule": (min_rule.name if min_rule else "Minimum section size >= 6"),
-                    "message": f"{c.course_number} min section size {c.min_section_size} is below {min_value}",
-                }
-            )
+    min_value = rule_param(min_rule, int, 6, "minimum")
+    if wanted(min_rule, 1) and not reuse_family("section_size", min_rule):
+        for c in courses:
+            if c.min_section_size < min_value:
+                findings.append(
+                    {
+                        "severity": (min_rule.severity if min_rule else "WARNING"),
+                        "tier": (min_rule.tier if min_rule else 1),
+                        "rule_code": str(min_rule.rule_code or "").strip() if min_rule else "",
+                        "rule": (min_rule.name if min_rule else "Minimum section size >= 6"),
+                        "message": f"{c.course_number} min section size {c.min_section_size} is below {min_value}",
+                        "entity_ids": [f"course:{c.id}"],
+                    }
+                )
+        finish_family("section_size")
 
     # Semester credit bound checks
-    max_credits = 24
     max_rule = rule_lookup.get("Semester credit upper bound")
-    if max_rule and max_rule.config_json:
-        try:
-            max_credits = float(json.loads(max_rule.config_json).get("max_credits", 24))
-        except Exception:
-            max_credits = 24
+    max_credits = rule_param(max_rule, float, 24, "max_credits")
     hours = {i: 0.0 for i in ALL_PLAN_PERIODS}
     for item in plan_items:
-        c = db.get(Course, item.course_id)
+        c = graph.course_by_id.get(item.course_id)
         if c:
             hours[item.semester_index] += c.credit_hours
-    for sem, total in hours.items():
-        if total > max_credits:
-            findings.append(
-                {
-                    "severity": (max_rule.severity if max_rule else "WARNING"),
-                    "tier": (max_rule.tier if max_rule else 1),
-                    "rule_code": str(max_rule.rule_code or "").strip() if max_rule else "",
-                    "rule": (max_rule.name if max_rule else "Semester credit upper bound"),
-                    "message": f"{period_label(sem)} has {total} credit hours (max {max_credits}).",
-                }
-            )
+    if wanted(max_rule, 1) and not reuse_family("credit_bounds", max_rule):
+        for sem, total in hours.items():
+            if total > max_credits:
+                findings.append(
+                    {
+                        "severity": (max_rule.severity if max_rule else "WARNING"),
+                        "tier": (max_rule.tier if max_rule else 1),
+                        "rule_code": str(max_rule.rule_code or "").strip() if max_rule else "",
+                        "rule": (max_rule.name if max_rule else "Semester credit upper bound"),
+                        "message": f"{period_label(sem)} has {total} credit hours (max {max_credits}).",
+                        "entity_ids": [f"version:{version_id}", f"period:{sem}"],
+                    }
+                )
+        finish_family("credit_bounds")
 
     # Residency checks (editable validation rules).
     residency_hours_rule, residency_hours_cfg = find_active_rule(
@@ -7280,201 +9335,219 @@ def validate(version_id: str, db: Session = Depends(get_db), _: User = Depends(c
         rule_type="RESIDENCY_MIN_ACADEMIC_SEMESTERS",
         names=["Residency minimum academic semesters", "COI residency requirements"],
     )
-    residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-    residency_min_academic = DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS
-    try:
-        residency_min_hours = float(
-            residency_hours_cfg.get("min_hours", residency_hours_cfg.get("minimum_in_residence_hours", residency_min_hours))
-        )
-    except Exception:
-        residency_min_hours = DEFAULT_RESIDENCY_MIN_HOURS
-    try:
-        residency_min_academic = int(
-            residency_sem_cfg.get("min_semesters", residency_sem_cfg.get("minimum_academic_semesters", residency_min_academic))
-        )
-    except Exception:
-        residency_min_academic = DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS
+    residency_min_hours = rule_param(
+        residency_hours_rule, float, DEFAULT_RESIDENCY_MIN_HOURS, "min_hours", "minimum_in_residence_hours"
+    )
+    residency_min_academic = rule_param(
+        residency_sem_rule, int, DEFAULT_RESIDENCY_MIN_ACADEMIC_SEMESTERS, "min_semesters", "minimum_academic_semesters"
+    )
     total_planned_hours = sum(hours.values())
     academic_periods_with_load = sum(1 for p in ACADEMIC_PERIODS if float(hours.get(p, 0.0)) > 0.0)
-    if rule_applies_to_context(residency_hours_cfg, "GLOBAL_VALIDATION") and total_planned_hours < residency_min_hours:
-        findings.append(
-            {
-                "severity": (residency_hours_rule.severity if residency_hours_rule else "WARNING"),
-                "tier": (residency_hours_rule.tier if residency_hours_rule else 1),
-                "rule_code": str(residency_hours_rule.rule_code or "").strip() if residency_hours_rule else "",
-                "rule": (residency_hours_rule.name if residency_hours_rule else "Residency minimum in-residence hours"),
-                "message": (
-                    f"Planned in-residence credit hours {total_planned_hours:.1f} are below required "
-                    f"{residency_min_hours:.0f}."
-                ),
-            }
-        )
-    if rule_applies_to_context(residency_sem_cfg, "GLOBAL_VALIDATION") and academic_periods_with_load < residency_min_academic:
-        findings.append(
-            {
-                "severity": (residency_sem_rule.severity if residency_sem_rule else "WARNING"),
-                "tier": (residency_sem_rule.tier if residency_sem_rule else 1),
-                "rule_code": str(residency_sem_rule.rule_code or "").strip() if residency_sem_rule else "",
-                "rule": (residency_sem_rule.name if residency_sem_rule else "Residency minimum academic semesters"),
-                "message": (
-                    f"Planned academic semesters with load {academic_periods_with_load} are below required "
-                    f"{residency_min_academic}."
-                ),
-            }
-        )
+    if (wanted(residency_hours_rule, 1) or wanted(residency_sem_rule, 1)) and not reuse_family(
+        "residency", residency_hours_rule, residency_sem_rule
+    ):
+        if rule_applies_to_context(residency_hours_cfg, "GLOBAL_VALIDATION") and total_planned_hours < residency_min_hours:
+            findings.append(
+                {
+                    "severity": (residency_hours_rule.severity if residency_hours_rule else "WARNING"),
+                    "tier": (residency_hours_rule.tier if residency_hours_rule else 1),
+                    "rule_code": str(residency_hours_rule.rule_code or "").strip() if residency_hours_rule else "",
+                    "rule": (residency_hours_rule.name if residency_hours_rule else "Residency minimum in-residence hours"),
+                    "message": (
+                        f"Planned in-residence credit hours {total_planned_hours:.1f} are below required "
+                        f"{residency_min_hours:.0f}."
+                    ),
+                    "entity_ids": [f"version:{version_id}", "residency:hours"],
+                }
+            )
+        if rule_applies_to_context(residency_sem_cfg, "GLOBAL_VALIDATION") and academic_periods_with_load < residency_min_academic:
+            findings.append(
+                {
+                    "severity": (residency_sem_rule.severity if residency_sem_rule else "WARNING"),
+                    "tier": (residency_sem_rule.tier if residency_sem_rule else 1),
+                    "rule_code": str(residency_sem_rule.rule_code or "").strip() if residency_sem_rule else "",
+                    "rule": (residency_sem_rule.name if residency_sem_rule else "Residency minimum academic semesters"),
+                    "message": (
+                        f"Planned academic semesters with load {academic_periods_with_load} are below required "
+                        f"{residency_min_academic}."
+                    ),
+                    "entity_ids": [f"version:{version_id}", "residency:academic_semesters"],
+                }
+            )
+        finish_family("residency")
 
     # Prerequisite sequencing checks based on designated semester when available.
     # Supports disjunction groups via prerequisite_group_key + group_min_required.
     pre_rule = rule_lookup.get("Prerequisite ordering")
-    version_prereqs = [
-        p
-        for p in db.scalars(select(CoursePrerequisite)).all()
-        if p.course_id in course_number_by_id and p.required_course_id in course_number_by_id
-    ]
-    prereq_groups = prerequisite_constraint_groups(version_prereqs)
-    for g in prereq_groups:
-        course = db.get(Course, g["course_id"])
-        if not course or course.version_id != version_id or course.designated_semester is None:
-            continue
-        members = []
-        for p in g["items"]:
-            required = db.get(Course, p.required_course_id)
-            if not required or required.version_id != version_id or required.designated_semester is None:
+    if wanted(pre_rule, 1) and not reuse_family("prerequisite_ordering", pre_rule):
+        version_prereqs = [p for p in graph.prereqs if p.required_course_id in course_number_by_id]
+        prereq_groups = prerequisite_constraint_groups(version_prereqs)
+        for g in prereq_groups:
+            course = graph.course_by_id.get(g["course_id"])
+            if not course or course.designated_semester is None:
                 continue
-            members.append((p, required))
-        if not members:
-            continue
-        valid_count = sum(1 for _, required in members if required.designated_semester < course.designated_semester)
-        min_required = max(1, int(g.get("min_required") or 1))
-        min_required = min(min_required, len(members))
-        if valid_count >= min_required:
-            continue
-        req_numbers = [required.course_number for _, required in members]
-        message = (
-            f"{' / '.join(req_numbers)} should occur before {course.course_number}."
-            if not g.get("group_key")
-            else (
-                f"{course.course_number} requires at least {min_required} of {len(members)} prerequisites "
-                f"to occur earlier: {' / '.join(req_numbers)}."
+            members = []
+            for p in g["items"]:
+                required = graph.course_by_id.get(p.required_course_id)
+                if not required or required.designated_semester is None:
+                    continue
+                members.append((p, required))
+            if not members:
+                continue
+            valid_count = sum(1 for _, required in members if required.designated_semester < course.designated_semester)
+            min_required = max(1, int(g.get("min_required") or 1))
+            min_required = min(min_required, len(members))
+            if valid_count >= min_required:
+                continue
+            req_numbers = [required.course_number for _, required in members]
+            message = (
+                f"{' / '.join(req_numbers)} should occur before {course.course_number}."
+                if not g.get("group_key")
+                else (
+                    f"{course.course_number} requires at least {min_required} of {len(members)} prerequisites "
+                    f"to occur earlier: {' / '.join(req_numbers)}."
+                )
             )
-        )
-        findings.append(
-            {
-                "severity": (pre_rule.severity if pre_rule else "FAIL"),
-                "tier": (pre_rule.tier if pre_rule else 1),
-                "rule_code": str(pre_rule.rule_code or "").strip() if pre_rule else "",
-                "rule": (pre_rule.name if pre_rule else "Prerequisite ordering"),
-                "message": message,
-            }
-        )
+            findings.append(
+                {
+                    "severity": (pre_rule.severity if pre_rule else "FAIL"),
+                    "tier": (pre_rule.tier if pre_rule else 1),
+                    "rule_code": str(pre_rule.rule_code or "").strip() if pre_rule else "",
+                    "rule": (pre_rule.name if pre_rule else "Prerequisite ordering"),
+                    "message": message,
+                    "entity_ids": [f"course:{course.id}", *[f"prerequisite:{p.id}" for p, _ in members]],
+                }
+            )
+        finish_family("prerequisite_ordering")
 
     # Resource constraints: classroom capacity, instructor load, qualification
-    sections = db.scalars(select(Section).where(Section.version_id == version_id)).all()
-    instructor_load: dict[str, int] = {}
-    room_usage: dict[tuple[str, str], int] = {}
     cap_rule = rule_lookup.get("Classroom capacity constraints")
     load_rule = rule_lookup.get("Instructor load limits")
     qual_rule = rule_lookup.get("Instructor qualification constraints")
+    if (wanted(cap_rule, 3) or wanted(load_rule, 3) or wanted(qual_rule, 3)) and not reuse_family(
+        "resources", cap_rule, load_rule, qual_rule
+    ):
+        sections = db.scalars(select(Section).where(Section.version_id == version_id)).all()
+        instructor_load: dict[str, int] = {}
+        room_usage: dict[tuple[str, str], int] = {}
+        # Rooms, instructors, qualifications and courses from other versions are each read in one
+        # statement keyed off this version's sections, so the count does not depend on the section count.
+        version_sections = select(Section).where(Section.version_id == version_id).subquery()
+        section_course_by_id = dict(graph.course_by_id)
+        for c in db.scalars(
+            select(Course).where(Course.id.in_(select(version_sections.c.course_id)), Course.version_id != version_id)
+        ).all():
+            section_course_by_id[c.id] = c
+        classroom_by_id = {
+            r.id: r for r in db.scalars(select(Classroom).where(Classroom.id.in_(select(version_sections.c.classroom_id)))).all()
+        }
+        instructor_by_id = {
+            i.id: i for i in db.scalars(select(Instructor).where(Instructor.id.in_(select(version_sections.c.instructor_id)))).all()
+        }
+        qualified_pairs = set(
+            db.execute(
+                select(InstructorQualification.instructor_id, InstructorQualification.course_id).where(
+                    InstructorQualification.instructor_id.in_(select(version_sections.c.instructor_id))
+                )
+            ).all()
+        )
 
-    for sec in sections:
-        course = db.get(Course, sec.course_id)
-        if not course:
-            continue
+        for sec in sections:
+            course = section_course_by_id.get(sec.course_id)
+            if not course:
+                continue
 
-        if sec.classroom_id:
-            room = db.get(Classroom, sec.classroom_id)
-            if not room:
-                findings.append(
-                    {
-                            "severity": (cap_rule.severity if cap_rule else "WARNING"),
-                            "tier": (cap_rule.tier if cap_rule else 3),
-                            "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
-                            "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
-                            "message": f"Section {sec.id} references missing classroom {sec.classroom_id}.",
-                        }
-                    )
-            else:
-                if room.capacity < sec.max_enrollment:
+            if sec.classroom_id:
+                room = classroom_by_id.get(sec.classroom_id)
+                if not room:
                     findings.append(
                         {
-                            "severity": (cap_rule.severity if cap_rule else "WARNING"),
-                            "tier": (cap_rule.tier if cap_rule else 3),
-                            "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
-                            "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
-                            "message": f"{room.building} {room.room_number} capacity {room.capacity} < section max {sec.max_enrollment}.",
-                        }
-                    )
-                key = (sec.semester_label, sec.classroom_id)
-                room_usage[key] = room_usage.get(key, 0) + 1
+                                "severity": (cap_rule.severity if cap_rule else "WARNING"),
+                                "tier": (cap_rule.tier if cap_rule else 3),
+                                "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
+                                "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
+                                "message": f"Section {sec.id} references missing classroom {sec.classroom_id}.",
+                                "entity_ids": [f"section:{sec.id}", f"classroom:{sec.classroom_id}"],
+                            }
+                        )
+                else:
+                    if room.capacity < sec.max_enrollment:
+                        findings.append(
+                            {
+                                "severity": (cap_rule.severity if cap_rule else "WARNING"),
+                                "tier": (cap_rule.tier if cap_rule else 3),
+                                "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
+                                "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
+                                "message": f"{room.building} {room.room_number} capacity {room.capacity} < section max {sec.max_enrollment}.",
+                                "entity_ids": [f"section:{sec.id}", f"classroom:{room.id}"],
+                            }
+                        )
+                    key = (sec.semester_label, sec.classroom_id)
+                    room_usage[key] = room_usage.get(key, 0) + 1
 
-        if sec.instructor_id:
-            instructor = db.get(Instructor, sec.instructor_id)
-            if not instructor:
-                findings.append(
-                    {
-                            "severity": (load_rule.severity if load_rule else "WARNING"),
-                            "tier": (load_rule.tier if load_rule else 3),
-                            "rule_code": str(load_rule.rule_code or "").strip() if load_rule else "",
-                            "rule": (load_rule.name if load_rule else "Instructor load limits"),
-                            "message": f"Section {sec.id} references missing instructor {sec.instructor_id}.",
-                        }
-                    )
-            else:
-                instructor_load[instructor.id] = instructor_load.get(instructor.id, 0) + 1
-                qualification = db.scalar(
-                    select(InstructorQualification).where(
-                        InstructorQualification.instructor_id == instructor.id, InstructorQualification.course_id == sec.course_id
-                    )
-                )
-                if not qualification:
+            if sec.instructor_id:
+                instructor = instructor_by_id.get(sec.instructor_id)
+                if not instructor:
                     findings.append(
                         {
-                            "severity": (qual_rule.severity if qual_rule else "WARNING"),
-                            "tier": (qual_rule.tier if qual_rule else 3),
-                            "rule_code": str(qual_rule.rule_code or "").strip() if qual_rule else "",
-                            "rule": (qual_rule.name if qual_rule else "Instructor qualification constraints"),
-                            "message": f"Instructor {instructor.name} is not qualified for {course.course_number}.",
-                        }
-                    )
+                                "severity": (load_rule.severity if load_rule else "WARNING"),
+                                "tier": (load_rule.tier if load_rule else 3),
+                                "rule_code": str(load_rule.rule_code or "").strip() if load_rule else "",
+                                "rule": (load_rule.name if load_rule else "Instructor load limits"),
+                                "message": f"Section {sec.id} references missing instructor {sec.instructor_id}.",
+                                "entity_ids": [f"section:{sec.id}", f"instructor:{sec.instructor_id}"],
+                            }
+                        )
+                else:
+                    instructor_load[instructor.id] = instructor_load.get(instructor.id, 0) + 1
+                    if (instructor.id, sec.course_id) not in qualified_pairs:
+                        findings.append(
+                            {
+                                "severity": (qual_rule.severity if qual_rule else "WARNING"),
+                                "tier": (qual_rule.tier if qual_rule else 3),
+                                "rule_code": str(qual_rule.rule_code or "").strip() if qual_rule else "",
+                                "rule": (qual_rule.name if qual_rule else "Instructor qualification constraints"),
+                                "message": f"Instructor {instructor.name} is not qualified for {course.course_number}.",
+                                "entity_ids": [f"section:{sec.id}", f"instructor:{instructor.id}"],
+                            }
+                        )
 
-    for instructor_id, count in instructor_load.items():
-        instructor = db.get(Instructor, instructor_id)
-        if instructor and instructor.max_sections_per_semester is not None and count > instructor.max_sections_per_semester:
-            findings.append(
-                {
-                    "severity": (load_rule.severity if load_rule else "WARNING"),
-                    "tier": (load_rule.tier if load_rule else 3),
-                    "rule_code": str(load_rule.rule_code or "").strip() if load_rule else "",
-                    "rule": (load_rule.name if load_rule else "Instructor load limits"),
-                    "message": f"Instructor {instructor.name} assigned {count} sections (max {instructor.max_sections_per_semester}).",
-                }
-            )
+        for instructor_id, count in instructor_load.items():
+            instructor = instructor_by_id.get(instructor_id)
+            if instructor and instructor.max_sections_per_semester is not None and count > instructor.max_sections_per_semester:
+                findings.append(
+                    {
+                        "severity": (load_rule.severity if load_rule else "WARNING"),
+                        "tier": (load_rule.tier if load_rule else 3),
+                        "rule_code": str(load_rule.rule_code or "").strip() if load_rule else "",
+                        "rule": (load_rule.name if load_rule else "Instructor load limits"),
+                        "message": f"Instructor {instructor.name} assigned {count} sections (max {instructor.max_sections_per_semester}).",
+                        "entity_ids": [f"instructor:{instructor.id}"],
+                    }
+                )
 
-    for (semester_label, classroom_id), count in room_usage.items():
-        if count > 1:
-            room = db.get(Classroom, classroom_id)
-            room_name = f"{room.building} {room.room_number}" if room else classroom_id
-            findings.append(
-                {
-                    "severity": (cap_rule.severity if cap_rule else "WARNING"),
-                    "tier": (cap_rule.tier if cap_rule else 3),
-                    "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
-                    "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
-                    "message": f"Room {room_name} has {count} sections in {semester_label} (possible conflict).",
-                }
-            )
+        for (semester_label, classroom_id), count in room_usage.items():
+            if count > 1:
+                room = classroom_by_id.get(classroom_id)
+                room_name = f"{room.building} {room.room_number}" if room else classroom_id
+                findings.append(
+                    {
+                        "severity": (cap_rule.severity if cap_rule else "WARNING"),
+                        "tier": (cap_rule.tier if cap_rule else 3),
+                        "rule_code": str(cap_rule.rule_code or "").strip() if cap_rule else "",
+                        "rule": (cap_rule.name if cap_rule else "Classroom capacity constraints"),
+                        "message": f"Room {room_name} has {count} sections in {semester_label} (possible conflict).",
+                        "entity_ids": [f"classroom:{classroom_id}", f"term:{semester_label}"],
+                    }
+                )
+        finish_family("resources")
 
     # Program/Major core pathway rules are enforced in Program Design Rules checks
     # (checklist + feasibility) and intentionally excluded from this Validation Rules
     # engine to avoid duplicate findings.
     for rule in rules:
-        cfg = {}
-        try:
-            cfg = json.loads(rule.config_json or "{}")
-        except Exception:
-            cfg = {}
-        rule_type = str(cfg.get("type") or "").upper()
-        if rule_type not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
+        cfg = rule.cfg
+        if rule.type not in {"MAJOR_PATHWAY_CORE", "MAJOR_CORE_PATHWAY"}:
             continue
         continue
 
@@ -7616,17 +9689,166 @@ def validate(version_id: str, db: Session = Depends(get_db), _: User = Depends(c
                     }
                 )
 
+    extra = {}
+    if tier_filter is not None:
+        findings = [f for f in findings if int(f.get("tier") or 1) in tier_filter]
+        deferred = [t for t in VALIDATION_TIERS if t not in tier_filter]
+        extra = {"tiers": sorted(tier_filter), "deferred_tiers": deferred}
+        if deferred:
+            schedule_validation_warmup(background_tasks, version_id, db)
     status = "PASS"
     if any(normalize_rule_severity(f.get("severity"), "WARN") == "FAIL" for f in findings):
         status = "FAIL"
     elif findings:
         status = "WARN"
-    return {"status": status, "findings": findings, "period_metadata": list_period_metadata()}
+    return {"status": status, "findings": findings, "period_metadata": list_period_metadata(), **extra}
+
+
+def validation_finding_fingerprint(finding: dict) -> str:
+    # Stable identity of a finding across runs: its rule plus the entities it is about (not the message text,
+    # which carries counts that change while the violation stays the same).
+    rule_key = str(finding.get("rule_code") or "").strip() or str(finding.get("rule") or "")
+    entity_ids = finding.get("entity_ids") or [str(finding.get("message") or "")]
+    return hashlib.sha1(json.dumps([rule_key, sorted(str(x) for x in entity_ids)]).encode("utf-8")).hexdigest()
+
+
+def validation_run_payload(run: Optional[ValidationRun]) -> Optional[dict]:
+    if run is None:
+        return None
+    return {
+        "id": run.id,
+        "version_id": run.version_id,
+        "generation": run.generation,
+        "status": run.status,
+        "finding_count": run.finding_count,
+        "created_at": run.created_at,
+    }
+
+
+def validation_finding_payload(row: ValidationFinding) -> dict:
+    return {
+        "fingerprint": row.fingerprint,
+        "severity": row.severity,
+        "tier": row.tier,
+        "rule_code": row.rule_code,
+        "rule": row.rule,
+        "message": row.message,
+        "entity_ids": json.loads(row.entity_ids_json or "[]"),
+        "first_seen_run_id": row.first_seen_run_id,
+        "first_seen_generation": row.first_seen_generation,
+        "first_seen_at": row.first_seen_at,
+    }
+
+
+def record_validation_run(version_id: str, db: Session, result: dict) -> Optional[ValidationRun]:
+    # One run per version generation. Each finding carries over the run where its fingerprint first appeared,
+    # so a violation's history survives edits that only change its message.
+    if version_id in db.info.get("pending_version_ids", ()):
+        return None
+    generation = version_generation(db, version_id)
+    run = db.scalar(select(ValidationRun).where(ValidationRun.version_id == version_id, ValidationRun.generation == generation))
+    if run:
+        return run
+    previous = db.scalar(
+        select(ValidationRun)
+        .where(ValidationRun.version_id == version_id)
+        .order_by(ValidationRun.generation.desc(), ValidationRun.created_at.desc())
+        .limit(1)
+    )
+    first_seen: dict[str, tuple[str, int, datetime]] = {}
+    if previous:
+        for row in db.scalars(select(ValidationFinding).where(ValidationFinding.run_id == previous.id)).all():
+            first_seen[row.fingerprint] = (row.first_seen_run_id, row.first_seen_generation, row.first_seen_at)
+    now = datetime.utcnow()
+    run = ValidationRun(id=str(uuid.uuid4()), version_id=version_id, generation=generation, status=result["status"], created_at=now)
+    db.add(run)
+    seen: set[str] = set()
+    for f in result["findings"]:
+        fingerprint = validation_finding_fingerprint(f)
+        if fingerprint in seen:
+            continue
+        seen.add(fingerprint)
+        origin_run_id, origin_generation, origin_at = first_seen.get(fingerprint, (run.id, generation, now))
+        db.add(
+            ValidationFinding(
+                run_id=run.id,
+                version_id=version_id,
+                fingerprint=fingerprint,
+                severity=str(f.get("severity") or ""),
+                tier=int(f.get("tier") or 1),
+                rule_code=str(f.get("rule_code") or ""),
+                rule=str(f.get("rule") or ""),
+                message=str(f.get("message") or ""),
+                entity_ids_json=json.dumps(f.get("entity_ids") or []),
+                first_seen_run_id=origin_run_id,
+                first_seen_generation=origin_generation,
+                first_seen_at=origin_at,
+            )
+        )
+    run.finding_count = len(seen)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request recorded this generation first; use its run.
+        db.rollback()
+        run = db.scalar(select(ValidationRun).where(ValidationRun.version_id == version_id, ValidationRun.generation == generation))
+    return run
+
+
+def validation_run_diff(db: Session, from_run: Optional[ValidationRun], to_run: ValidationRun) -> dict:
+    def rows(run: Optional[ValidationRun]) -> dict[str, ValidationFinding]:
+        if run is None:
+            return {}
+        return {r.fingerprint: r for r in db.scalars(select(ValidationFinding).where(ValidationFinding.run_id == run.id)).all()}
+
+    before = rows(from_run)
+    after = rows(to_run)
+    return {
+        "from_run": validation_run_payload(from_run),
+        "to_run": validation_run_payload(to_run),
+        "added": [validation_finding_payload(r) for fp, r in after.items() if fp not in before],
+        "resolved": [validation_finding_payload(r) for fp, r in before.items() if fp not in after],
+        "unchanged_count": len([fp for fp in after if fp in before]),
+    }
+
+
+def current_validation_run(version_id: str, db: Session, user: Optional[User]) -> ValidationRun:
+    result = cached_report_payload("validate", version_id, {}, db, lambda: validate(version_id, db, user))
+    run = record_validation_run(version_id, db, result)
+    if run is None:
+        raise HTTPException(status_code=409, detail="Version has uncommitted changes in this session")
+    return run
 
 
 @app.get("/design/validation-dashboard/{version_id}")
-def validation_dashboard(version_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
-    result = validate(version_id, db, _)
+def validation_dashboard(
+    version_id: str,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+    request: Request = None,
+    response: Response = None,
+    tiers: Optional[str] = None,
+    background_tasks: BackgroundTasks = None,
+    since_run: Optional[str] = None,
+):
+    # With tiers=..., answer from the full cached result when it is ready; otherwise return only the requested
+    # tiers and finish the rest in the background. The ETag is salted with readiness so clients re-fetch once.
+    tier_filter = parse_validation_tiers(tiers)
+    full_ready = tier_filter is not None and report_payload_ready("validate", version_id, {}, db)
+    pending_tiers = []
+    if tier_filter is not None and not full_ready:
+        pending_tiers = [t for t in VALIDATION_TIERS if t not in tier_filter]
+    if pending_tiers:
+        schedule_validation_warmup(background_tasks, version_id, db)
+    not_modified = conditional_design_response(request, response, version_id, db, *(["pending"] if pending_tiers else []))
+    if not_modified:
+        return not_modified
+    if tier_filter is not None and not full_ready:
+        result = cached_report_payload(
+            "validate", version_id, {"tiers": sorted(tier_filter)}, db, lambda: validate(version_id, db, _, tiers)
+        )
+    else:
+        result = cached_report_payload("validate", version_id, {}, db, lambda: validate(version_id, db, _))
     findings = result["findings"]
     by_severity = {"FAIL": 0, "WARN": 0, "PASS": 0}
     by_tier = {1: 0, 2: 0, 3: 0}
@@ -7636,16 +9858,96 @@ def validation_dashboard(version_id: str, db: Session = Depends(get_db), _: User
         tier = int(f.get("tier", 1))
         by_tier[tier] = by_tier.get(tier, 0) + 1
     total = len(findings)
-    active_design_count = len(active_design_rules_with_config(db))
+    active_design_count = len(
+        [r for r, _cfg in active_design_rules_with_config(db) if not pending_tiers or int(r.tier or 1) not in pending_tiers]
+    )
     pass_count = max(0, active_design_count - total)
     by_severity["PASS"] = pass_count
-    return {
+    payload = {
         "status": result["status"],
         "counts_by_severity": by_severity,
         "counts_by_tier": by_tier,
         "findings": findings,
         "period_metadata": result.get("period_metadata", list_period_metadata()),
+        "pending_tiers": pending_tiers,
+        "run_id": None,
     }
+    if pending_tiers:
+        return payload
+    run = record_validation_run(version_id, db, result)
+    payload["run_id"] = run.id if run else None
+    if since_run and run:
+        previous = db.get(ValidationRun, since_run)
+        if previous and previous.version_id == version_id:
+            # Delta mode: the client already holds since_run's findings.
+            diff = validation_run_diff(db, previous, run)
+            payload.pop("findings")
+            payload.update({"since_run": since_run, "added": diff["added"], "resolved": diff["resolved"]})
+    return payload
+
+
+def get_validation_run(version_id: str, run_id: str, db: Session) -> ValidationRun:
+    run = db.get(ValidationRun, run_id)
+    if not run or run.version_id != version_id:
+        raise HTTPException(status_code=404, detail="Validation run not found")
+    return run
+
+
+@app.get("/design/validation-runs/{version_id}")
+def list_validation_runs(
+    version_id: str,
+    limit: int = Query(50, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+):
+    if not db.get(CurriculumVersion, version_id):
+        raise HTTPException(status_code=404, detail="Version not found")
+    runs = db.scalars(
+        select(ValidationRun)
+        .where(ValidationRun.version_id == version_id)
+        .order_by(ValidationRun.generation.desc(), ValidationRun.created_at.desc())
+        .limit(limit)
+    ).all()
+    return {"version_id": version_id, "generation": version_generation(db, version_id), "runs": [validation_run_payload(r) for r in runs]}
+
+
+@app.get("/design/validation-runs/{version_id}/diff")
+def validation_runs_diff(
+    version_id: str,
+    from_run: Optional[str] = None,
+    to_run: Optional[str] = None,
+    since_generation: Optional[int] = None,
+    db: Session = Depends(get_db),
+    _: User = Depends(current_user),
+):
+    if not db.get(CurriculumVersion, version_id):
+        raise HTTPException(status_code=404, detail="Version not found")
+    target = get_validation_run(version_id, to_run, db) if to_run else current_validation_run(version_id, db, _)
+    if from_run:
+        source = get_validation_run(version_id, from_run, db)
+    else:
+        ceiling = since_generation if since_generation is not None else target.generation - 1
+        source = db.scalar(
+            select(ValidationRun)
+            .where(ValidationRun.version_id == version_id, ValidationRun.generation <= ceiling)
+            .order_by(ValidationRun.generation.desc(), ValidationRun.created_at.desc())
+            .limit(1)
+        )
+    return {"version_id": version_id, **validation_run_diff(db, source, target)}
+
+
+@app.get("/design/validation-runs/{version_id}/{run_id}")
+def validation_run_detail(version_id: str, run_id: str, db: Session = Depends(get_db), _: User = Depends(current_user)):
+    run = get_validation_run(version_id, run_id, db)
+    rows = db.scalars(
+        select(ValidationFinding).where(ValidationFinding.run_id == run.id).order_by(ValidationFinding.first_seen_generation, ValidationFinding.rule)
+    ).all()
+    return {**validation_run_payload(run), "findings": [validation_finding_payload(r) for r in rows]}
+
+
+@app.get("/design/report-cache/metrics")
+def report_cache_metrics(_: User = Depends(current_user)):
+    return report_payload_cache.metrics()
 
 
 @app.get("/design/requirements/gap-analysis/{cadet_id}")
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def main(tmp_path_factory):
+    # app.main opens ./cmt.db, so run against a fresh database in a temp directory.
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cmt"))
+    from app import main
+
+    main.startup()
+    yield main
+    os.chdir(cwd)
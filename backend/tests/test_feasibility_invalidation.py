@@ -0,0 +1,53 @@
+from sqlalchemy import delete
+
+
+def add_programs_version(main) -> tuple[str, dict[str, str], list[str]]:
+    # Six majors and three minors, each a root requirement with one leaf linked to its own course.
+    with main.SessionLocal() as db:
+        version = main.CurriculumVersion(name="Feasibility invalidation")
+        db.add(version)
+        db.flush()
+        leaf_by_program: dict[str, str] = {}
+        course_ids: list[str] = []
+        for kind, count in (("MAJOR", 6), ("MINOR", 3)):
+            for i in range(count):
+                program = main.AcademicProgram(version_id=version.id, name=f"{kind.title()} {i}", program_type=kind)
+                course = main.Course(version_id=version.id, course_number=f"FI {kind[:2]}{i}", title=f"{kind.title()} course {i}", credit_hours=3)
+                db.add_all([program, course])
+                db.flush()
+                root = main.Requirement(version_id=version.id, program_id=program.id, name=f"{program.name} requirements")
+                db.add(root)
+                db.flush()
+                leaf = main.Requirement(version_id=version.id, program_id=program.id, name=f"{program.name} core", parent_requirement_id=root.id)
+                db.add(leaf)
+                db.flush()
+                db.add(main.RequirementFulfillment(requirement_id=leaf.id, course_id=course.id))
+                leaf_by_program[program.id] = leaf.id
+                course_ids.append(course.id)
+        db.commit()
+        return version.id, leaf_by_program, course_ids
+
+
+def test_fulfillment_edit_recomputes_only_the_programs_combos(main):
+    version_id, leaf_by_program, course_ids = add_programs_version(main)
+    with main.SessionLocal() as db:
+        first = main.design_feasibility(version_id, db, None, 0)
+        specs = main.plan_feasibility_query(version_id, db)["specs"]
+        assert first["recomputed_count"] == len(specs)
+        assert main.design_feasibility(version_id, db, None, 0)["recomputed_count"] == 0
+
+        _majors, minors = main.feasibility_programs(version_id, db)
+        edited_program_id = minors[0].id
+        db.add(main.RequirementFulfillment(requirement_id=leaf_by_program[edited_program_id], course_id=course_ids[0]))
+        db.commit()
+
+        incremental = main.design_feasibility(version_id, db, None, 0)
+        assert incremental["recomputed_count"] == len([spec for spec in specs if edited_program_id in spec[0]])
+        assert 0 < incremental["recomputed_count"] < len(specs)
+
+        db.execute(delete(main.FeasibilityComboDependency).where(main.FeasibilityComboDependency.version_id == version_id))
+        db.execute(delete(main.FeasibilityComboResult).where(main.FeasibilityComboResult.version_id == version_id))
+        db.commit()
+        cold = main.design_feasibility(version_id, db, None, 0)
+        assert cold["recomputed_count"] == len(specs)
+        assert incremental["rows"] == cold["rows"]
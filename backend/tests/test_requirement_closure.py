@@ -0,0 +1,101 @@
+from sqlalchemy import select, text
+
+
+def closure_rows(conn) -> tuple[set, set]:
+    return (
+        set(conn.execute(text("SELECT ancestor_id, descendant_id, version_id, depth FROM requirement_closure")).all()),
+        set(conn.execute(text("SELECT requirement_id, course_id, source, version_id FROM requirement_effective_courses")).all()),
+    )
+
+
+def rebuilt_closure_rows(main) -> tuple[set, set]:
+    # Rebuild both tables from scratch over every requirement, read them, and roll the rebuild back.
+    with main.engine.connect() as conn:
+        with conn.begin() as transaction:
+            conn.execute(text("DELETE FROM requirement_closure"))
+            conn.execute(text("DELETE FROM requirement_effective_courses"))
+            main.refresh_requirement_closure(conn, {r[0] for r in conn.execute(text("SELECT id FROM requirements")).all()})
+            rows = closure_rows(conn)
+            transaction.rollback()
+    return rows
+
+
+def assert_closure_matches_rebuild(main, db, step: str) -> None:
+    db.commit()
+    actual = closure_rows(db.connection())
+    db.commit()
+    expected = rebuilt_closure_rows(main)
+    assert actual[0] == expected[0], f"requirement_closure differs after {step}"
+    assert actual[1] == expected[1], f"requirement_effective_courses differs after {step}"
+
+
+def test_closure_tables_match_a_full_rebuild_after_edits(main):
+    with main.SessionLocal() as db:
+        version = main.CurriculumVersion(name="Closure maintenance")
+        db.add(version)
+        db.flush()
+        courses = [main.Course(version_id=version.id, course_number=f"CL {100 + i}", title=f"Course {i}") for i in range(8)]
+        db.add_all(courses)
+        db.flush()
+
+        def requirement(name: str, parent=None):
+            r = main.Requirement(version_id=version.id, name=name, parent_requirement_id=parent.id if parent else None)
+            db.add(r)
+            db.flush()
+            return r
+
+        root = requirement("Root")
+        middle = requirement("Middle", root)
+        leaf_a = requirement("Leaf A", middle)
+        leaf_b = requirement("Leaf B", middle)
+        other_root = requirement("Other root")
+        db.add_all(
+            [
+                main.RequirementFulfillment(requirement_id=leaf_a.id, course_id=courses[0].id),
+                main.RequirementFulfillment(requirement_id=leaf_b.id, course_id=courses[1].id),
+                main.RequirementFulfillment(requirement_id=other_root.id, course_id=courses[2].id),
+            ]
+        )
+        basket = main.CourseBasket(version_id=version.id, name="Electives")
+        db.add(basket)
+        db.flush()
+        db.add_all([main.CourseBasketItem(basket_id=basket.id, course_id=courses[3].id), main.CourseBasketItem(basket_id=basket.id, course_id=courses[4].id)])
+        db.add(main.RequirementBasketLink(requirement_id=leaf_b.id, basket_id=basket.id))
+        assert_closure_matches_rebuild(main, db, "create")
+
+        leaf_a.parent_requirement_id = other_root.id
+        assert_closure_matches_rebuild(main, db, "move")
+
+        new_leaf = requirement("New leaf", middle)
+        db.add(main.RequirementFulfillment(requirement_id=new_leaf.id, course_id=courses[5].id))
+        assert_closure_matches_rebuild(main, db, "create with fulfillment")
+
+        added = main.RequirementFulfillment(requirement_id=leaf_b.id, course_id=courses[6].id)
+        db.add(added)
+        assert_closure_matches_rebuild(main, db, "fulfillment add")
+        db.delete(added)
+        assert_closure_matches_rebuild(main, db, "fulfillment delete")
+
+        item = main.CourseBasketItem(basket_id=basket.id, course_id=courses[7].id)
+        db.add(item)
+        assert_closure_matches_rebuild(main, db, "basket item add")
+        db.delete(item)
+        assert_closure_matches_rebuild(main, db, "basket item delete")
+
+        db.add(main.RequirementBasketLink(requirement_id=other_root.id, basket_id=basket.id))
+        assert_closure_matches_rebuild(main, db, "basket link")
+
+        # Restructure: swap which root owns the middle subtree and hang the old root beneath it.
+        middle.parent_requirement_id = other_root.id
+        root.parent_requirement_id = leaf_b.id
+        assert_closure_matches_rebuild(main, db, "restructure")
+
+        for row in db.scalars(select(main.CourseBasketItem).where(main.CourseBasketItem.basket_id == basket.id)).all():
+            db.delete(row)
+        for row in db.scalars(select(main.RequirementBasketLink).where(main.RequirementBasketLink.basket_id == basket.id)).all():
+            db.delete(row)
+        db.delete(basket)
+        assert_closure_matches_rebuild(main, db, "basket delete")
+
+        db.delete(middle)
+        assert_closure_matches_rebuild(main, db, "middle-node delete")
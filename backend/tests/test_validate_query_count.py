@@ -0,0 +1,75 @@
+from sqlalchemy import event
+
+
+def add_version(main, name: str, course_count: int) -> tuple[str, list[str]]:
+    with main.SessionLocal() as db:
+        version = main.CurriculumVersion(name=f"Query count {name}")
+        db.add(version)
+        db.flush()
+        courses = [
+            main.Course(version_id=version.id, course_number=f"QC {100 + i}", title=f"Course {i}", designated_semester=1 + i % 8)
+            for i in range(course_count)
+        ]
+        db.add_all(courses)
+        db.flush()
+        db.add_all(
+            main.PlanItem(version_id=version.id, course_id=c.id, semester_index=main.ACADEMIC_PERIODS[i % len(main.ACADEMIC_PERIODS)], position=i)
+            for i, c in enumerate(courses)
+        )
+        db.commit()
+        return version.id, [c.id for c in courses]
+
+
+def add_sections(main, version_id: str, course_ids: list[str], count: int) -> None:
+    with main.SessionLocal() as db:
+        for i in range(count):
+            room = main.Classroom(building="QC", room_number=str(i), capacity=10)
+            instructor = main.Instructor(name=f"Instructor {version_id[:8]} {i}", max_sections_per_semester=1)
+            db.add_all([room, instructor])
+            db.flush()
+            course_id = course_ids[i % len(course_ids)]
+            if i % 2:
+                db.add(main.InstructorQualification(instructor_id=instructor.id, course_id=course_id))
+            db.add(
+                main.Section(
+                    version_id=version_id,
+                    course_id=course_id,
+                    semester_label="FALL",
+                    max_enrollment=12,
+                    instructor_id=instructor.id,
+                    classroom_id=room.id,
+                )
+            )
+        db.commit()
+
+
+def count_validate_statements(main, version_id: str) -> int:
+    with main.SessionLocal() as db:
+        # Warm the curriculum graph, then drop the per-family findings so every check runs.
+        main.validate(version_id, db, None)
+        main.validation_family_cache.clear()
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, _parameters, _context, _executemany):
+            statements.append(statement)
+
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            main.validate(version_id, db, None)
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+        return len(statements)
+
+
+def test_validate_query_count_is_independent_of_sections_and_plan_items(main):
+    empty_version_id, _ = add_version(main, "empty", 4)
+    small_version_id, small_course_ids = add_version(main, "small", 4)
+    large_version_id, large_course_ids = add_version(main, "large", 60)
+    add_sections(main, small_version_id, small_course_ids, 3)
+    add_sections(main, large_version_id, large_course_ids, 80)
+
+    empty = count_validate_statements(main, empty_version_id)
+    small = count_validate_statements(main, small_version_id)
+    large = count_validate_statements(main, large_version_id)
+
+    assert empty == small == large
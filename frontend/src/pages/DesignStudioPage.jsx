@@ -519,7 +519,8 @@ export function DesignStudioPage() {
   const validationDashboardQ = useQuery({
     queryKey: ["validation-dashboard", selectedVersion?.id],
     enabled: !!selectedVersion?.id,
-    queryFn: () => authed(`/design/validation-dashboard/${selectedVersion.id}`)
+    queryFn: () => authed(`/design/validation-dashboard/${selectedVersion.id}?tiers=1`),
+    refetchInterval: (query) => (query.state.data?.pending_tiers?.length ? 1500 : false)
   });
   const validationRulesQ = useQuery({
     queryKey: ["validation-rules"],